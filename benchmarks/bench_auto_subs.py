@@ -0,0 +1,104 @@
+"""
+Benchmark auto-subs: apply_auto_subs over a stacked batch of squads against
+the same rules applied squad by squad in Python.
+
+Squads are synthetic picks with synthetic live minutes and points, so no
+network is involved. Both versions must agree on every squad's points.
+
+Usage:
+    python benchmarks/bench_auto_subs.py --managers 50 --gameweeks 38
+"""
+import time
+import argparse
+import numpy as np
+from typing import Dict, List
+from fpl_gaffer.utils import PlayerTable
+from fpl_gaffer.utils.auto_subs import FORMATION_MINIMUMS, apply_auto_subs, stack_picks
+from fpl_gaffer.modules.fpl.live import LiveSnapshot
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def squad_points(picks: List[Dict], types: Dict[int, int], snapshot: LiveSnapshot) -> int:
+    """Auto-subs and the captaincy fallback for one squad, one player at a time."""
+    picks = sorted(picks, key=lambda p: p["position"])
+    played = {p["element"]: snapshot.player_minutes(p["element"]) > 0 for p in picks}
+    xi, bench = picks[:11], picks[11:]
+
+    counts = {t: sum(types[p["element"]] == t for p in xi) for t in (1, 2, 3, 4)}
+    for i, pick in enumerate(xi):
+        if played[pick["element"]]:
+            continue
+        out_type = types[pick["element"]]
+        for sub in bench:
+            in_type = types[sub["element"]]
+            if not played[sub["element"]] or (out_type == 1) != (in_type == 1):
+                continue
+            if in_type != out_type and counts[out_type] <= FORMATION_MINIMUMS[out_type]:
+                continue
+            xi[i] = sub
+            bench.remove(sub)
+            counts[out_type] -= 1
+            counts[in_type] += 1
+            break
+
+    captain = next(p for p in picks if p["is_captain"])
+    vice = next(p for p in picks if p["is_vice_captain"])
+    holder = vice if not played[captain["element"]] else captain
+
+    return sum(snapshot.player_points(p["element"]) * (2 if p is holder else 1) for p in xi)
+
+
+def main(n_managers: int, n_gameweeks: int, seed: int):
+    synthetic = SyntheticFPL(seed=seed, current_gw=n_gameweeks)
+    table = PlayerTable(synthetic.bootstrap())
+    types = dict(zip(table.id.tolist(), table.position.tolist()))
+    snapshots = [LiveSnapshot.from_payload(gw, synthetic.live(gw)) for gw in range(1, n_gameweeks + 1)]
+
+    payloads, gw_rows = [], []
+    for gw in range(1, n_gameweeks + 1):
+        for manager_id in range(1, n_managers + 1):
+            payloads.append(synthetic.picks(manager_id, gw))
+            gw_rows.append(gw - 1)
+
+    # Python: one squad at a time
+    started = time.perf_counter()
+    loop_points = [squad_points(p["picks"], types, snapshots[g]) for p, g in zip(payloads, gw_rows)]
+    loop_ms = (time.perf_counter() - started) * 1000
+
+    # NumPy: stack once, then one batch
+    started = time.perf_counter()
+    picks = stack_picks(payloads)
+    stack_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    live_points = np.stack([s.points for s in snapshots])
+    live_minutes = np.stack([s.minutes for s in snapshots])
+    rows = np.array(gw_rows)[:, None]
+    result = apply_auto_subs(
+        element_type=table.position[table.rows(picks["element"].ravel())].reshape(picks["element"].shape),
+        points=live_points[rows, picks["element"]],
+        minutes=live_minutes[rows, picks["element"]],
+        multiplier=picks["multiplier"],
+        is_captain=picks["is_captain"],
+        is_vice_captain=picks["is_vice_captain"],
+        bench_boost=picks["bench_boost"],
+    )
+    batch_ms = (time.perf_counter() - started) * 1000
+
+    assert result.points.tolist() == loop_points
+
+    print(f"{len(payloads)} squads ({n_managers} managers x {n_gameweeks} gameweeks)")
+    print(f"python loop          {loop_ms:8.1f} ms")
+    print(f"stack_picks          {stack_ms:8.1f} ms")
+    print(f"apply_auto_subs      {batch_ms:8.1f} ms")
+    print(f"subs made            {int((result.replaced_by >= 0).sum())}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--managers", type=int, default=50)
+    parser.add_argument("--gameweeks", type=int, default=38)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.managers, args.gameweeks, args.seed)
@@ -0,0 +1,49 @@
+"""
+Benchmark FPLOfficialAPIClient against the local FPL API stand-in.
+
+Usage:
+    python benchmarks/bench_client.py --managers 50 --latency 0.05 --error-rate 0.02
+"""
+import time
+import asyncio
+import argparse
+from httpx import AsyncClient, ASGITransport
+from fpl_gaffer.modules.fpl import FPLOfficialAPIClient
+from fpl_gaffer.integrations.fpl_replay import create_replay_app, SyntheticFPL
+
+
+async def run(managers: int, latency: float, error_rate: float, seed: int):
+    synthetic = SyntheticFPL(seed=seed)
+    app = create_replay_app(synthetic=synthetic, latency=latency, jitter=latency / 2, error_rate=error_rate, seed=seed)
+    session = AsyncClient(transport=ASGITransport(app=app))
+    api = FPLOfficialAPIClient(session=session, base_url="http://fpl-replay/api")
+
+    async def sync_manager(manager_id: int):
+        await api.get_bootstrap_data()
+        await api.get_manager_history(manager_id)
+        for gw in range(1, synthetic.current_gw + 1):
+            await api.get_gameweek_picks(manager_id, gw)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(sync_manager(m) for m in range(1, managers + 1)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    failures = sum(isinstance(r, Exception) for r in results)
+    print(f"managers={managers} latency={latency}s error_rate={error_rate}")
+    print(f"  wall time: {elapsed:.2f}s ({failures} failed syncs)")
+    print(f"  pool:      {api.pool_stats()}")
+    print(f"  cache:     {api.cache.stats()}")
+    print(f"  scheduler: {api.scheduler.stats()}")
+
+    await api.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--managers", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.managers, args.latency, args.error_rate, args.seed))
@@ -0,0 +1,86 @@
+"""
+Benchmark bootstrap-static decoding: stdlib json (the old response.json() path)
+against orjson and the projected decoder used by FPLOfficialAPIClient.
+
+Each decoder runs in a fresh process so peak RSS is not shared between them.
+
+Usage:
+    python benchmarks/bench_decode.py --runs 20
+"""
+import gc
+import json
+import time
+import resource
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+import multiprocessing as mp
+from pathlib import Path
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def _decoders():
+    from fpl_gaffer.modules.fpl import decoding
+
+    decoders = {"json (baseline)": json.loads, "projected": decoding.decode_bootstrap}
+    if decoding.orjson is not None:
+        decoders["orjson"] = decoding.orjson.loads
+    return decoders
+
+
+def _measure(name: str, path: str, runs: int, queue: mp.Queue):
+    decode = _decoders()[name]
+    content = Path(path).read_bytes()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        decode(content)
+        timings.append(time.perf_counter() - started)
+        gc.collect()
+
+    tracemalloc.start()
+    data = decode(content)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+
+    queue.put({
+        "decoder": name,
+        "median_ms": statistics.median(timings) * 1000,
+        "retained_mb": retained / 1e6,
+        "peak_rss_delta_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024,
+    })
+
+
+def main(runs: int, seed: int):
+    payload = json.dumps(SyntheticFPL(seed=seed).bootstrap()).encode()
+
+    with tempfile.NamedTemporaryFile(suffix=".json") as f:
+        f.write(payload)
+        f.flush()
+
+        ctx = mp.get_context("spawn")
+        queue = ctx.Queue()
+        results = []
+        for name in _decoders():
+            process = ctx.Process(target=_measure, args=(name, f.name, runs, queue))
+            process.start()
+            results.append(queue.get())
+            process.join()
+
+    print(f"bootstrap-static payload: {len(payload) / 1e6:.2f} MB, {runs} runs")
+    print(f"{'decoder':<18}{'median ms':>12}{'retained MB':>14}{'peak RSS +MB':>15}")
+    for r in results:
+        print(f"{r['decoder']:<18}{r['median_ms']:>12.2f}{r['retained_mb']:>14.2f}{r['peak_rss_delta_mb']:>15.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.runs, args.seed)
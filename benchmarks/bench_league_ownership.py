@@ -0,0 +1,101 @@
+"""
+Benchmark league ownership over synthetic members' picks: LeagueOwnership's
+arrays against the same figures counted member by member from the picks
+payloads, split into building effective ownership (done once per cached
+league and gameweek) and comparing every member with one squad (done per
+query).
+
+Both must agree. Fetching is left out; the client's rate limiter bounds it.
+
+Usage:
+    python benchmarks/bench_league_ownership.py --members 100 1000 5000
+"""
+import time
+import argparse
+import statistics
+import numpy as np
+from collections import Counter
+from typing import Dict, List
+from fpl_gaffer.utils import PlayerTable, FixtureIndex, DifficultyMatrix, ProjectionMatrix
+from fpl_gaffer.utils.ownership import LeagueOwnership
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def loop_ownership(payloads: List[Dict]) -> Dict[int, float]:
+    """Effective ownership by player id, one pick at a time."""
+    effective = Counter()
+    for payload in payloads:
+        for pick in payload["picks"]:
+            effective[pick["element"]] += pick["multiplier"]
+    return {player_id: total / len(payloads) for player_id, total in effective.items()}
+
+
+def loop_rivals(payloads: List[Dict], user: Dict, values: Dict[int, float]) -> Dict:
+    """Each member's overlap with and projected swing against one squad, one pick at a time."""
+    user_weights = {pick["element"]: pick["multiplier"] for pick in user["picks"]}
+    overlap, swing = [], []
+    for payload in payloads:
+        weights = {pick["element"]: pick["multiplier"] for pick in payload["picks"]}
+        overlap.append(len(user_weights.keys() & weights.keys()))
+        swing.append(sum(
+            (user_weights.get(player_id, 0) - weights.get(player_id, 0)) * values[player_id]
+            for player_id in user_weights.keys() | weights.keys()
+        ))
+
+    return {"overlap": overlap, "swing": swing}
+
+
+def time_ms(fn, runs: int = 3) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main(sizes: List[int], seed: int):
+    synthetic = SyntheticFPL(seed=seed)
+    bootstrap = synthetic.bootstrap()
+    table = PlayerTable(bootstrap)
+    projections = ProjectionMatrix(table, DifficultyMatrix(FixtureIndex(synthetic.fixtures()), bootstrap), bootstrap)
+    values = projections.points[:, projections.next_gameweek]
+    values_by_id = dict(zip(table.id.tolist(), values.tolist()))
+
+    payloads = [synthetic.picks(manager_id, synthetic.current_gw) for manager_id in range(1, max(sizes) + 1)]
+
+    print(f"{len(table)} players")
+    print(f"{'members':>8}{'stage':>8}{'loop ms':>10}{'arrays ms':>11}{'speedup':>9}")
+    for size in sizes:
+        members = payloads[:size]
+        manager_ids = list(range(1, size + 1))
+
+        def build() -> LeagueOwnership:
+            return LeagueOwnership(table, manager_ids, members)
+
+        def compare(ownership: LeagueOwnership) -> Dict:
+            return ownership.rivals(ownership.weights[0], ownership.owned[0], values)
+
+        ownership = build()
+        effective = loop_ownership(members)
+        np.testing.assert_allclose(
+            ownership.effective_ownership[table.rows(effective)], list(effective.values()), rtol=1e-6
+        )
+        rivals, expected = compare(ownership), loop_rivals(members, members[0], values_by_id)
+        assert rivals["overlap"].tolist() == expected["overlap"]
+        np.testing.assert_allclose(rivals["swing"], expected["swing"], rtol=1e-4, atol=1e-3)
+
+        for stage, loop_ms, arrays_ms in (
+            ("build", time_ms(lambda: loop_ownership(members)), time_ms(build)),
+            ("query", time_ms(lambda: loop_rivals(members, members[0], values_by_id)), time_ms(lambda: compare(ownership))),
+        ):
+            print(f"{size:>8}{stage:>8}{loop_ms:>10.1f}{arrays_ms:>11.1f}{loop_ms / arrays_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.members, args.seed)
@@ -0,0 +1,74 @@
+"""
+Benchmark player name lookups: the previous get_player_data scan (every element
+times every query, lowercased substring checks) against PlayerNameIndex, on a
+full-size synthetic bootstrap.
+
+Usage:
+    python benchmarks/bench_name_search.py --runs 200
+"""
+import time
+import argparse
+import statistics
+from typing import Dict, List
+from fpl_gaffer.utils.name_index import PlayerNameIndex
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+QUERIES = ["Salah", "Haaland", "odegaard", "Guimaraes", "Bruno Fernandes", "Mac Allister", "Isak", "Gvardol"]
+
+
+def scan(bootstrap_data: Dict, player_names: List[str]) -> List[Dict]:
+    """The get_player_data loop before the index."""
+    query_players = [n.lower() for n in player_names]
+
+    matched_players = []
+    for player in bootstrap_data.get("elements", []):
+        first_name = player.get("first_name", "").lower()
+        second_name = player.get("second_name", "").lower()
+
+        for q in query_players:
+            if (q in first_name) or (q in second_name):
+                matched_players.append(player)
+                break
+
+    return matched_players
+
+
+def time_ms(fn, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main(runs: int, seed: int):
+    bootstrap_data = SyntheticFPL(seed=seed).bootstrap()
+    elements = bootstrap_data["elements"]
+
+    build_ms = time_ms(lambda: PlayerNameIndex(bootstrap_data), max(1, runs // 20))
+    index = PlayerNameIndex(bootstrap_data)
+
+    scan_ms = time_ms(lambda: scan(bootstrap_data, QUERIES), runs)
+    index_ms = time_ms(lambda: index.search_many(QUERIES), runs)
+
+    print(f"{len(elements)} players, batch of {len(QUERIES)} names, {runs} runs")
+    print(f"{'method':<14}{'median ms':>12}")
+    print(f"{'scan':<14}{scan_ms:>12.3f}")
+    print(f"{'index':<14}{index_ms:>12.3f}")
+    print(f"{'index build':<14}{build_ms:>12.3f}  (once per bootstrap version)")
+
+    print("\nmatches (scan / index):")
+    for query in QUERIES:
+        scanned = len(scan(bootstrap_data, [query]))
+        found = [f"{elements[row]['first_name']} {elements[row]['second_name']}" for row in index.search_many([query])]
+        print(f"  {query!r:<18} {scanned:>3} / {len(found):>3}  {', '.join(found[:3])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.runs, args.seed)
@@ -0,0 +1,99 @@
+"""
+Benchmark expected-points projections: ProjectionMatrix's single vectorized
+pass against the same model computed player by player from the bootstrap
+element dicts.
+
+Both build the full players x gameweeks matrix from a synthetic bootstrap
+and fixtures and must agree.
+
+Usage:
+    python benchmarks/bench_projections.py --players 700 --gameweeks 38
+"""
+import time
+import argparse
+import statistics
+import numpy as np
+from typing import Dict
+from fpl_gaffer.utils import PlayerTable, FixtureIndex, DifficultyMatrix, ProjectionMatrix
+from fpl_gaffer.utils import projections as model
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def loop_projections(bootstrap: Dict, difficulty: DifficultyMatrix) -> np.ndarray:
+    """The projection model one player and one gameweek at a time."""
+    events = bootstrap["events"]
+    played = max(1, sum(1 for event in events if event.get("finished")))
+    next_gw = next((event["id"] for event in events if event.get("is_next")), played + 1)
+    points = np.zeros((len(bootstrap["elements"]), difficulty.n_gameweeks + 1), dtype=np.float32)
+
+    for row, p in enumerate(bootstrap["elements"]):
+        position, minutes = p["element_type"], p.get("minutes") or 0
+        per_90 = 90 / max(minutes, 90)
+        scaled = model.MODEL_WEIGHT * (
+            model.GOAL_POINTS[position] * to_float(p.get("expected_goals")) * per_90
+            + model.ASSIST_POINTS * to_float(p.get("expected_assists")) * per_90
+            + model.CLEAN_SHEET_POINTS[position] * model.CLEAN_SHEET_RATE
+            + model.BONUS_PER_ICT * to_float(p.get("ict_index")) * per_90
+        ) + (1 - model.MODEL_WEIGHT) * max(
+            (to_float(p.get("form")) + to_float(p.get("points_per_game"))) / 2 - model.APPEARANCE_POINTS, 0
+        )
+        minutes_share = min(minutes / (90 * played), 1)
+
+        chance = p.get("chance_of_playing_next_round")
+        chance = 1.0 if chance is None else chance / 100
+        status = p.get("status", "a")
+        if status in ("u", "n", "s"):
+            chance = 0.0
+
+        for gw in range(next_gw, difficulty.n_gameweeks + 1):
+            available = chance
+            if status in ("i", "d", "s"):
+                available = min(chance + model.RECOVERY_PER_GAMEWEEK * (gw - next_gw), 1.0)
+            points[row, gw] = available * minutes_share * (
+                model.APPEARANCE_POINTS * difficulty.counts[p["team"], gw] + scaled * difficulty.ease[p["team"], gw] / 3
+            )
+
+    return points
+
+
+def time_ms(fn, runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main(n_players: int, n_gameweeks: int, seed: int):
+    synthetic = SyntheticFPL(seed=seed, n_players=n_players, n_events=n_gameweeks)
+    bootstrap = synthetic.bootstrap()
+    table = PlayerTable(bootstrap)
+    difficulty = DifficultyMatrix(FixtureIndex(synthetic.fixtures()), bootstrap)
+
+    vectorized = ProjectionMatrix(table, difficulty, bootstrap).points
+    np.testing.assert_allclose(vectorized, loop_projections(bootstrap, difficulty), rtol=1e-5, atol=1e-5)
+
+    loop_ms = time_ms(lambda: loop_projections(bootstrap, difficulty), runs=3)
+    matrix_ms = time_ms(lambda: ProjectionMatrix(table, difficulty, bootstrap))
+
+    print(f"{len(table)} players x {difficulty.n_gameweeks} gameweeks")
+    print(f"python loop          {loop_ms:8.1f} ms")
+    print(f"ProjectionMatrix     {matrix_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=700)
+    parser.add_argument("--gameweeks", type=int, default=38)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.players, args.gameweeks, args.seed)
@@ -0,0 +1,126 @@
+"""
+Benchmark squad representations: the nested dicts extract_squad_info built
+per player against Squad/Pick records sharing one Player per player.
+
+Measures memory retained by many squads held at once, and the time to
+serialize each of them to JSON (with the json module and with orjson).
+
+Usage:
+    python benchmarks/bench_records.py --squads 5000
+"""
+import gc
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+from typing import Dict, List
+from fpl_gaffer.utils import PlayerTable, Pick, Squad, map_players
+from fpl_gaffer.utils import records as records_module
+from fpl_gaffer.utils.records import orjson
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def squad_dict(team_data: Dict, table: PlayerTable) -> Dict:
+    """The squad info dict as extract_squad_info built it before records."""
+    gw_history = team_data["entry_history"]
+    squad_info = {
+        "starting_xi": [], "bench": [], "captain": None, "vice_captain": None,
+        "active_chip": team_data.get("active_chip"),
+        "points": gw_history["points"], "total_points": gw_history["total_points"],
+        "rank": gw_history["overall_rank"], "squad_value": gw_history["value"] / 10,
+        "transfers": gw_history["event_transfers"], "transfers_cost": gw_history["event_transfers_cost"],
+        "money_itb": gw_history["bank"] / 10, "history": {},
+    }
+
+    picks = team_data["picks"]
+    for pick, player_info in zip(picks, map_players((p["element"] for p in picks), table)):
+        player_info.update({"position_in_team": pick["position"], "multiplier": pick["multiplier"]})
+        if pick["is_captain"]:
+            squad_info["captain"] = player_info
+        if pick["is_vice_captain"]:
+            squad_info["vice_captain"] = player_info
+        squad_info["starting_xi" if pick["position"] <= 11 else "bench"].append(player_info)
+
+    return squad_info
+
+
+def squad_record(team_data: Dict, table: PlayerTable) -> Squad:
+    """The same squad as FPLTeamDataManger.build_squad builds it."""
+    gw_history = team_data["entry_history"]
+    picks = team_data["picks"]
+    players = table.players(p["element"] for p in picks)
+
+    return Squad(
+        picks=tuple(
+            Pick(player, p["position"], p["multiplier"], p["is_captain"], p["is_vice_captain"])
+            for p, player in zip(picks, players)
+        ),
+        active_chip=team_data.get("active_chip"),
+        points=gw_history["points"], total_points=gw_history["total_points"],
+        rank=gw_history["overall_rank"], squad_value=gw_history["value"] / 10,
+        transfers=gw_history["event_transfers"], transfers_cost=gw_history["event_transfers_cost"],
+        money_itb=gw_history["bank"] / 10,
+    )
+
+
+def retained_mb(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, retained / 1e6
+
+
+def time_ms(fn, runs: int = 15) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main(n_squads: int, seed: int):
+    synthetic = SyntheticFPL(seed=seed)
+    table = PlayerTable(synthetic.bootstrap())
+    team_datas: List[Dict] = [synthetic.picks(manager_id, 10) for manager_id in range(1, n_squads + 1)]
+
+    # Warm the shared player records so both sides measure squads only
+    table.players(table.id.tolist())
+
+    dicts, dict_mb = retained_mb(lambda: [squad_dict(t, table) for t in team_datas])
+    records, record_mb = retained_mb(lambda: [squad_record(t, table) for t in team_datas])
+    assert records[0].to_dict() == dicts[0]
+
+    # Each squad is encoded on its own, as one API response or prompt would be
+    def records_json() -> List[bytes]:
+        records_module.orjson = None
+        try:
+            return [s.to_json() for s in records]
+        finally:
+            records_module.orjson = orjson
+
+    rows = [
+        ("dict", dict_mb, time_ms(lambda: [json.dumps(d).encode() for d in dicts]), None),
+        ("record", record_mb, time_ms(records_json), None),
+    ]
+    if orjson is not None:
+        rows[0] = rows[0][:3] + (time_ms(lambda: [orjson.dumps(d) for d in dicts]),)
+        rows[1] = rows[1][:3] + (time_ms(lambda: [s.to_json() for s in records]),)
+
+    print(f"{n_squads} squads held in memory")
+    print(f"{'version':<10}{'retained MB':>13}{'json ms':>10}{'orjson ms':>11}")
+    for name, mb, json_ms, orjson_ms in rows:
+        orjson_col = f"{orjson_ms:>11.1f}" if orjson_ms is not None else f"{'n/a':>11}"
+        print(f"{name:<10}{mb:>13.2f}{json_ms:>10.1f}{orjson_col}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--squads", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.squads, args.seed)
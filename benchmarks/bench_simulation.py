@@ -0,0 +1,109 @@
+"""
+Benchmark the gameweek simulator over synthetic squads: sampling every
+player's draws, squad points with auto-subs run once per played pattern
+against auto-subs over every draw, captain rankings, and a league of squads
+serial and on a warm process pool.
+
+Simulated player means are checked against the projections, and the pattern
+and pool runs must match the direct serial ones exactly.
+
+Usage:
+    python benchmarks/bench_simulation.py --draws 100000 --managers 50 --workers 4
+"""
+import time
+import argparse
+import numpy as np
+from typing import Dict
+from fpl_gaffer.utils import PlayerTable, FixtureIndex, DifficultyMatrix, ProjectionMatrix
+from fpl_gaffer.utils.auto_subs import apply_auto_subs
+from fpl_gaffer.utils.simulation import GameweekSimulator, simulate_squads
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def squad_info(picks_payload: Dict) -> Dict:
+    """The `extract_squad_info` fields the simulator reads, from a picks payload."""
+    info = {"starting_xi": [], "bench": [], "captain": None, "vice_captain": None, "active_chip": None}
+    for pick in picks_payload["picks"]:
+        entry = {"id": pick["element"], "position_in_team": pick["position"], "multiplier": pick["multiplier"]}
+        info["starting_xi" if pick["position"] <= 11 else "bench"].append(entry)
+        if pick["is_captain"]:
+            info["captain"] = entry
+        if pick["is_vice_captain"]:
+            info["vice_captain"] = entry
+    return info
+
+
+def direct_points(simulator: GameweekSimulator, info: Dict) -> np.ndarray:
+    """Squad points with the auto-sub rules run over every draw."""
+    squad = simulator.squad_arrays(info, chips=False)
+    sampled = [simulator.player(int(player_id)) for player_id in squad["element"]]
+    points = np.stack([p for p, _ in sampled], axis=1)
+    shape = points.shape
+    return apply_auto_subs(
+        np.broadcast_to(squad["element_type"], shape),
+        points,
+        np.stack([m for _, m in sampled], axis=1),
+        np.broadcast_to(squad["multiplier"], shape),
+        np.broadcast_to(squad["is_captain"], shape),
+        np.broadcast_to(squad["is_vice_captain"], shape),
+    ).points
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(draws: int, n_managers: int, workers: int, seed: int):
+    synthetic = SyntheticFPL(seed=seed)
+    bootstrap = synthetic.bootstrap()
+    table = PlayerTable(bootstrap)
+    projections = ProjectionMatrix(table, DifficultyMatrix(FixtureIndex(synthetic.fixtures()), bootstrap), bootstrap)
+    gameweek = projections.next_gameweek
+    squads = [squad_info(synthetic.picks(manager_id, synthetic.current_gw)) for manager_id in range(1, n_managers + 1)]
+
+    def simulator() -> GameweekSimulator:
+        return GameweekSimulator(table, projections, gameweek, draws=draws, seed=seed)
+
+    # Every player's draws, against their projected points
+    sampler = simulator()
+    means, sample_ms = timed(lambda: np.array([sampler.player(int(player_id))[0].mean() for player_id in table.id]))
+    error = np.abs(means - projections.points[:, gameweek])
+
+    # Squad points once the draws are cached
+    patterned, pattern_ms = timed(lambda: [sampler.squad_points(info, chips=False) for info in squads])
+    direct, direct_ms = timed(lambda: [direct_points(sampler, info) for info in squads])
+    assert all((a == b).all() for a, b in zip(patterned, direct))
+    _, captain_ms = timed(lambda: [sampler.captain_options(info, chips=False) for info in squads])
+
+    # League runs from cold simulators
+    serial, serial_ms = timed(lambda: simulate_squads(simulator(), squads, chips=False))
+    if workers > 1:
+        simulate_squads(simulator(), squads, chips=False, workers=workers)  # warm the pool
+    pooled, pool_ms = timed(lambda: simulate_squads(simulator(), squads, chips=False, workers=workers))
+    assert (pooled == serial).all()
+
+    print(f"{len(table)} players, {n_managers} squads, {draws} draws, gameweek {gameweek}")
+    print(f"player means vs projections: max error {error.max():.3f}, mean error {error.mean():.4f} points")
+    print(f"{'stage':<28}{'total ms':>10}{'per item ms':>13}")
+    for stage, ms, items in (
+        ("sample players", sample_ms, len(table)),
+        ("squads, pattern auto-subs", pattern_ms, n_managers),
+        ("squads, direct auto-subs", direct_ms, n_managers),
+        ("captain options", captain_ms, n_managers),
+        ("league, serial", serial_ms, n_managers),
+        (f"league, {workers} workers", pool_ms, n_managers),
+    ):
+        print(f"{stage:<28}{ms:>10.1f}{ms / items:>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--draws", type=int, default=100_000)
+    parser.add_argument("--managers", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.draws, args.managers, args.workers, args.seed)
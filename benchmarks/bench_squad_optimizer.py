@@ -0,0 +1,109 @@
+"""
+Benchmark the squad optimizer over synthetic bootstraps: solve time, search
+nodes and the objective against a greedy pick of the best players that fit.
+
+Each case is a seed (a different synthetic season), a horizon in gameweeks
+and a budget. Every solved squad is checked against the official rules.
+
+Usage:
+    python benchmarks/bench_squad_optimizer.py --seeds 8 --horizons 1 3 5 8 --budgets 95 100 105
+"""
+import time
+import argparse
+import itertools
+import statistics
+import numpy as np
+from collections import Counter
+from typing import List, Optional
+from fpl_gaffer.utils import PlayerTable, FixtureIndex, DifficultyMatrix, ProjectionMatrix
+from fpl_gaffer.utils.squad_optimizer import MAX_PER_CLUB, SQUAD_QUOTAS, FORMATIONS, optimize_squad
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def greedy_objective(table: PlayerTable, values: np.ndarray, budget: float, bench_weight: float) -> Optional[float]:
+    """Best players first, keeping enough budget for the cheapest fill of the places left."""
+    eligible = np.flatnonzero(table.status == "a")
+    cheapest = {position: np.sort(table.price[eligible[table.position[eligible] == position]]) for position in SQUAD_QUOTAS}
+    left, clubs, squad = dict(SQUAD_QUOTAS), Counter(), []
+
+    for row in eligible[np.argsort(-values[eligible], kind="stable")]:
+        position, team = int(table.position[row]), int(table.team[row])
+        if not left[position] or clubs[team] == MAX_PER_CLUB:
+            continue
+        left[position] -= 1
+        reserve = sum(cheapest[p][:n].sum() for p, n in left.items())
+        if table.price[row] + reserve > budget + 1e-9:
+            left[position] += 1
+            continue
+        budget -= table.price[row]
+        clubs[team] += 1
+        squad.append(row)
+
+    if len(squad) < sum(SQUAD_QUOTAS.values()):
+        return None
+
+    # Best formation for the picked squad, captaining the best starter
+    by_position = {p: sorted((values[r] for r in squad if table.position[r] == p), reverse=True) for p in SQUAD_QUOTAS}
+    best = -np.inf
+    for formation in FORMATIONS:
+        starting = [v for p, n in zip(SQUAD_QUOTAS, (1,) + formation) for v in by_position[p][:n]]
+        bench = [v for p, n in zip(SQUAD_QUOTAS, (1,) + formation) for v in by_position[p][n:]]
+        best = max(best, sum(starting) + max(starting) + bench_weight * sum(bench))
+    return float(best)
+
+
+def check_squad(table: PlayerTable, rows: List[int], budget: float):
+    assert len(set(rows)) == 15
+    assert Counter(table.position[rows].tolist()) == SQUAD_QUOTAS
+    assert max(Counter(table.team[rows].tolist()).values()) <= MAX_PER_CLUB
+    assert table.price[rows].sum() <= budget + 1e-9
+
+
+def main(n_seeds: int, horizons: List[int], budgets: List[float], bench_weight: float):
+    results = []
+    for seed in range(n_seeds):
+        synthetic = SyntheticFPL(seed=seed)
+        bootstrap = synthetic.bootstrap()
+        table = PlayerTable(bootstrap)
+        difficulty = DifficultyMatrix(FixtureIndex(synthetic.fixtures()), bootstrap)
+        projections = ProjectionMatrix(table, difficulty, bootstrap)
+        start = synthetic.current_gw + 1
+
+        for horizon, budget in itertools.product(horizons, budgets):
+            values = projections.totals(start, horizon)
+
+            started = time.perf_counter()
+            solution = optimize_squad(table, values, budget, bench_weight=bench_weight, eligible=table.status == "a")
+            solve_ms = (time.perf_counter() - started) * 1000
+
+            check_squad(table, solution.rows, budget)
+            greedy = greedy_objective(table, values, budget, bench_weight)
+            results.append((seed, horizon, budget, solve_ms, solution, greedy))
+
+    print(f"{len(results)} cases ({n_seeds} seeds x {len(horizons)} horizons x {len(budgets)} budgets), "
+          f"{len(table)} players")
+    print(f"{'horizon':>8}{'budget':>8}{'mean ms':>10}{'max ms':>9}{'max nodes':>11}{'optimal':>9}{'vs greedy':>11}")
+    for horizon, budget in itertools.product(horizons, budgets):
+        cases = [r for r in results if r[1] == horizon and r[2] == budget]
+        timings = [r[3] for r in cases]
+        gains = [r[4].objective / r[5] - 1 for r in cases if r[5]]
+        print(
+            f"{horizon:>8}{budget:>8.1f}{statistics.mean(timings):>10.1f}{max(timings):>9.1f}"
+            f"{max(r[4].nodes for r in cases):>11}{sum(r[4].optimal for r in cases):>5}/{len(cases):<3}"
+            f"{statistics.mean(gains) * 100:>+10.1f}%"
+        )
+
+    timings = sorted(r[3] for r in results)
+    print(f"all cases: mean {statistics.mean(timings):.1f} ms, p50 {statistics.median(timings):.1f} ms, "
+          f"p95 {timings[int(0.95 * (len(timings) - 1))]:.1f} ms, max {timings[-1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, default=8)
+    parser.add_argument("--horizons", type=int, nargs="+", default=[1, 3, 5, 8])
+    parser.add_argument("--budgets", type=float, nargs="+", default=[95.0, 100.0, 105.0])
+    parser.add_argument("--bench-weight", type=float, default=0.1)
+    args = parser.parse_args()
+
+    main(args.seeds, args.horizons, args.budgets, args.bench_weight)
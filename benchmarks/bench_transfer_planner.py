@@ -0,0 +1,88 @@
+"""
+Benchmark the transfer planner over synthetic squads: planning time and
+projected points of the best plan, serial and on a warm process pool,
+against a myopic baseline that makes each gameweek's best single free
+transfer and a wide beam as a quality reference.
+
+Usage:
+    python benchmarks/bench_transfer_planner.py --seeds 4 --managers 3 --horizons 3 5 --workers 4
+"""
+import time
+import argparse
+import statistics
+import numpy as np
+from fpl_gaffer.utils import PlayerTable, FixtureIndex, DifficultyMatrix, ProjectionMatrix
+from fpl_gaffer.utils.transfer_planner import plan_transfers
+from fpl_gaffer.integrations.fpl_replay import SyntheticFPL
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(n_seeds: int, n_managers: int, horizons, workers: int, beam_width: int, reference_width: int):
+    rows = {key: [] for key in ("myopic", "serial", "pool", "reference")}
+    timings = {key: [] for key in rows}
+
+    for seed in range(n_seeds):
+        synthetic = SyntheticFPL(seed=seed)
+        bootstrap = synthetic.bootstrap()
+        table = PlayerTable(bootstrap)
+        difficulty = DifficultyMatrix(FixtureIndex(synthetic.fixtures()), bootstrap)
+        projections = ProjectionMatrix(table, difficulty, bootstrap)
+        prices = np.rint(table.price * 10).astype(np.int64)
+        eligible = table.status == "a"
+        start = synthetic.current_gw + 1
+
+        for horizon in horizons:
+            values = projections.horizon(start, horizon).T
+
+            for manager_id in range(1, n_managers + 1):
+                picks = synthetic.picks(manager_id, synthetic.current_gw)
+                squad = table.rows(p["element"] for p in picks["picks"]).tolist()
+                args = (squad, picks["entry_history"]["bank"], 1, values, table.position, table.team, prices)
+
+                def plan(**kwargs):
+                    return plan_transfers(*args, eligible=eligible, **kwargs)[0].total
+
+                # Myopic: one free transfer a gameweek, chosen for that gameweek only
+                myopic, myopic_ms = timed(lambda: plan(max_transfers=1, beam_width=1, expand_width=1))
+                serial, serial_ms = timed(lambda: plan(beam_width=beam_width))
+                if workers > 1:
+                    plan(beam_width=beam_width, workers=workers)  # warm the pool
+                pooled, pool_ms = timed(lambda: plan(beam_width=beam_width, workers=workers))
+                reference, reference_ms = timed(lambda: plan(beam_width=reference_width, expand_width=4 * reference_width))
+
+                for key, total, ms in (
+                    ("myopic", myopic, myopic_ms), ("serial", serial, serial_ms),
+                    ("pool", pooled, pool_ms), ("reference", reference, reference_ms)
+                ):
+                    rows[key].append((horizon, total, reference))
+                    timings[key].append((horizon, ms))
+
+    print(f"{n_seeds} seeds x {n_managers} squads, beam {beam_width}, {workers} workers, reference beam {reference_width}")
+    print(f"{'planner':<11}{'horizon':>8}{'mean ms':>10}{'max ms':>9}{'points':>9}{'vs reference':>14}")
+    for key in rows:
+        for horizon in horizons:
+            results = [(total, reference) for h, total, reference in rows[key] if h == horizon]
+            ms = [t for h, t in timings[key] if h == horizon]
+            gap = statistics.mean(total - reference for total, reference in results)
+            print(
+                f"{key:<11}{horizon:>8}{statistics.mean(ms):>10.1f}{max(ms):>9.1f}"
+                f"{statistics.mean(total for total, _ in results):>9.1f}{gap:>+14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, default=4)
+    parser.add_argument("--managers", type=int, default=3)
+    parser.add_argument("--horizons", type=int, nargs="+", default=[3, 5])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--beam-width", type=int, default=64)
+    parser.add_argument("--reference-width", type=int, default=512)
+    args = parser.parse_args()
+
+    main(args.seeds, args.managers, args.horizons, args.workers, args.beam_width, args.reference_width)
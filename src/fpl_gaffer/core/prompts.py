@@ -62,15 +62,47 @@ Available tools:
 2. get_user_team_info_tool: args {{manager_id: int, gameweek: int}}
     Get comprehensive information about a user's FPL team including squad, transfers, and finances. Use this when 
     you need information about the user's team, players, or financial situation.
-3. get_players_by_position_tool: args {{position: Literal['GKP', 'DEF', 'MID', 'FWD'], max_price: float}}
-    Get players by position and price range (max price and below). Use this when you need information for player 
-    replacements or transfer suggestions based on position and budget.
+3. get_players_by_position_tool: args {{position: Literal['GKP', 'DEF', 'MID', 'FWD'], max_price: float, 
+    sort_by: Literal['blend', 'projected_points', 'points_per_million', 'form', 'ict_index', 'xgi', 'total_points'], 
+    limit: int}}
+    Get the best available players by position and price range (max price and below), ranked by sort_by (default 
+    blend) and capped at limit (default 6), each with projected_points for the next gameweek. Use this when you 
+    need information for player replacements or transfer suggestions based on position and budget.
 4. get_player_data_tool: args {{player_names: List}}
     Get detailed player data including stats, form, and injuries. Use this when you need information about 
     specific players. The argument should be a list of the player(s) you want to get information for.
 5. get_fixtures_for_range_tool: args {{num_gameweeks: int}}
     Get fixtures from the current gameweek to the next x gameweeks. Use this when you need information about 
     upcoming fixtures or planning for future gameweeks.
+6. get_player_history_tool: args {{player_names: List, last_n_gameweeks: int}}
+    Get gameweek-by-gameweek match history (points, minutes, goals, assists, bonus, xG...) and next fixtures for 
+    specific players. Use this when you need a player's recent form rather than season totals.
+7. get_fixture_difficulty_tool: args {{num_gameweeks: int, decay: float}}
+    Get every team ranked by how easy its fixtures are over the next x gameweeks, with blanks and doubles counted. 
+    Use this when planning transfers, wildcards or chips around fixture runs instead of reading full fixture lists.
+8. get_optimal_squad_tool: args {{manager_id: int, gameweek: int, chip: Literal['wildcard', 'free_hit'], 
+    num_gameweeks: int, budget: float}}
+    Build the best 15-man squad for the user's budget (bank plus squad value unless budget is given) by projected 
+    points over num_gameweeks (default 5 for wildcard, 1 for free_hit), with starting XI, bench and captain. Use 
+    this when the user plays or plans a wildcard or free hit, or asks for the best possible squad.
+9. get_transfer_plan_tool: args {{manager_id: int, gameweek: int, num_gameweeks: int, max_transfers: int}}
+    Plan the user's transfers over the next num_gameweeks (default 3), weighing rolled free transfers against -4 
+    hits, with ranked plans of who to sell and buy each gameweek and their projected points gain. Use this when the 
+    user asks who to transfer in or out, or whether to roll a transfer or take a hit.
+10. simulate_gameweek_tool: args {{manager_id: int, gameweek: int, rival_ids: List[int], seed: int}}
+    Simulate the user's points next gameweek, with percentile outcomes, captain choices ranked by expected points 
+    and risk, and the chance of beating each rival (rival_ids optional). Use this when the user asks about 
+    captaincy, their range of outcomes, or their chances in a head-to-head or mini-league battle.
+11. get_league_rivals_tool: args {{manager_id: int, league_id: int, gameweek: int}}
+    Compare the user's squad with every member of a mini-league: effective ownership (captaincy included), the 
+    user's differentials and threats, low-owned transfer targets, and overlap and projected points swing against 
+    the rivals nearest in rank. Use this when the user asks who to differential against their league or how their 
+    squad compares.
+12. get_effective_points_tool: args {{manager_id: int, gameweek: int, last_n_gameweeks: int, rival_ids: List[int]}}
+    Get the user's points in each of the last last_n_gameweeks (default 5) as actually scored: after auto-subs, the 
+    vice-captain stepping in and transfer hits, with the subs made. Pass rival_ids to compare the same for rivals. 
+    Use this when the user asks why they scored what they did, which subs came on, or how they and their rivals have 
+    done recently.
 
 Determine which tools to call to effectively answer the user's query. Include multiple tools for queries that 
 require more than a single tool to provide enough context to respond to the user. Make sure you understand the full 
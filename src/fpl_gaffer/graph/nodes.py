@@ -2,7 +2,7 @@ import json
 from typing import Dict, Literal
 from fpl_gaffer.graph.state import WorkflowState
 from fpl_gaffer.modules import (
-    FPLOfficialAPIClient, FPLUserProfileManager, FPLDataManager
+    get_fpl_api_client, FPLUserProfileManager, FPLDataManager
 )
 from fpl_gaffer.core.prompts import (
     MESSAGE_ANALYSIS_PROMPT, FPL_GAFFER_SYSTEM_PROMPT,
@@ -24,7 +24,7 @@ async def context_injection_node(state: WorkflowState) -> Dict:
     if state.get("user_id", 0) != settings.FPL_MANAGER_ID or state.get("user_data", None) is None:
         # Get user data
         user_id = settings.FPL_MANAGER_ID
-        api = FPLOfficialAPIClient()
+        api = get_fpl_api_client()
 
         profile_manager = FPLUserProfileManager(api, user_id)
         user_data = await profile_manager.extract_user_data()
@@ -1,12 +1,17 @@
+import json
 from fastapi import APIRouter, Depends, HTTPException, Body, Query, Path
-from typing import Dict
+from fastapi.responses import StreamingResponse
+from typing import Dict, Optional
 from fpl_gaffer.integrations.api.app.middleware.auth import require_auth
 from fpl_gaffer.integrations.api.app.utils.schemas import (
     LinkFPLRequest, SyncFPLRequest, DashboardResponse, LeaguesResponse, LeagueStandingsRequest
 )
-from fpl_gaffer.modules.fpl import FPLOfficialAPIClient
+from fpl_gaffer.modules.fpl import (
+    FPLOfficialAPIClient, FPLLeagueCrawler, LiveGameweekPoller, get_fpl_api_client
+)
 from fpl_gaffer.modules.user import FPLUserProfileManager, FPLTeamDataManger
 from fpl_gaffer.integrations.api.app.services.fpl import fpl_service
+from fpl_gaffer.core.exceptions import FPLAPIError
 from fpl_gaffer.integrations.api.app.utils.logger import logger
 
 
@@ -17,6 +22,7 @@ router = APIRouter(prefix="/api/user", tags=["user"])
 async def link_fpl_team(
     request: LinkFPLRequest,
     current_user: Dict = Depends(require_auth),
+    api: FPLOfficialAPIClient = Depends(get_fpl_api_client),
 ):
     """
     Link user's FPL team to their account.
@@ -29,7 +35,6 @@ async def link_fpl_team(
     user_id = current_user["sub"]
 
     # Get user/team data
-    api = FPLOfficialAPIClient()
     profile_manager = FPLUserProfileManager(api, request.fpl_id)
     user_data = await profile_manager.extract_user_data(mode="api")
 
@@ -53,6 +58,7 @@ async def link_fpl_team(
 async def sync_fpl_data(
     request: SyncFPLRequest,
     current_user: Dict = Depends(require_auth),
+    api: FPLOfficialAPIClient = Depends(get_fpl_api_client),
 ):
     """
     Sync all FPL data for user's team.
@@ -82,30 +88,27 @@ async def sync_fpl_data(
 
     # Get team, gw history, transfer history, and captain picks data
     # TEAM DATA
-    async with FPLOfficialAPIClient() as api:
-        profile_manager = FPLUserProfileManager(api, request.fpl_id)
-        team_data = await profile_manager.extract_user_data(mode="api")
+    profile_manager = FPLUserProfileManager(api, request.fpl_id)
+    team_data = await profile_manager.extract_user_data(mode="api")
+
+    data_manager = FPLTeamDataManger(api, request.fpl_id)
 
     # GAMEWEEK HISTORY
-    async with FPLOfficialAPIClient() as api:
-        data_manager = FPLTeamDataManger(api, request.fpl_id)
-        gameweek_history = await data_manager.get_user_history()
+    gameweek_history = await data_manager.get_user_history()
 
     # TRANSFER HISTORY
-    async with FPLOfficialAPIClient() as api:
-        data_manager = FPLTeamDataManger(api, request.fpl_id)
-        transfer_history = await data_manager.get_transfer_history()
+    transfer_history = await data_manager.get_transfer_history()
 
-    # CAPTAIN PICKS
-    async with FPLOfficialAPIClient() as api:
-        data_manager = FPLTeamDataManger(api, request.fpl_id)
-        captain_picks = await data_manager.get_captain_picks()
+    # CAPTAIN PICKS (only gameweeks not synced yet)
+    synced_gameweeks = await fpl_service.get_synced_captain_gameweeks(fpl_team_id)
+    captain_picks = await data_manager.get_captain_picks(
+        start_gameweek=team_data.get("started_event") or 1,
+        skip_gameweeks=synced_gameweeks,
+    )
 
     # LEAGUES DATA
     # TODO: Get leagues data
-    async with FPLOfficialAPIClient() as api:
-        data_manager = FPLTeamDataManger(api, request.fpl_id)
-        leagues_data = await data_manager.get_user_leagues()
+    leagues_data = await data_manager.get_user_leagues()
 
     # Update team data
     await fpl_service.link_fpl_team(user_id, fpl_id, team_data)
@@ -167,7 +170,8 @@ async def get_classic_league_standings(
     # request: LeagueStandingsRequest,
     league_id: int = Path(...),
     page: int = Query(1, ge=1),
-    current_user: Dict = Depends(require_auth)
+    current_user: Dict = Depends(require_auth),
+    api: FPLOfficialAPIClient = Depends(get_fpl_api_client),
 ):
     """
     Get the standings for a specific league.
@@ -187,9 +191,8 @@ async def get_classic_league_standings(
         raise HTTPException(status_code=404, detail="FPL team not linked. Please link your FPL team first.")
 
     fpl_id = fpl_team["fpl_id"]
-    async with FPLOfficialAPIClient() as api:
-        data_manager = FPLTeamDataManger(api, fpl_id)
-        standings = await data_manager.get_league_standings(league_id, page)
+    data_manager = FPLTeamDataManger(api, fpl_id)
+    standings = await data_manager.get_league_standings(league_id, page)
 
     if not standings:
         raise HTTPException(
@@ -203,6 +206,91 @@ async def get_classic_league_standings(
     }
 
 
+@router.get("/leagues/classic/{league_id}/standings/stream")
+async def stream_classic_league_standings(
+    league_id: int = Path(...),
+    max_pages: Optional[int] = Query(None, ge=1),
+    current_user: Dict = Depends(require_auth),
+    api: FPLOfficialAPIClient = Depends(get_fpl_api_client),
+):
+    """
+    Stream every standings row of a league as NDJSON (one JSON object per line).
+
+    Pages are fetched concurrently, so large leagues load without paging
+    through them one request at a time.
+    """
+    user_id = current_user["sub"]
+
+    # Get user's FPL team
+    fpl_team = await fpl_service.get_user_fpl_team(user_id)
+
+    if not fpl_team:
+        raise HTTPException(status_code=404, detail="FPL team not linked. Please link your FPL team first.")
+
+    # Fetch the first page before streaming so a missing league is still a 404
+    rows = FPLLeagueCrawler(api).stream_standings(league_id, max_pages)
+    try:
+        first_row = await anext(rows, None)
+    except FPLAPIError:
+        raise HTTPException(status_code=404, detail="League not found.")
+
+    async def ndjson_rows():
+        if first_row is None:
+            return
+        yield json.dumps(first_row) + "\n"
+        async for row in rows:
+            yield json.dumps(row) + "\n"
+
+    return StreamingResponse(ndjson_rows(), media_type="application/x-ndjson")
+
+
+@router.get("/live")
+async def get_live_points(
+    current_user: Dict = Depends(require_auth),
+    api: FPLOfficialAPIClient = Depends(get_fpl_api_client),
+):
+    """Get the live points of the user's team in the current gameweek."""
+    user_id = current_user["sub"]
+
+    # Get user's FPL team
+    fpl_team = await fpl_service.get_user_fpl_team(user_id)
+
+    if not fpl_team:
+        raise HTTPException(status_code=404, detail="FPL team not linked. Please link your FPL team first.")
+
+    data_manager = FPLTeamDataManger(api, fpl_team["fpl_id"])
+    live_points = await data_manager.get_live_points()
+
+    return {
+        "status": "success",
+        "live": live_points
+    }
+
+
+@router.get("/live/stream")
+async def stream_live_points(
+    current_user: Dict = Depends(require_auth),
+    api: FPLOfficialAPIClient = Depends(get_fpl_api_client),
+):
+    """
+    Stream live player updates as NDJSON.
+
+    Each line holds the players whose live points or minutes changed in the
+    latest poll: {"gameweek": 5, "players": {"123": {"points": 6, "minutes": 90}}}.
+    """
+    poller = LiveGameweekPoller.for_client(api)
+    queue = poller.subscribe()
+
+    async def ndjson_updates():
+        try:
+            while True:
+                yield json.dumps(await queue.get()) + "\n"
+        finally:
+            poller.unsubscribe(queue)
+
+    return StreamingResponse(ndjson_updates(), media_type="application/x-ndjson")
+
+
 @router.get("/fpl-team")
 async def get_fpl_team(
     current_user: Dict = Depends(require_auth),
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 import datetime as dt
 from datetime import datetime
 from fpl_gaffer.integrations.api.app.services.supabase import supabase_client
@@ -141,7 +141,8 @@ class FPLService:
 
         Args:
             fpl_team_id: FPL team UUID
-            captains_data: List of captain picks from FPL API client
+            captains_data: List of captain picks from FPL API client, for new gameweeks only
+                or for the whole season
 
         Returns:
             True if successful, False otherwise
@@ -157,10 +158,11 @@ class FPLService:
                     "is_vice_captain": pick.get("is_vice_captain", False),
                 })
 
-            # Clear existing and insert new
-            self.client.table("captain_picks").delete().eq("fpl_team_id", fpl_team_id).execute()
+            # Upsert only the given gameweeks; earlier rows are left as they are
             if records:
-                self.client.table("captain_picks").insert(records).execute()
+                self.client.table("captain_picks").upsert(
+                    records, on_conflict="fpl_team_id,gameweek,is_vice_captain"
+                ).execute()
 
             logger.info(f"Synced {len(records)} captain picks for team {fpl_team_id}")
             return True
@@ -169,6 +171,26 @@ class FPLService:
             logger.error(f"Error syncing captain picks: {str(e)}")
             return False
 
+    async def get_synced_captain_gameweeks(self, fpl_team_id: str) -> Set[int]:
+        """
+        Gameweeks that already have a captain pick stored for the team.
+
+        Picks are locked once a gameweek's deadline passes, so a sync only needs
+        to fetch the gameweeks missing from this set.
+        """
+        try:
+            result = self.client.table("captain_picks") \
+                .select("gameweek") \
+                .eq("fpl_team_id", fpl_team_id) \
+                .eq("is_vice_captain", False) \
+                .execute()
+
+            return {row["gameweek"] for row in result.data or []}
+
+        except Exception as e:
+            logger.error(f"Error getting synced captain gameweeks: {str(e)}")
+            return set()
+
     async def get_user_fpl_team(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user's linked FPL team."""
         try:
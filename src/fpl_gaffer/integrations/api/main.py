@@ -1,9 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from typing import Dict
+from fastapi import FastAPI, HTTPException, Depends
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fpl_gaffer.settings import settings
 from contextlib import asynccontextmanager
+from fpl_gaffer.integrations.api.app.middleware.auth import require_auth
 from fpl_gaffer.integrations.api.app.routes.user import router as user_router
+from fpl_gaffer.modules.fpl import get_fpl_api_client, close_fpl_api_client, LiveGameweekPoller
 
 # @asynccontextmanager
 # async def lifespan(app: FastAPI):
@@ -15,10 +18,24 @@ from fpl_gaffer.integrations.api.app.routes.user import router as user_router
 #
 #     yield
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared FPL API client once so every request reuses its connection pool
+    api = get_fpl_api_client()
+
+    live_poller = LiveGameweekPoller.for_client(api)
+    if settings.FPL_LIVE_POLL_ENABLED:
+        live_poller.start()
+
+    yield
+
+    await live_poller.stop()
+    await close_fpl_api_client()
+
 app = FastAPI(
     title=settings.APP_NAME,
     debug=settings.DEBUG,
-    # lifespan=lifespan
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -47,5 +64,15 @@ def home():
         "response": "App is running!"
     }
 
+@app.get("/fpl-client/stats")
+def fpl_client_stats(current_user: Dict = Depends(require_auth)):
+    api = get_fpl_api_client()
+    return {
+        "pool": api.pool_stats(),
+        "cache": api.cache.stats(),
+        "scheduler": api.scheduler.stats(),
+        "store": api.store.stats() if api.store else None
+    }
+
 # Routers
 app.include_router(user_router)
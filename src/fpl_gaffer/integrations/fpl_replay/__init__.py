@@ -0,0 +1,4 @@
+from .server import create_replay_app
+from .synthetic import SyntheticFPL
+
+__all__ = ["create_replay_app", "SyntheticFPL"]
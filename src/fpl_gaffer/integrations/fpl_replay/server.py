@@ -0,0 +1,86 @@
+import json
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from typing import Optional
+from fastapi import FastAPI, Request, Response
+from fpl_gaffer.modules.fpl.recording import fixture_path
+from fpl_gaffer.integrations.fpl_replay.synthetic import SyntheticFPL
+
+
+def create_replay_app(
+    fixtures_dir: Optional[str] = None,
+    synthetic: Optional[SyntheticFPL] = None,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    seed: Optional[int] = None
+) -> FastAPI:
+    """
+    Create a stand-in for the FPL API.
+
+    Recorded fixtures are served first, then synthetic payloads. Each request
+    waits `latency` +/- `jitter` seconds and fails with `error_status` at
+    `error_rate`, so client behaviour can be measured without the network.
+    """
+    app = FastAPI(title="FPL API stand-in")
+    rng = random.Random(seed)
+
+    @app.get("/api/{path:path}")
+    async def replay(path: str, request: Request) -> Response:
+        endpoint = f"/{path}"
+        params = dict(request.query_params)
+
+        if latency or jitter:
+            await asyncio.sleep(max(0.0, latency + rng.uniform(-jitter, jitter)))
+
+        if error_rate and rng.random() < error_rate:
+            headers = {"Retry-After": "0"} if error_status == 429 else None
+            return Response(status_code=error_status, headers=headers)
+
+        if fixtures_dir is not None:
+            recorded = fixture_path(fixtures_dir, endpoint, params)
+            if recorded.exists():
+                return Response(content=recorded.read_bytes(), media_type="application/json")
+
+        if synthetic is not None:
+            payload = synthetic.respond(endpoint, params)
+            if payload is not None:
+                return Response(content=json.dumps(payload), media_type="application/json")
+
+        return Response(status_code=404)
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve recorded or synthetic FPL API responses.")
+    parser.add_argument("--fixtures", help="Directory of recorded responses (FPL_API_RECORD_DIR).")
+    parser.add_argument("--synthetic", action="store_true", help="Fall back to synthetic payloads.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to each response.")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    if args.fixtures and not Path(args.fixtures).is_dir():
+        parser.error(f"fixtures directory not found: {args.fixtures}")
+
+    uvicorn.run(
+        create_replay_app(
+            fixtures_dir=args.fixtures,
+            synthetic=SyntheticFPL(seed=args.seed) if args.synthetic else None,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+        ),
+        port=args.port,
+    )
@@ -0,0 +1,552 @@
+import re
+import json
+import random
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any
+from fpl_gaffer.modules.fpl.recording import fixture_path
+
+TEAM_NAMES = [
+    ("Arsenal", "ARS"), ("Aston Villa", "AVL"), ("Bournemouth", "BOU"), ("Brentford", "BRE"),
+    ("Brighton", "BHA"), ("Burnley", "BUR"), ("Chelsea", "CHE"), ("Crystal Palace", "CRY"),
+    ("Everton", "EVE"), ("Fulham", "FUL"), ("Leeds", "LEE"), ("Liverpool", "LIV"),
+    ("Man City", "MCI"), ("Man Utd", "MUN"), ("Newcastle", "NEW"), ("Nott'm Forest", "NFO"),
+    ("Sunderland", "SUN"), ("Spurs", "TOT"), ("West Ham", "WHU"), ("Wolves", "WOL"),
+]
+
+FIRST_NAMES = [
+    "Martin", "Bruno", "Mohamed", "Erling", "Bukayo", "Cole", "Son", "Kevin", "Virgil", "Trent",
+    "Joško", "Rúben", "João", "Gabriel", "Alexis", "Ollie", "Jarrod", "Rodrigo", "Pedro", "Dominik",
+    "Matheus", "Bernardo", "Nicolás", "Đorđe", "Jørgen", "Mikkel", "Ibrahima", "Yves", "Jean-Philippe",
+]
+
+SECOND_NAMES = [
+    "Ødegaard", "Fernandes", "Salah", "Haaland", "Saka", "Palmer", "Heung-min", "De Bruyne", "van Dijk",
+    "Alexander-Arnold", "Gvardiol", "Dias", "Pedro", "Magalhães", "Mac Allister", "Watkins", "Bowen",
+    "Gomes", "Neto", "Szoboszlai", "Cunha", "Silva", "Jackson", "Petrović", "Strand Larsen", "Damsgaard",
+    "Konaté", "Bissouma", "Mateta", "Guimarães", "Núñez", "Wood", "Mbeumo", "Eze", "Isak",
+]
+
+POSITIONS = [
+    # id, short name, plural, squad_select, share of the player pool
+    (1, "GKP", "Goalkeepers", 2, 0.11),
+    (2, "DEF", "Defenders", 5, 0.33),
+    (3, "MID", "Midfielders", 5, 0.40),
+    (4, "FWD", "Forwards", 3, 0.16),
+]
+
+
+class SyntheticFPL:
+    """
+    Deterministic generator of realistic-size FPL API payloads.
+
+    Defaults mirror a real season: about 700 players, 20 teams and 38 events.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        n_players: int = 700,
+        n_teams: int = 20,
+        n_events: int = 38,
+        current_gw: int = 10,
+        league_size: int = 20000
+    ):
+        self.seed = seed
+        self.n_players = n_players
+        self.n_teams = n_teams
+        self.n_events = n_events
+        self.current_gw = current_gw
+        self.league_size = league_size
+        self.season_start = datetime(2025, 8, 15, 17, 30, tzinfo=timezone.utc)
+
+        self._bootstrap: Optional[Dict] = None
+        self._fixtures: Optional[List[Dict]] = None
+
+    # ----- Static payloads ----- #
+    def bootstrap(self) -> Dict:
+        """Generate the /bootstrap-static/ payload."""
+        if self._bootstrap is None:
+            rng = random.Random(self.seed)
+            teams = self._teams(rng)
+            self._bootstrap = {
+                "events": self._events(rng),
+                "game_settings": {"squad_squadplay": 11, "squad_squadsize": 15, "squad_team_limit": 3},
+                "phases": [{"id": 1, "name": "Overall", "start_event": 1, "stop_event": self.n_events}],
+                "teams": teams,
+                "total_players": 11_000_000,
+                "elements": self._elements(rng, teams),
+                "element_stats": [
+                    {"label": label, "name": name} for label, name in [
+                        ("Minutes played", "minutes"), ("Goals scored", "goals_scored"),
+                        ("Assists", "assists"), ("Clean sheets", "clean_sheets"), ("Bonus", "bonus"),
+                    ]
+                ],
+                "element_types": [
+                    {
+                        "id": pid, "plural_name": plural, "plural_name_short": short,
+                        "singular_name": plural[:-1], "singular_name_short": short,
+                        "squad_select": select, "squad_min_select": None, "squad_max_select": None,
+                        "squad_min_play": 1 if pid in (1, 4) else 3, "squad_max_play": 1 if pid == 1 else 5,
+                        "ui_shirt_specific": pid == 1, "sub_positions_locked": [12] if pid == 1 else [],
+                        "element_count": 0,
+                    }
+                    for pid, short, plural, select, _ in POSITIONS
+                ],
+                "chips": [
+                    {"id": i, "name": name, "number": 1, "start_event": 1, "stop_event": self.n_events}
+                    for i, name in enumerate(["wildcard", "freehit", "bboost", "3xc"], 1)
+                ],
+            }
+        return self._bootstrap
+
+    def fixtures(self) -> List[Dict]:
+        """Generate the /fixtures/ payload: a double round robin over all events."""
+        if self._fixtures is None:
+            rng = random.Random(self.seed + 1)
+            strength = {t["id"]: t["strength"] for t in self.bootstrap()["teams"]}
+            fixtures = []
+
+            for event, pairs in enumerate(self._round_robin(), 1):
+                kickoff = self.season_start + timedelta(days=7 * (event - 1) + 1)
+                finished = event < self.current_gw
+                for team_h, team_a in pairs:
+                    fixtures.append({
+                        "code": 2_500_000 + len(fixtures),
+                        "event": event,
+                        "finished": finished,
+                        "finished_provisional": finished,
+                        "id": len(fixtures) + 1,
+                        "kickoff_time": kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "minutes": 90 if finished else 0,
+                        "provisional_start_time": False,
+                        "started": finished,
+                        "team_a": team_a,
+                        "team_a_score": rng.randint(0, 3) if finished else None,
+                        "team_h": team_h,
+                        "team_h_score": rng.randint(0, 4) if finished else None,
+                        "stats": [],
+                        "team_h_difficulty": strength[team_a],
+                        "team_a_difficulty": strength[team_h],
+                        "pulse_id": 120_000 + len(fixtures),
+                    })
+
+            self._fixtures = fixtures
+        return self._fixtures
+
+    def element_summary(self, element_id: int) -> Dict:
+        """Generate the /element-summary/{id}/ payload: past fixtures and upcoming fixtures."""
+        rng = random.Random(f"{self.seed}-summary-{element_id}")
+        element = next(e for e in self.bootstrap()["elements"] if e["id"] == element_id)
+        team, position = element["team"], element["element_type"]
+
+        history, upcoming = [], []
+        for fixture in self.fixtures():
+            if team not in (fixture["team_h"], fixture["team_a"]):
+                continue
+
+            is_home = fixture["team_h"] == team
+            if not fixture["finished"]:
+                upcoming.append({
+                    "id": fixture["id"],
+                    "code": fixture["code"],
+                    "team_h": fixture["team_h"],
+                    "team_a": fixture["team_a"],
+                    "event": fixture["event"],
+                    "finished": False,
+                    "minutes": 0,
+                    "kickoff_time": fixture["kickoff_time"],
+                    "event_name": f"Gameweek {fixture['event']}",
+                    "is_home": is_home,
+                    "difficulty": fixture["team_h_difficulty" if is_home else "team_a_difficulty"],
+                })
+                continue
+
+            minutes = rng.choice([0, 0, 25, 60, 90, 90, 90])
+            goals = int(rng.random() < (0.02, 0.06, 0.18, 0.35)[position - 1]) if minutes else 0
+            assists = int(rng.random() < 0.12) if minutes else 0
+            clean_sheet = int(minutes >= 60 and rng.random() < 0.3 and position < 4)
+            bonus = rng.choice([0, 0, 0, 1, 2, 3]) if goals or assists else 0
+            history.append({
+                "element": element_id,
+                "fixture": fixture["id"],
+                "opponent_team": fixture["team_a"] if is_home else fixture["team_h"],
+                "total_points": (minutes > 0) + (minutes >= 60) + goals * (6, 6, 5, 4)[position - 1]
+                                + assists * 3 + clean_sheet * (4, 4, 1, 0)[position - 1] + bonus,
+                "was_home": is_home,
+                "kickoff_time": fixture["kickoff_time"],
+                "round": fixture["event"],
+                "minutes": minutes,
+                "goals_scored": goals,
+                "assists": assists,
+                "clean_sheets": clean_sheet,
+                "goals_conceded": rng.randint(0, 3) if minutes else 0,
+                "saves": rng.randint(0, 6) if minutes and position == 1 else 0,
+                "bonus": bonus,
+                "bps": rng.randint(0, 40) if minutes else 0,
+                "expected_goals": f"{rng.uniform(0, 0.6) * minutes / 90:.2f}",
+                "expected_assists": f"{rng.uniform(0, 0.4) * minutes / 90:.2f}",
+                "expected_goal_involvements": "0.00",
+                "expected_goals_conceded": f"{rng.uniform(0, 2) * minutes / 90:.2f}",
+                "value": element["now_cost"],
+                "selected": rng.randint(1_000, 5_000_000),
+            })
+
+        return {"fixtures": upcoming, "history": history, "history_past": []}
+
+    def live(self, gw: int) -> Dict:
+        """Generate the /event/{gw}/live/ payload."""
+        rng = random.Random(f"{self.seed}-live-{gw}")
+        elements = []
+        for element in self.bootstrap()["elements"]:
+            minutes = rng.choice([0, 0, 25, 60, 90, 90, 90]) if gw <= self.current_gw else 0
+            points = (minutes > 0) + (minutes >= 60) + (rng.choice([0, 0, 0, 2, 3, 5, 8]) if minutes else 0)
+            elements.append({
+                "id": element["id"],
+                "stats": {"minutes": minutes, "total_points": points, "bonus": 0, "bps": rng.randint(0, 30)},
+                "explain": [],
+                "modified": False,
+            })
+        return {"elements": elements}
+
+    # ----- Per-manager payloads ----- #
+    def picks(self, manager_id: int, gw: int) -> Dict:
+        """Generate a valid 15-man squad (2/5/5/3, max 3 per club) for a manager and gameweek."""
+        rng = random.Random(f"{self.seed}-picks-{manager_id}-{gw}")
+        elements = self.bootstrap()["elements"]
+        by_position: Dict[int, List[Dict]] = {}
+        for element in elements:
+            by_position.setdefault(element["element_type"], []).append(element)
+
+        squad, per_club = [], {}
+        for pid, _, _, select, _ in POSITIONS:
+            pool = by_position[pid][:]
+            rng.shuffle(pool)
+            chosen = 0
+            for element in pool:
+                if chosen == select:
+                    break
+                if per_club.get(element["team"], 0) < 3:
+                    squad.append(element)
+                    per_club[element["team"]] = per_club.get(element["team"], 0) + 1
+                    chosen += 1
+
+        # Starting XI: 1 GKP, 4 DEF, 4 MID, 2 FWD then the bench (GKP first)
+        gkp, dfs, mids, fwds = (
+            [e for e in squad if e["element_type"] == pid] for pid in (1, 2, 3, 4)
+        )
+        order = [gkp[0]] + dfs[:4] + mids[:4] + fwds[:2] + [gkp[1], mids[4], dfs[4], fwds[2]]
+        captain, vice = rng.sample(range(1, 11), 2)
+
+        return {
+            "active_chip": None,
+            "automatic_subs": [],
+            "entry_history": self._entry_history(manager_id, gw),
+            "picks": [
+                {
+                    "element": element["id"],
+                    "position": position,
+                    "multiplier": (2 if position == captain else 1) if position <= 11 else 0,
+                    "is_captain": position == captain,
+                    "is_vice_captain": position == vice,
+                    "element_type": element["element_type"],
+                }
+                for position, element in enumerate(order, 1)
+            ],
+        }
+
+    def history(self, manager_id: int) -> Dict:
+        """Generate the /entry/{id}/history/ payload."""
+        return {
+            "current": [self._entry_history(manager_id, gw) for gw in range(1, self.current_gw + 1)],
+            "past": [],
+            "chips": [],
+        }
+
+    def league_standings(self, league_id: int, page: int = 1, page_size: int = 50) -> Dict:
+        """Generate one page of classic league standings."""
+        start = (page - 1) * page_size
+        stop = min(self.league_size, start + page_size)
+        results = [
+            {
+                "id": 90_000_000 + rank,
+                "event_total": 30 + (rank * 7) % 60,
+                "player_name": f"Manager {rank}",
+                "rank": rank,
+                "last_rank": rank,
+                "rank_sort": rank,
+                "total": 900 - rank // 40,
+                "entry": 1_000_000 + league_id * 100_000 + rank,
+                "entry_name": f"Team {rank}",
+                "has_played": True,
+            }
+            for rank in range(start + 1, stop + 1)
+        ]
+        return {
+            "new_entries": {"has_next": False, "page": 1, "results": []},
+            "last_updated_data": self.season_start.isoformat(),
+            "league": {"id": league_id, "name": f"League {league_id}", "league_type": "x", "scoring": "c"},
+            "standings": {"has_next": stop < self.league_size, "page": page, "results": results},
+        }
+
+    def respond(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Build the payload for an API endpoint, or None if it is not supported."""
+        params = params or {}
+
+        if endpoint == "/bootstrap-static/":
+            return self.bootstrap()
+
+        if endpoint == "/fixtures/":
+            fixtures = self.fixtures()
+            if "event" in params:
+                return [f for f in fixtures if f["event"] == int(params["event"])]
+            return fixtures
+
+        if match := re.fullmatch(r"/event/(\d+)/live/", endpoint):
+            return self.live(int(match[1]))
+
+        if match := re.fullmatch(r"/element-summary/(\d+)/", endpoint):
+            if 1 <= int(match[1]) <= len(self.bootstrap()["elements"]):
+                return self.element_summary(int(match[1]))
+            return None
+
+        if match := re.fullmatch(r"/entry/(\d+)/event/(\d+)/picks/", endpoint):
+            return self.picks(int(match[1]), int(match[2]))
+
+        if match := re.fullmatch(r"/entry/(\d+)/history/", endpoint):
+            return self.history(int(match[1]))
+
+        if match := re.fullmatch(r"/leagues-classic/(\d+)/standings/", endpoint):
+            return self.league_standings(int(match[1]), int(params.get("page_standings", 1)))
+
+        return None
+
+    def write_fixtures(self, root: str):
+        """Write the static payloads to a replay fixture directory."""
+        for endpoint, payload in [("/bootstrap-static/", self.bootstrap()), ("/fixtures/", self.fixtures())]:
+            path = fixture_path(root, endpoint)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload))
+
+    # ----- Helpers ----- #
+    def _teams(self, rng: random.Random) -> List[Dict]:
+        teams = []
+        for i in range(self.n_teams):
+            name, short = TEAM_NAMES[i % len(TEAM_NAMES)]
+            strength = rng.randint(2, 5)
+            teams.append({
+                "code": 3 + i,
+                "draw": 0, "form": None, "loss": 0, "played": 0, "points": 0, "position": 0, "win": 0,
+                "id": i + 1,
+                "name": name if i < len(TEAM_NAMES) else f"{name} {i}",
+                "short_name": short,
+                "strength": strength,
+                "team_division": None,
+                "unavailable": False,
+                "strength_overall_home": 1000 + strength * 60 + rng.randint(0, 40),
+                "strength_overall_away": 1000 + strength * 60 + rng.randint(0, 40),
+                "strength_attack_home": 1000 + strength * 60 + rng.randint(0, 60),
+                "strength_attack_away": 1000 + strength * 60 + rng.randint(0, 60),
+                "strength_defence_home": 1000 + strength * 60 + rng.randint(0, 60),
+                "strength_defence_away": 1000 + strength * 60 + rng.randint(0, 60),
+                "pulse_id": 1 + i,
+            })
+        return teams
+
+    def _events(self, rng: random.Random) -> List[Dict]:
+        events = []
+        for gw in range(1, self.n_events + 1):
+            deadline = self.season_start + timedelta(days=7 * (gw - 1))
+            finished = gw < self.current_gw
+            events.append({
+                "id": gw,
+                "name": f"Gameweek {gw}",
+                "deadline_time": deadline.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "release_time": None,
+                "average_entry_score": rng.randint(40, 65) if finished else 0,
+                "finished": finished,
+                "data_checked": finished,
+                "highest_scoring_entry": rng.randint(1, 10_000_000) if finished else None,
+                "deadline_time_epoch": int(deadline.timestamp()),
+                "deadline_time_game_offset": 0,
+                "highest_score": rng.randint(110, 160) if finished else None,
+                "is_previous": gw == self.current_gw - 1,
+                "is_current": gw == self.current_gw,
+                "is_next": gw == self.current_gw + 1,
+                "cup_leagues_created": False,
+                "h2h_ko_matches_created": False,
+                "can_enter": gw > self.current_gw,
+                "can_manage": gw > self.current_gw,
+                "released": gw <= self.current_gw + 1,
+                "ranked_count": 10_000_000 if finished else 0,
+                "chip_plays": [{"chip_name": "bboost", "num_played": rng.randint(10_000, 200_000)}],
+                "most_selected": rng.randint(1, self.n_players) if finished else None,
+                "most_transferred_in": rng.randint(1, self.n_players) if finished else None,
+                "top_element": rng.randint(1, self.n_players) if finished else None,
+                "transfers_made": rng.randint(1_000_000, 10_000_000) if finished else 0,
+                "most_captained": rng.randint(1, self.n_players) if finished else None,
+                "most_vice_captained": rng.randint(1, self.n_players) if finished else None,
+            })
+        return events
+
+    def _elements(self, rng: random.Random, teams: List[Dict]) -> List[Dict]:
+        elements = []
+        played = max(1, self.current_gw - 1)
+
+        for pid, _, _, _, share in POSITIONS:
+            for _ in range(round(self.n_players * share)):
+                element_id = len(elements) + 1
+                team = teams[element_id % len(teams)]
+                first_name = rng.choice(FIRST_NAMES)
+                second_name = rng.choice(SECOND_NAMES)
+                quality = rng.random()
+                price = 40 + int(quality ** 2 * (100 if pid > 2 else 30)) // 5 * 5
+                minutes = int(rng.betavariate(2, 1.5) * 90 * played)
+                xg = round(quality * minutes / 90 * (0.05, 0.08, 0.25, 0.5)[pid - 1], 2)
+                xa = round(quality * minutes / 90 * (0.02, 0.08, 0.2, 0.12)[pid - 1], 2)
+                goals = max(0, int(rng.gauss(xg, 1)))
+                assists = max(0, int(rng.gauss(xa, 1)))
+                total_points = int(minutes / 45 + goals * (6, 6, 5, 4)[pid - 1] + assists * 3)
+                status = rng.choices("aidsu", weights=[88, 6, 4, 1, 1])[0]
+                chance = None if status == "a" else rng.choice([0, 25, 50, 75])
+                form = round(rng.uniform(0, 8) * quality, 1)
+                influence = round(rng.uniform(0, 60) * played * quality, 1)
+                creativity = round(rng.uniform(0, 50) * played * quality, 1)
+                threat = round(rng.uniform(0, 50) * played * quality, 1)
+
+                elements.append({
+                    "can_transact": True,
+                    "can_select": status != "u",
+                    "chance_of_playing_next_round": chance,
+                    "chance_of_playing_this_round": chance,
+                    "code": 200_000 + element_id,
+                    "cost_change_event": 0,
+                    "cost_change_event_fall": 0,
+                    "cost_change_start": rng.choice([-2, -1, 0, 0, 1, 2]),
+                    "cost_change_start_fall": 0,
+                    "dreamteam_count": rng.randint(0, 3),
+                    "element_type": pid,
+                    "ep_next": f"{form * 0.9:.1f}",
+                    "ep_this": f"{form:.1f}",
+                    "event_points": rng.randint(0, 12),
+                    "first_name": first_name,
+                    "form": f"{form:.1f}",
+                    "id": element_id,
+                    "in_dreamteam": False,
+                    "news": "" if status == "a" else "Knock - 50% chance of playing",
+                    "news_added": None if status == "a" else self.season_start.isoformat(),
+                    "now_cost": price,
+                    "photo": f"{200_000 + element_id}.jpg",
+                    "points_per_game": f"{total_points / played:.1f}",
+                    "removed": False,
+                    "second_name": second_name,
+                    "selected_by_percent": f"{quality ** 3 * 60:.1f}",
+                    "special": False,
+                    "squad_number": None,
+                    "status": status,
+                    "team": team["id"],
+                    "team_code": team["code"],
+                    "total_points": total_points,
+                    "transfers_in": rng.randint(0, 3_000_000),
+                    "transfers_in_event": rng.randint(0, 300_000),
+                    "transfers_out": rng.randint(0, 3_000_000),
+                    "transfers_out_event": rng.randint(0, 300_000),
+                    "value_form": f"{form / price * 10:.1f}",
+                    "value_season": f"{total_points / price * 10:.1f}",
+                    "web_name": second_name,
+                    "region": rng.randint(1, 240),
+                    "team_join_date": "2024-07-01",
+                    "birth_date": f"{rng.randint(1990, 2006)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+                    "has_temporary_code": False,
+                    "opta_code": f"p{400_000 + element_id}",
+                    "minutes": minutes,
+                    "goals_scored": goals,
+                    "assists": assists,
+                    "clean_sheets": rng.randint(0, played // 2) if pid < 4 else 0,
+                    "goals_conceded": rng.randint(0, played * 2),
+                    "own_goals": 0,
+                    "penalties_saved": 0,
+                    "penalties_missed": 0,
+                    "yellow_cards": rng.randint(0, 4),
+                    "red_cards": 0,
+                    "saves": rng.randint(10, 40) if pid == 1 else 0,
+                    "bonus": rng.randint(0, 10),
+                    "bps": rng.randint(0, 300),
+                    "influence": f"{influence:.1f}",
+                    "creativity": f"{creativity:.1f}",
+                    "threat": f"{threat:.1f}",
+                    "ict_index": f"{(influence + creativity + threat) / 10:.1f}",
+                    "clearances_blocks_interceptions": rng.randint(0, 60),
+                    "recoveries": rng.randint(0, 60),
+                    "tackles": rng.randint(0, 30),
+                    "defensive_contribution": rng.randint(0, 80),
+                    "starts": minutes // 80,
+                    "expected_goals": f"{xg:.2f}",
+                    "expected_assists": f"{xa:.2f}",
+                    "expected_goal_involvements": f"{xg + xa:.2f}",
+                    "expected_goals_conceded": f"{rng.uniform(0, 1.8) * played:.2f}",
+                    "influence_rank": rng.randint(1, self.n_players),
+                    "influence_rank_type": rng.randint(1, 250),
+                    "creativity_rank": rng.randint(1, self.n_players),
+                    "creativity_rank_type": rng.randint(1, 250),
+                    "threat_rank": rng.randint(1, self.n_players),
+                    "threat_rank_type": rng.randint(1, 250),
+                    "ict_index_rank": rng.randint(1, self.n_players),
+                    "ict_index_rank_type": rng.randint(1, 250),
+                    "corners_and_indirect_freekicks_order": None,
+                    "corners_and_indirect_freekicks_text": "",
+                    "direct_freekicks_order": None,
+                    "direct_freekicks_text": "",
+                    "penalties_order": None,
+                    "penalties_text": "",
+                    "expected_goals_per_90": round(xg / max(minutes, 1) * 90, 2),
+                    "saves_per_90": 0,
+                    "expected_assists_per_90": round(xa / max(minutes, 1) * 90, 2),
+                    "expected_goal_involvements_per_90": round((xg + xa) / max(minutes, 1) * 90, 2),
+                    "expected_goals_conceded_per_90": round(rng.uniform(0.5, 2.0), 2),
+                    "goals_conceded_per_90": round(rng.uniform(0.5, 2.0), 2),
+                    "now_cost_rank": rng.randint(1, self.n_players),
+                    "now_cost_rank_type": rng.randint(1, 250),
+                    "form_rank": rng.randint(1, self.n_players),
+                    "form_rank_type": rng.randint(1, 250),
+                    "points_per_game_rank": rng.randint(1, self.n_players),
+                    "points_per_game_rank_type": rng.randint(1, 250),
+                    "selected_rank": rng.randint(1, self.n_players),
+                    "selected_rank_type": rng.randint(1, 250),
+                    "starts_per_90": round(rng.uniform(0, 1.1), 2),
+                    "clean_sheets_per_90": round(rng.uniform(0, 0.5), 2),
+                    "defensive_contribution_per_90": round(rng.uniform(0, 10), 2),
+                })
+        return elements
+
+    def _round_robin(self) -> List[List[tuple]]:
+        """Circle-method schedule: each team plays every other team home and away."""
+        team_ids = list(range(1, self.n_teams + 1))
+        half = []
+        for _ in range(self.n_teams - 1):
+            half.append([
+                (team_ids[i], team_ids[-1 - i]) if len(half) % 2 == 0 else (team_ids[-1 - i], team_ids[i])
+                for i in range(self.n_teams // 2)
+            ])
+            team_ids = [team_ids[0], team_ids[-1]] + team_ids[1:-1]
+
+        rounds = half + [[(away, home) for home, away in r] for r in half]
+        return rounds[:self.n_events]
+
+    def _entry_history(self, manager_id: int, gw: int) -> Dict:
+        rng = random.Random(f"{self.seed}-history-{manager_id}-{gw}")
+        points = rng.randint(25, 95)
+        return {
+            "event": gw,
+            "points": points,
+            "total_points": 55 * gw + points,
+            "rank": rng.randint(1, 10_000_000),
+            "rank_sort": rng.randint(1, 10_000_000),
+            "overall_rank": rng.randint(1, 10_000_000),
+            "percentile_rank": rng.randint(1, 100),
+            "bank": rng.randint(0, 30),
+            "value": 1000 + gw * 2,
+            "event_transfers": rng.randint(0, 2),
+            "event_transfers_cost": rng.choice([0, 0, 0, 4]),
+            "points_on_bench": rng.randint(0, 15),
+        }
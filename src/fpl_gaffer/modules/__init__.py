@@ -1,5 +1,8 @@
 from .fpl.fpl_data import FPLDataManager
-from .fpl.fpl_api import FPLOfficialAPIClient
+from .fpl.league_crawler import FPLLeagueCrawler
+from .fpl.player_history import FPLPlayerHistoryLoader, PlayerHistory
+from .fpl.live import LiveGameweekPoller, LiveSnapshot
+from .fpl.fpl_api import FPLOfficialAPIClient, get_fpl_api_client, close_fpl_api_client
 from .news.news_processor import FPLNewsProcessor
 from .news.news_search import FPLNewsSearchClient
 from .user.user_data import FPLUserProfileManager
@@ -7,7 +10,14 @@ from .user.team_data import FPLTeamDataManger
 
 __all__ = [
     "FPLDataManager",
+    "FPLLeagueCrawler",
+    "FPLPlayerHistoryLoader",
+    "PlayerHistory",
+    "LiveGameweekPoller",
+    "LiveSnapshot",
     "FPLOfficialAPIClient",
+    "get_fpl_api_client",
+    "close_fpl_api_client",
     "FPLNewsSearchClient",
     "FPLNewsProcessor",
     "FPLUserProfileManager",
@@ -1,4 +1,21 @@
-from .fpl_api import FPLOfficialAPIClient
+from .fpl_api import FPLOfficialAPIClient, get_fpl_api_client, close_fpl_api_client
 from .fpl_data import FPLDataManager
+from .league_crawler import FPLLeagueCrawler
+from .player_history import FPLPlayerHistoryLoader, PlayerHistory
+from .live import LiveGameweekPoller, LiveSnapshot
+from .effective_points import FPLEffectivePoints
+from .league_ownership import FPLLeagueOwnership
 
-__all__ = ["FPLOfficialAPIClient", "FPLDataManager"]
+__all__ = [
+    "FPLOfficialAPIClient",
+    "FPLDataManager",
+    "FPLLeagueCrawler",
+    "FPLPlayerHistoryLoader",
+    "PlayerHistory",
+    "LiveGameweekPoller",
+    "LiveSnapshot",
+    "FPLEffectivePoints",
+    "FPLLeagueOwnership",
+    "get_fpl_api_client",
+    "close_fpl_api_client"
+]
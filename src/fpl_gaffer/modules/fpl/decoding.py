@@ -0,0 +1,136 @@
+import json
+from typing import Any, Dict, List, TypedDict
+
+# Optional fast JSON libraries: msgspec decodes straight into the projected shape,
+# orjson is a faster full decoder. Both fall back to the standard library.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ----- Projected bootstrap-static shape ----- #
+# Only the fields read by the mappers, data managers and tools; the payload
+# carries roughly 100 fields per element. Values are left untyped so upstream
+# type changes never break decoding.
+class BootstrapElement(TypedDict, total=False):
+    id: Any
+    code: Any
+    first_name: Any
+    second_name: Any
+    web_name: Any
+    team: Any
+    element_type: Any
+    now_cost: Any
+    cost_change_event: Any
+    status: Any
+    news: Any
+    chance_of_playing_next_round: Any
+    chance_of_playing_this_round: Any
+    form: Any
+    points_per_game: Any
+    total_points: Any
+    event_points: Any
+    ep_next: Any
+    ep_this: Any
+    value_form: Any
+    value_season: Any
+    selected_by_percent: Any
+    transfers_in_event: Any
+    transfers_out_event: Any
+    minutes: Any
+    starts: Any
+    goals_scored: Any
+    assists: Any
+    clean_sheets: Any
+    goals_conceded: Any
+    saves: Any
+    bonus: Any
+    bps: Any
+    yellow_cards: Any
+    red_cards: Any
+    influence: Any
+    creativity: Any
+    threat: Any
+    ict_index: Any
+    expected_goals: Any
+    expected_assists: Any
+    expected_goal_involvements: Any
+    expected_goals_conceded: Any
+
+
+class BootstrapTeam(TypedDict, total=False):
+    id: Any
+    code: Any
+    name: Any
+    short_name: Any
+    strength: Any
+    strength_overall_home: Any
+    strength_overall_away: Any
+    strength_attack_home: Any
+    strength_attack_away: Any
+    strength_defence_home: Any
+    strength_defence_away: Any
+
+
+class BootstrapEvent(TypedDict, total=False):
+    id: Any
+    name: Any
+    deadline_time: Any
+    finished: Any
+    data_checked: Any
+    is_previous: Any
+    is_current: Any
+    is_next: Any
+    average_entry_score: Any
+    highest_score: Any
+    most_selected: Any
+    most_captained: Any
+    top_element: Any
+
+
+class BootstrapElementType(TypedDict, total=False):
+    id: Any
+    singular_name: Any
+    singular_name_short: Any
+    plural_name: Any
+    plural_name_short: Any
+    squad_select: Any
+    squad_min_play: Any
+    squad_max_play: Any
+
+
+class Bootstrap(TypedDict, total=False):
+    events: List[BootstrapEvent]
+    teams: List[BootstrapTeam]
+    elements: List[BootstrapElement]
+    element_types: List[BootstrapElementType]
+    total_players: Any
+
+
+_bootstrap_decoder = msgspec.json.Decoder(Bootstrap) if msgspec is not None else None
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON body with the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def decode_bootstrap(content: bytes) -> Dict:
+    """
+    Decode bootstrap-static keeping only the projected fields.
+
+    With msgspec the unused fields are skipped while parsing. Without it the
+    payload is decoded in full and returned as is: trimming it afterwards
+    would cost a second pass over every element for no speedup.
+    """
+    if _bootstrap_decoder is not None:
+        return _bootstrap_decoder.decode(content)
+    return decode_json(content)
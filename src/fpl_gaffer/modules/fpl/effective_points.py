@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import numpy as np
+from typing import Dict, Iterable
+from fpl_gaffer.settings import settings
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
+from fpl_gaffer.modules.fpl.live import LiveSnapshot
+from fpl_gaffer.utils.auto_subs import apply_auto_subs, stack_picks
+
+logger = logging.getLogger(__name__)
+
+
+class FPLEffectivePoints:
+    """
+    Effective gameweek points (after auto-subs and the captaincy fallback) for
+    many managers and gameweeks at once.
+
+    Picks and live stats are fetched concurrently, then every (manager,
+    gameweek) squad is stacked into one batch for apply_auto_subs, so a whole
+    mini-league season is a single vectorized pass. Live stats are fetched once
+    per gameweek and shared by all managers.
+    """
+
+    def __init__(self, api: FPLOfficialAPIClient):
+        self.api = api
+
+    async def load(self, manager_ids: Iterable[int], gameweeks: Iterable[int]) -> Dict[str, Dict]:
+        """
+        Effective points of every manager in every gameweek.
+
+        Returns {"points": {manager_id: {gw: result}}, "errors": {manager_id: {gw: message}}},
+        where each result has the gameweek, effective points, transfer cost,
+        net points and the auto-subs made.
+        """
+        manager_ids = list(dict.fromkeys(manager_ids))
+        gameweeks = sorted(set(gameweeks))
+
+        table, fixture_index, picks_by_gw, snapshots = await asyncio.gather(
+            self.api.get_player_table(),
+            self.api.get_fixture_index(),
+            asyncio.gather(*(self.api.get_managers_gameweek_picks(manager_ids, gw) for gw in gameweeks)),
+            asyncio.gather(*(self._live_snapshot(gw) for gw in gameweeks)),
+        )
+
+        errors: Dict[int, Dict[int, str]] = {}
+        squads, payloads = [], []
+        for gw_index, (gw, gw_picks) in enumerate(zip(gameweeks, picks_by_gw)):
+            for manager_id, message in gw_picks["errors"].items():
+                errors.setdefault(manager_id, {})[gw] = message
+            for manager_id, payload in gw_picks["picks"].items():
+                squads.append((manager_id, gw_index))
+                payloads.append(payload)
+
+        if errors:
+            logger.warning(f"Missing picks for {len(errors)} managers: {errors}")
+
+        points: Dict[int, Dict[int, Dict]] = {manager_id: {} for manager_id in manager_ids}
+        if not payloads:
+            return {"points": points, "errors": errors}
+
+        picks = stack_picks(payloads)
+        gw_rows = np.array([gw_index for _, gw_index in squads], dtype=np.int32)[:, None]
+
+        # Per-gameweek stats stacked into (gameweeks, max player id + 1) lookups
+        size = max(max(len(s.points) for s in snapshots), int(picks["element"].max()) + 1)
+        live_points = np.zeros((len(gameweeks), size), dtype=np.int16)
+        live_minutes = np.zeros((len(gameweeks), size), dtype=np.int16)
+        for gw_index, snapshot in enumerate(snapshots):
+            live_points[gw_index, :len(snapshot.points)] = snapshot.points
+            live_minutes[gw_index, :len(snapshot.minutes)] = snapshot.minutes
+
+        # Positions and teams from the player table; padded or unknown picks get position 0
+        rows = table.rows(picks["element"].ravel()).reshape(picks["element"].shape)
+        known = rows >= 0
+        element_type = np.where(known, table.position[rows], 0)
+        team = np.where(known, table.team[rows], 0)
+        finished = np.stack([fixture_index.finished_teams(gw) for gw in gameweeks])
+
+        result = apply_auto_subs(
+            element_type=element_type,
+            points=live_points[gw_rows, picks["element"]],
+            minutes=live_minutes[gw_rows, picks["element"]],
+            multiplier=picks["multiplier"],
+            is_captain=picks["is_captain"],
+            is_vice_captain=picks["is_vice_captain"],
+            done=finished[gw_rows, np.minimum(team, finished.shape[1] - 1)],
+            bench_boost=picks["bench_boost"],
+        )
+
+        for row, ((manager_id, gw_index), payload) in enumerate(zip(squads, payloads)):
+            transfers_cost = payload.get("entry_history", {}).get("event_transfers_cost", 0)
+            effective = int(result.points[row])
+            points[manager_id][gameweeks[gw_index]] = {
+                "gameweek": gameweeks[gw_index],
+                "points": effective,
+                "transfers_cost": transfers_cost,
+                "net_points": effective - transfers_cost,
+                "auto_subs": [
+                    {
+                        "element_out": int(picks["element"][row, sub["slot_out"]]),
+                        "element_in": int(picks["element"][row, sub["slot_in"]]),
+                    }
+                    for sub in result.subs(row)
+                ],
+            }
+
+        return {"points": points, "errors": errors}
+
+    async def _live_snapshot(self, gw: int) -> LiveSnapshot:
+        live_data = await self.api.get_live_gameweek(gw, ttl=settings.FPL_LIVE_POLL_INTERVAL)
+        return LiveSnapshot.from_payload(gw, live_data)
@@ -1,21 +1,288 @@
-from httpx import AsyncClient
-from typing import Dict, Optional
+import time
+import asyncio
+import importlib.util
+from collections import OrderedDict
+from httpx import AsyncClient, Limits, Timeout, Response
+from typing import Dict, Optional, Any, Tuple, Callable, Awaitable, Iterable, Hashable
 from fpl_gaffer.settings import settings
 from fpl_gaffer.core.exceptions import FPLAPIError
+from fpl_gaffer.utils.player_table import PlayerTable
+from fpl_gaffer.utils.name_index import PlayerNameIndex
+from fpl_gaffer.utils.fixture_index import FixtureIndex
+from fpl_gaffer.utils.difficulty import DifficultyMatrix
+from fpl_gaffer.utils.projections import ProjectionMatrix
+from fpl_gaffer.modules.fpl.scheduler import RequestScheduler
+from fpl_gaffer.modules.fpl.store import ResponseStore
+from fpl_gaffer.modules.fpl.recording import ResponseRecorder
+from fpl_gaffer.modules.fpl.decoding import decode_json, decode_bootstrap
+
+
+def create_http_session() -> AsyncClient:
+    """Create a pooled HTTP session configured from settings."""
+    # HTTP/2 needs the optional 'h2' package; fall back to HTTP/1.1 keep-alive without it
+    http2 = settings.FPL_API_HTTP2 and importlib.util.find_spec("h2") is not None
+
+    return AsyncClient(
+        http2=http2,
+        timeout=Timeout(settings.FPL_API_TIMEOUT),
+        limits=Limits(
+            max_connections=settings.FPL_API_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.FPL_API_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.FPL_API_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+class CachedResponse:
+    """A parsed response kept with the validators needed to revalidate it."""
+
+    def __init__(self, data: Any, raw: bytes, version: int, etag: Optional[str], last_modified: Optional[str]):
+        self.data = data
+        self.raw = raw
+        self.version = version
+        self.size = len(raw)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.monotonic()
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for a conditional GET against the cached copy."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """TTL cache of parsed responses, versioned per endpoint."""
+
+    def __init__(self, max_remembered: Optional[int] = None):
+        self.entries: Dict[str, CachedResponse] = {}
+        self.versions: Dict[str, int] = {}
+        # Objects built from cached payloads, as (version, object) by name
+        self.derived: Dict[str, Tuple[Hashable, Any]] = {}
+        # Objects built from many requests, as (expiry or None, build task) by name, least recently used first
+        self.remembered: OrderedDict[str, Tuple[Optional[float], asyncio.Future]] = OrderedDict()
+        self.max_remembered = max_remembered or settings.FPL_REMEMBERED_CACHE_SIZE
+
+        # Counters to see how much bandwidth the cache saves
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_downloaded = 0
+        self.bytes_saved = 0
+
+    def version(self, endpoint: str) -> int:
+        """Get the payload version for an endpoint (0 until first fetched)."""
+        return self.versions.get(endpoint, 0)
+
+    def store(self, endpoint: str, response: Response, data: Any) -> CachedResponse:
+        """Store a freshly downloaded payload, bumping the version if it changed."""
+        etag = response.headers.get("ETag")
+        previous = self.entries.get(endpoint)
+
+        # Without an ETag any full download counts as a new payload
+        if previous is None or etag is None or etag != previous.etag:
+            self.versions[endpoint] = self.version(endpoint) + 1
+
+        entry = CachedResponse(
+            data=data,
+            raw=response.content,
+            version=self.version(endpoint),
+            etag=etag,
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self.entries[endpoint] = entry
+        self.bytes_downloaded += entry.size
+        return entry
+
+    def derive(self, name: str, version: Hashable, build: Callable[[], Any]) -> Any:
+        """Get an object built from cached payloads, rebuilding it when `version` changes."""
+        cached = self.derived.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = build()
+        self.derived[name] = (version, value)
+        return value
+
+    async def remember(self, name: str, ttl: Optional[float], build: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get an object built asynchronously (e.g. from many requests), rebuilding
+        it once older than `ttl` seconds or keeping it for good when None.
+        Concurrent callers share one build; a failed build is not kept.
+        Expired objects are dropped on every call and at most `max_remembered`
+        are kept, evicting the least recently used.
+        """
+        self._drop_expired()
+        cached = self.remembered.get(name)
+        if cached is not None:
+            self.remembered.move_to_end(name)
+            return await asyncio.shield(cached[1])
+
+        task = asyncio.ensure_future(build())
+        self.remembered[name] = (None if ttl is None else time.monotonic() + ttl, task)
+        while len(self.remembered) > self.max_remembered:
+            # Callers of an evicted build still await its task
+            self.remembered.popitem(last=False)
+
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self.remembered.get(name, (None, None))[1] is task:
+                del self.remembered[name]
+            raise
+
+    def _drop_expired(self):
+        now = time.monotonic()
+        for name in [name for name, (expiry, _) in self.remembered.items() if expiry is not None and now >= expiry]:
+            del self.remembered[name]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "bytes_downloaded": self.bytes_downloaded,
+            "bytes_saved": self.bytes_saved,
+            "versions": dict(self.versions),
+            "remembered": len(self.remembered),
+        }
 
 
 class FPLOfficialAPIClient:
-    def __init__(self):
-        self.base_url = settings.FPL_API_BASE_URL
-        self.session = AsyncClient()
+    def __init__(
+        self,
+        session: Optional[AsyncClient] = None,
+        shared: bool = False,
+        store: Optional[ResponseStore] = None,
+        base_url: Optional[str] = None,
+        record_dir: Optional[str] = None
+    ):
+        self.base_url = base_url or settings.FPL_API_BASE_URL
+        self.session = session or create_http_session()
+        self.shared = shared
+        self.cache = ResponseCache()
+        self.store = store
+
+        # Recording mode: capture every successful response as a replay fixture
+        self.recorder = ResponseRecorder(record_dir) if record_dir else None
+        self.scheduler = RequestScheduler()
+
+        # Shared in-flight fetches keyed by (endpoint, params)
+        self._pending: Dict[Tuple, asyncio.Task] = {}
+
+        # Request counters for pool sizing
+        self._requests_total = 0
+        self._coalesced_total = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        # Responses by HTTP version ("HTTP/1.1", "HTTP/2"), to see whether HTTP/2 is negotiated
+        self._http_versions: Dict[str, int] = {}
+
+    async def get_bootstrap_data(self, full: bool = False) -> Dict:
+        """
+        Get basic FPL data including gameweeks, teams, players, chips...
+
+        By default only the fields the app reads are decoded (see decoding.Bootstrap);
+        pass full=True to decode every field from the cached raw payload.
+        """
+        endpoint = "/bootstrap-static/"
+        decoder = decode_bootstrap if settings.FPL_API_FAST_DECODE else decode_json
+
+        # Cached and shared between callers, so treat the payload as read-only
+        data = await self._get_cached(endpoint, settings.FPL_BOOTSTRAP_CACHE_TTL, decoder)
+
+        if full and decoder is not decode_json:
+            return self._decode(endpoint, self.cache.entries[endpoint].raw)
+        return data
+
+    @property
+    def bootstrap_version(self) -> int:
+        """Version of the cached bootstrap payload, bumped whenever its content changes."""
+        return self.cache.version("/bootstrap-static/")
+
+    async def get_player_table(self) -> PlayerTable:
+        """Get the columnar player table for the current bootstrap payload, built once per version."""
+        bootstrap_data = await self.get_bootstrap_data()
+        return self.cache.derive("player_table", self.bootstrap_version, lambda: PlayerTable(bootstrap_data))
+
+    async def get_player_name_index(self) -> PlayerNameIndex:
+        """Get the player name search index for the current bootstrap payload, built once per version."""
+        bootstrap_data = await self.get_bootstrap_data()
+        return self.cache.derive("player_name_index", self.bootstrap_version, lambda: PlayerNameIndex(bootstrap_data))
+
+    async def get_fixtures(self, gameweek: Optional[int] = None) -> Dict:
+        """Get fixtures for the season, or for a single gameweek."""
+        if gameweek is None:
+            # Cached and versioned like bootstrap-static, so treat the payload as read-only
+            return await self._get_cached("/fixtures/", settings.FPL_FIXTURES_CACHE_TTL)
+
+        # Fixtures of a finished gameweek never change
+        ttl = None if await self.is_finished_gameweek(gameweek) else settings.FPL_RESPONSE_STORE_TTL
+        return await self._get_stored("/fixtures/", params={"event": gameweek}, ttl=ttl)
+
+    async def get_element_summary(self, player_id: int) -> Dict:
+        """Get a player's fixture-by-fixture history and upcoming fixtures."""
+        return await self._get_stored(f"/element-summary/{player_id}/", ttl=settings.FPL_ELEMENT_SUMMARY_TTL)
+
+    async def get_many_element_summaries(self, player_ids: Iterable[int]) -> Dict[str, Dict]:
+        """
+        Get several players' element summaries concurrently.
+
+        Returns {"summaries": {player_id: summary}, "errors": {player_id: message}} in input order.
+        """
+        summaries, errors = await self._gather_bounded(list(dict.fromkeys(player_ids)), self.get_element_summary)
+        return {"summaries": summaries, "errors": errors}
+
+    async def get_live_gameweek(self, gw: int, ttl: float = 0.0) -> Dict:
+        """
+        Get live player stats for a gameweek.
+
+        Unfinished gameweeks are revalidated once `ttl` seconds old, so polling an
+        unchanged payload costs a 304; finished ones are stored for good.
+        """
+        endpoint = f"/event/{gw}/live/"
+        if await self.is_finished_gameweek(gw):
+            return await self._get_stored(endpoint)
+
+        return await self._get_cached(endpoint, ttl)
+
+    @property
+    def fixtures_version(self) -> int:
+        """Version of the cached season fixtures payload, bumped whenever its content changes."""
+        return self.cache.version("/fixtures/")
 
-    async def get_bootstrap_data(self) -> Dict:
-        """Get basic FPL data including gameweeks, teams, players, chips..."""
-        return await self._get("/bootstrap-static/")
+    async def get_fixture_index(self) -> FixtureIndex:
+        """Get the season fixtures indexed by gameweek and team, built once per fixtures version."""
+        fixtures = await self.get_fixtures()
+        return self.cache.derive("fixture_index", self.fixtures_version, lambda: FixtureIndex(fixtures))
 
-    async def get_fixtures(self) -> Dict:
-        """Get fixtures for the season."""
-        return await self._get("/fixtures/")
+    async def get_difficulty_matrix(self) -> DifficultyMatrix:
+        """Get the team-by-gameweek difficulty matrix, built once per bootstrap and fixtures version."""
+        bootstrap_data = await self.get_bootstrap_data()
+        fixture_index = await self.get_fixture_index()
+        return self.cache.derive(
+            "difficulty_matrix",
+            (self.bootstrap_version, self.fixtures_version),
+            lambda: DifficultyMatrix(fixture_index, bootstrap_data)
+        )
+
+    async def get_projection_matrix(self) -> ProjectionMatrix:
+        """Get every player's expected points by gameweek, built once per bootstrap and fixtures version."""
+        bootstrap_data = await self.get_bootstrap_data()
+        table = await self.get_player_table()
+        difficulty = await self.get_difficulty_matrix()
+        return self.cache.derive(
+            "projection_matrix",
+            (self.bootstrap_version, self.fixtures_version),
+            lambda: ProjectionMatrix(table, difficulty, bootstrap_data)
+        )
 
     async def get_manager_data(self, manager_id: int) -> Dict:
         """Get basic manager data from the FPL API."""
@@ -23,33 +290,254 @@ class FPLOfficialAPIClient:
 
     async def get_gameweek_picks(self, manager_id: int, gw: int) -> Dict:
         """Get the picks for a specific gameweek."""
-        return await self._get(f"/entry/{manager_id}/event/{gw}/picks/")
+        endpoint = f"/entry/{manager_id}/event/{gw}/picks/"
+
+        # Picks are locked once a gameweek is finished, so keep them for good
+        if await self.is_finished_gameweek(gw):
+            return await self._get_stored(endpoint)
+
+        return await self._get(endpoint)
+
+    async def get_many_gameweek_picks(self, manager_id: int, gws: Iterable[int]) -> Dict[str, Dict]:
+        """
+        Get a manager's picks for several gameweeks concurrently.
+
+        Returns {"picks": {gw: picks}, "errors": {gw: message}}, both in gameweek order;
+        a failed gameweek does not fail the others.
+        """
+        picks, errors = await self._gather_bounded(
+            sorted(set(gws)), lambda gw: self.get_gameweek_picks(manager_id, gw)
+        )
+        return {"picks": picks, "errors": errors}
+
+    async def get_managers_gameweek_picks(self, manager_ids: Iterable[int], gw: int) -> Dict[str, Dict]:
+        """
+        Get several managers' picks for one gameweek concurrently.
+
+        Returns {"picks": {manager_id: picks}, "errors": {manager_id: message}} in input order.
+        """
+        picks, errors = await self._gather_bounded(
+            list(dict.fromkeys(manager_ids)), lambda manager_id: self.get_gameweek_picks(manager_id, gw)
+        )
+        return {"picks": picks, "errors": errors}
+
+    async def _gather_bounded(
+        self,
+        keys: Iterable[Hashable],
+        fetch: Callable[[Any], Awaitable[Any]]
+    ) -> Tuple[Dict, Dict]:
+        """Run fetch(key) for every key under a semaphore, returning (results, errors) keyed in order."""
+        semaphore = asyncio.Semaphore(settings.FPL_API_BULK_CONCURRENCY)
+
+        async def run(key):
+            async with semaphore:
+                return await fetch(key)
+
+        keys = list(keys)
+        outcomes = await asyncio.gather(*(run(key) for key in keys), return_exceptions=True)
+
+        results, errors = {}, {}
+        for key, outcome in zip(keys, outcomes):
+            if isinstance(outcome, Exception):
+                errors[key] = str(outcome)
+            else:
+                results[key] = outcome
+
+        return results, errors
 
     async def get_manager_history(self, manager_id: int) -> Dict:
         """Get a manager's history data."""
-        return await self._get(f"/entry/{manager_id}/history/")
+        return await self._get_stored(f"/entry/{manager_id}/history/", ttl=settings.FPL_RESPONSE_STORE_TTL)
 
     async def get_transfer_data(self, manager_id: int):
         """Get a manager's transfer data."""
-        return await self._get(f"/entry/{manager_id}/transfers/")
+        return await self._get_stored(f"/entry/{manager_id}/transfers/", ttl=settings.FPL_RESPONSE_STORE_TTL)
 
     async def get_classic_league_standings(self, league_id: int, page: int = 1):
         """Get the standings for a league."""
         params = {"page_standings": page}
         return await self._get(f"/leagues-classic/{league_id}/standings/", params=params)
 
+    async def is_finished_gameweek(self, gw: int) -> bool:
+        """Whether a gameweek is finished and its data checked, i.e. no longer changes."""
+        bootstrap_data = await self.get_bootstrap_data()
+        event = next((e for e in bootstrap_data.get("events", []) if e.get("id") == gw), None)
+        return bool(event and event.get("finished") and event.get("data_checked"))
+
     async def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Internal GET requests handler."""
+        async def fetch():
+            response = await self._request(endpoint, params=params)
+            return self._decode(endpoint, response.content)
+
+        return await self._single_flight(endpoint, params, fetch)
+
+    async def _get_stored(self, endpoint: str, params: Optional[Dict] = None, ttl: Optional[float] = None) -> Any:
+        """GET through the on-disk response store; a ttl of None stores the response permanently."""
+        if self.store is None:
+            return await self._get(endpoint, params=params)
+
+        key = ResponseStore.make_key(endpoint, params)
+        body = await self.store.get(key)
+        if body is not None:
+            return self._decode(endpoint, body)
+
+        async def fetch():
+            response = await self._request(endpoint, params=params)
+            data = self._decode(endpoint, response.content)
+            await self.store.put(key, response.content, ttl)
+            return data
+
+        return await self._single_flight(endpoint, params, fetch)
+
+    async def _get_cached(self, endpoint: str, ttl: float, decoder: Callable[[bytes], Any] = decode_json) -> Dict:
+        """GET through the response cache, revalidating stale entries with ETag/Last-Modified."""
+        entry = self.cache.entries.get(endpoint)
+
+        if entry is not None and entry.is_fresh(ttl):
+            self.cache.hits += 1
+            return entry.data
+
+        return await self._single_flight(endpoint, None, lambda: self._refresh_cached(endpoint, entry, decoder))
+
+    async def _single_flight(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Coalesce concurrent identical requests onto one upstream fetch.
+
+        Every caller gets the same decoded object (or the same exception), so
+        results must be treated as read-only.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._pending[key] = task
+            task.add_done_callback(
+                lambda done: self._pending.pop(key) if self._pending.get(key) is done else None
+            )
+        else:
+            self._coalesced_total += 1
+
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _refresh_cached(
+        self,
+        endpoint: str,
+        entry: Optional[CachedResponse],
+        decoder: Callable[[bytes], Any]
+    ) -> Any:
+        """Download or revalidate a cached endpoint."""
+        headers = entry.conditional_headers() if entry is not None else None
+        response = await self._request(endpoint, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            # Unchanged upstream, keep the parsed payload and restart its TTL
+            self.cache.revalidations += 1
+            self.cache.bytes_saved += entry.size
+            entry.fetched_at = time.monotonic()
+            return entry.data
+
+        self.cache.misses += 1
+        data = self._decode(endpoint, response.content, decoder)
+        return self.cache.store(endpoint, response, data).data
+
+    async def _request(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ) -> Response:
+        """Send a GET request and return the raw response (2xx or 304)."""
+        self._requests_total += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
         try:
-            response = await self.session.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
+            response = await self.scheduler.run(
+                endpoint,
+                lambda: self.session.get(f"{self.base_url}{endpoint}", params=params, headers=headers)
+            )
+            self._http_versions[response.http_version] = self._http_versions.get(response.http_version, 0) + 1
+            if response.status_code != 304:
+                response.raise_for_status()
+                if self.recorder is not None:
+                    await self.recorder.record(endpoint, params, response.content)
+            return response
         except Exception as e:
             raise FPLAPIError(f"Failed to fetch endpoint '{endpoint}': {e}") from e
+        finally:
+            self._in_flight -= 1
+
+    @staticmethod
+    def _decode(endpoint: str, content: bytes, decoder: Callable[[bytes], Any] = decode_json) -> Any:
+        """Decode a JSON response body."""
+        try:
+            return decoder(content)
+        except Exception as e:
+            raise FPLAPIError(f"Invalid JSON from endpoint '{endpoint}': {e}") from e
+
+    # ----- Pool statistics ----- #
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool usage for sizing the pool limits, from the client's
+        own request counters (requests in flight each hold a connection).
+        """
+        return {
+            "max_connections": settings.FPL_API_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.FPL_API_MAX_KEEPALIVE_CONNECTIONS,
+            "requests_total": self._requests_total,
+            "coalesced_total": self._coalesced_total,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "responses_by_http_version": dict(self._http_versions),
+        }
+
+    @property
+    def is_closed(self) -> bool:
+        return self.session.is_closed
+
+    async def aclose(self):
+        """Close the underlying HTTP session and response store."""
+        await self.session.aclose()
+        if self.store is not None:
+            self.store.close()
 
     # ----- Context manager support ----- #
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.session.aclose()
+        # The shared client outlives any single 'async with' block
+        if not self.shared:
+            await self.aclose()
+
+
+# ----- Process-wide shared client ----- #
+_shared_client: Optional[FPLOfficialAPIClient] = None
+
+
+def get_fpl_api_client() -> FPLOfficialAPIClient:
+    """Get the process-wide pooled FPL API client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        store = ResponseStore(settings.FPL_RESPONSE_STORE_PATH) if settings.FPL_RESPONSE_STORE_ENABLED else None
+        _shared_client = FPLOfficialAPIClient(
+            shared=True,
+            store=store,
+            record_dir=settings.FPL_API_RECORD_DIR
+        )
+    return _shared_client
+
+
+async def close_fpl_api_client():
+    """Close the process-wide FPL API client, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -1,7 +1,10 @@
-import random
+import time
+import asyncio
 from typing import List, Tuple, Dict, Literal
 from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
-from fpl_gaffer.utils import build_mappings
+from fpl_gaffer.modules.fpl.player_history import FPLPlayerHistoryLoader
+from fpl_gaffer.utils.screener import ScreenMetric, screen_players
+from fpl_gaffer.utils.squad_optimizer import optimize_squad
 
 
 class FPLDataManager:
@@ -15,30 +18,32 @@ class FPLDataManager:
         if bootstrap_data is None or next_gw is None:
             return {}
 
-        # Get fixtures for the current gameweek
-        fixtures = await self.api.get_fixtures()
+        # Fixtures indexed by gameweek, built once per fixtures version
+        fixture_index = await self.api.get_fixture_index()
 
-        if not fixtures:
+        if not fixture_index.fixtures:
             return {}
 
-        # Filter fixtures for the next gameweek and convert using team mappings
-        next_gw_fixtures = []
-        if next_gw:
-            for fixture in fixtures:
-                if fixture.get("event") == next_gw.get("id"):
-                    next_gw_fixtures.append({
-                        "id": fixture.get("id"),
-                        "home_team": teams.get(fixture.get("team_h"), "Unknown"),
-                        "away_team": teams.get(fixture.get("team_a"), "Unknown"),
-                        "home_team_difficulty": fixture.get("team_h_difficulty", 0),
-                        "away_team_difficulty": fixture.get("team_a_difficulty", 0),
-                        "kickoff_time": fixture.get("kickoff_time"),
-                    })
+        # Get fixtures for the next gameweek and convert using team mappings
+        gw = next_gw.get("id")
+        next_gw_fixtures = [
+            {
+                "id": fixture.get("id"),
+                "home_team": teams.get(fixture.get("team_h"), "Unknown"),
+                "away_team": teams.get(fixture.get("team_a"), "Unknown"),
+                "home_team_difficulty": fixture.get("team_h_difficulty", 0),
+                "away_team_difficulty": fixture.get("team_a_difficulty", 0),
+                "kickoff_time": fixture.get("kickoff_time"),
+            }
+            for fixture in fixture_index.gameweek(gw)
+        ]
 
         return {
-            "gameweek": next_gw.get("id") if next_gw else None,
-            "deadline": next_gw.get("deadline_time") if next_gw else None,
-            "fixtures": next_gw_fixtures if include_fixtures else None
+            "gameweek": gw,
+            "deadline": next_gw.get("deadline_time"),
+            "fixtures": next_gw_fixtures if include_fixtures else None,
+            "blank_teams": [teams.get(t, "Unknown") for t in fixture_index.blank_teams(gw)],
+            "double_teams": [teams.get(t, "Unknown") for t in fixture_index.double_teams(gw)]
         }
 
     async def get_fixtures_for_range(self, num_gameweeks: int = 1) -> Dict:
@@ -48,31 +53,106 @@ class FPLDataManager:
         if bootstrap_data is None or next_gw is None:
             return {}
 
-        # Get fixtures for the next x gameweeks
-        all_fixtures = await self.api.get_fixtures()
+        # Fixtures indexed by gameweek, built once per fixtures version
+        fixture_index = await self.api.get_fixture_index()
 
-        if not all_fixtures:
+        if not fixture_index.fixtures:
             return {}
 
         # Get gameweek range
         start_gw = next_gw.get("id")
-        target_gws = set(range(start_gw, start_gw + num_gameweeks))
-
-        upcoming_fixtures = []
-        for fixture in all_fixtures:
-            if fixture.get("event") in target_gws:
-                upcoming_fixtures.append({
-                    "id": fixture.get("id"),
-                    "gameweek": fixture.get("event"),
-                    "home_team": teams.get(fixture.get("team_h"), "Unknown"),
-                    "away_team": teams.get(fixture.get("team_a"), "Unknown"),
-                    "kickoff_time": fixture.get("kickoff_time"),
-                })
+        end_gw = start_gw + num_gameweeks - 1
+
+        upcoming_fixtures = [
+            {
+                "id": fixture.get("id"),
+                "gameweek": fixture.get("event"),
+                "home_team": teams.get(fixture.get("team_h"), "Unknown"),
+                "away_team": teams.get(fixture.get("team_a"), "Unknown"),
+                "kickoff_time": fixture.get("kickoff_time"),
+            }
+            for fixture in fixture_index.gameweek_range(start_gw, end_gw)
+        ]
+
+        # Only list gameweeks that actually have blanks or doubles
+        blank_gameweeks = {
+            gw: [teams.get(t, "Unknown") for t in blanks]
+            for gw in range(start_gw, end_gw + 1) if (blanks := fixture_index.blank_teams(gw))
+        }
+        double_gameweeks = {
+            gw: [teams.get(t, "Unknown") for t in doubles]
+            for gw in range(start_gw, end_gw + 1) if (doubles := fixture_index.double_teams(gw))
+        }
+
+        return {
+            "from_gameweek": start_gw,
+            "to_gameweek": end_gw,
+            "fixtures": upcoming_fixtures,
+            "blank_gameweeks": blank_gameweeks,
+            "double_gameweeks": double_gameweeks
+        }
+
+    async def get_fixture_difficulty(self, num_gameweeks: int = 5, decay: float = 1.0) -> Dict:
+        """Rank every team by how easy its fixtures are over the next x gameweeks."""
+        bootstrap_data, teams, next_gw = await self._fetch_bootstrap_and_next_gw()
+
+        if bootstrap_data is None or next_gw is None:
+            return {}
+
+        # Team-by-gameweek matrix, built once per bootstrap and fixtures version
+        difficulty = await self.api.get_difficulty_matrix()
+        start_gw = next_gw.get("id")
 
         return {
             "from_gameweek": start_gw,
-            "to_gameweek": start_gw + num_gameweeks - 1,
-            "fixtures": upcoming_fixtures
+            "to_gameweek": min(difficulty.n_gameweeks, start_gw + num_gameweeks - 1),
+            "teams": difficulty.ranked_table(start_gw, num_gameweeks, decay)
+        }
+
+    async def optimize_squad(self, budget: float, num_gameweeks: int = 1, bench_weight: float = 0.1) -> Dict:
+        """Build the best 15-man squad for a budget over the next x gameweeks (wildcard/free hit)."""
+        bootstrap_data, teams, next_gw = await self._fetch_bootstrap_and_next_gw()
+
+        if bootstrap_data is None or next_gw is None:
+            return {}
+
+        # Player lookups and expected points by gameweek, built once per payload version
+        table, projections = await asyncio.gather(self.api.get_player_table(), self.api.get_projection_matrix())
+        start_gw = next_gw.get("id")
+        values = projections.totals(start_gw, num_gameweeks)
+
+        # Exact solve; CPU-bound, so kept off the event loop
+        started = time.perf_counter()
+        solution = await asyncio.to_thread(
+            optimize_squad, table, values, budget, bench_weight=bench_weight, eligible=table.status == "a"
+        )
+        solve_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if solution is None:
+            return {}
+
+        def players(rows: List[int]) -> List[Dict]:
+            records = table.records(table.id[rows].tolist())
+            for record, row in zip(records, rows):
+                record["projected_points"] = round(float(values[row]), 2)
+            return records
+
+        starting_xi, bench = players(solution.starters), players(solution.bench)
+        by_id = {player["id"]: player for player in starting_xi}
+
+        return {
+            "from_gameweek": start_gw,
+            "to_gameweek": min(projections.n_gameweeks, start_gw + num_gameweeks - 1),
+            "budget": budget,
+            "cost": solution.cost,
+            "formation": solution.formation,
+            "projected_points": solution.objective,
+            "starting_xi": starting_xi,
+            "bench": bench,
+            "captain": by_id[int(table.id[solution.captain])],
+            "vice_captain": by_id[int(table.id[solution.vice_captain])],
+            "optimal": solution.optimal,
+            "solve_ms": solve_ms,
         }
 
     # TODO: Get player stats (form, fixtures, injuries, etc.)
@@ -80,35 +160,44 @@ class FPLDataManager:
     async def get_players_by_position(
         self,
         position: Literal["GKP", "DEF", "MID", "FWD"],
-        max_price: float
+        max_price: float,
+        sort_by: ScreenMetric = "blend",
+        limit: int = 6,
+        available_only: bool = True,
+        min_minutes: int = 0
     ) -> List[Dict]:
-        """Get players by position and max price."""
+        """Get the best players by position and max price, ranked by a metric."""
         # Get bootstrap data
         bootstrap_data = await self.api.get_bootstrap_data()
 
         if bootstrap_data is None:
             return []
 
-        # Build mappings
-        players, teams, positions = build_mappings(bootstrap_data)
+        # Player lookups and expected points by gameweek, built once per payload version
+        table, projections = await asyncio.gather(self.api.get_player_table(), self.api.get_projection_matrix())
+        next_gw_points = projections.totals(projections.next_gameweek, 1)
 
         # Find position ID from position short name
-        position_id = next((
-            pid for pid, pname in positions.items() if pname.lower() == position.lower()
-        ), None)
+        position_id = table.position_id(position)
 
         if position_id is None:
             return []
 
-        matched_players = []
-        for player in bootstrap_data.get("elements", []):
-            if (player.get("element_type") == position_id and
-                    (player.get("now_cost", 0) / 10) <= max_price):
-                matched_players.append(player)
-
-        # TODO: Sort matched players by stat (points, etc), and return top x players.
-
-        return random.sample(matched_players, 6)
+        # Top players by the chosen metric; unavailable players ("u") are never suggested
+        rows = screen_players(
+            table,
+            position_id=position_id,
+            max_price=max_price,
+            statuses=("a",) if available_only else ("a", "d", "i", "s", "n"),
+            min_minutes=min_minutes,
+            sort_by=sort_by,
+            limit=limit,
+            projections=next_gw_points,
+        )
+
+        # Table rows follow the bootstrap elements order
+        elements = bootstrap_data.get("elements", [])
+        return [{**elements[row], "projected_points": round(float(next_gw_points[row]), 2)} for row in rows]
 
     async def get_player_data(self, player_names: List[str]) -> List[Dict]:
         """Get data for specific player(s) by name."""
@@ -118,23 +207,33 @@ class FPLDataManager:
         if bootstrap_data is None:
             return []
 
-        # Get all players from bootstrap data
+        # Accent-folded name index, built once per bootstrap version
+        name_index = await self.api.get_player_name_index()
+
+        # Best ranked players for each name; index rows follow the bootstrap elements order
         all_players = bootstrap_data.get("elements", [])
-        query_players = [n.lower() for n in player_names]
+        return [all_players[row] for row in name_index.search_many(player_names)]
 
-        matched_players = []
-        for player in all_players:
-            # Get player names
-            first_name = player.get("first_name", "").lower()
-            second_name = player.get("second_name", "").lower()
+    async def get_player_history(self, player_names: List[str], last_n_gameweeks: int = 5) -> List[Dict]:
+        """Get recent gameweek-by-gameweek history and next fixtures for specific player(s)."""
+        players = await self.get_player_data(player_names)
+
+        if not players:
+            return []
 
-            for q in query_players:
-                # Match if the query appears in any of the name fields
-                if (q in first_name) or (q in second_name):
-                    matched_players.append(player)
-                    break
+        # Loaded history is kept in memory, so repeat queries need no requests
+        loader = FPLPlayerHistoryLoader.for_client(self.api)
+        history = await loader.load(player["id"] for player in players)
 
-        return matched_players
+        return [
+            {
+                "id": player["id"],
+                "name": f"{player.get('first_name', '')} {player.get('second_name', '')}".strip(),
+                "history": history.recent(player["id"], last_n_gameweeks),
+                "next_fixtures": history.next_fixtures(player["id"]),
+            }
+            for player in players
+        ]
 
     async def _fetch_bootstrap_and_next_gw(self) -> Tuple[Dict, Dict, Dict]:
         """Internal helper to fetch bootstrap data and next gameweek info."""
@@ -144,8 +243,8 @@ class FPLDataManager:
         if bootstrap_data is None:
             return {}, {}, {}
 
-        # Build team mappings using fpl_mapper
-        _, teams, _ = build_mappings(bootstrap_data)
+        # Team names from the shared player table
+        teams = (await self.api.get_player_table()).teams
 
         # Get next gameweek from bootstrap data
         next_gw = next((
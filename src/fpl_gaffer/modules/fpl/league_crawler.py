@@ -0,0 +1,66 @@
+import asyncio
+from typing import Dict, List, Optional, AsyncIterator
+from fpl_gaffer.settings import settings
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
+
+
+class FPLLeagueCrawler:
+    """Crawl every page of a classic league's standings concurrently."""
+
+    def __init__(self, api: FPLOfficialAPIClient, window: Optional[int] = None):
+        self.api = api
+        # Pages fetched ahead of the one being streamed
+        self.window = window or settings.FPL_API_BULK_CONCURRENCY
+
+    async def stream_standings(self, league_id: int, max_pages: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        Yield standings rows in rank order.
+
+        The API only reports `has_next` per page, so later pages are requested
+        in rounds: one page, then two, four and so on up to `window` pages at
+        once, each round only after every page of the previous one reported
+        `has_next`. A round can overshoot the last page, but by fewer pages
+        than the league has, and not at all for leagues that end a round
+        exactly. Shared flights can't be cancelled, so requests already sent
+        past the last page still complete. The client's rate limiter bounds
+        the actual request rate.
+        """
+        first_page = await self.api.get_classic_league_standings(league_id, 1)
+        standings = first_page.get("standings", {})
+        results = standings.get("results", [])
+        page_size = len(results)
+
+        for row in results:
+            yield row
+
+        if not standings.get("has_next") or max_pages == 1:
+            return
+
+        page, batch = 2, 1
+        pending: List[asyncio.Future] = []
+        try:
+            while max_pages is None or page <= max_pages:
+                last = page + batch - 1 if max_pages is None else min(page + batch - 1, max_pages)
+                pending = [
+                    asyncio.ensure_future(self.api.get_classic_league_standings(league_id, p))
+                    for p in range(page, last + 1)
+                ]
+
+                while pending:
+                    standings = (await pending.pop(0)).get("standings", {})
+                    results = standings.get("results", [])
+                    for row in results:
+                        yield row
+
+                    # A short page is the last one whatever has_next says
+                    if not standings.get("has_next") or len(results) < page_size:
+                        return
+
+                page, batch = last + 1, min(batch * 2, self.window)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_all_standings(self, league_id: int, max_pages: Optional[int] = None) -> List[Dict]:
+        """Get every standings row of a league."""
+        return [row async for row in self.stream_standings(league_id, max_pages)]
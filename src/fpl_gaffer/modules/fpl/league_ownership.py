@@ -0,0 +1,164 @@
+import time
+import asyncio
+import logging
+import numpy as np
+from typing import Dict, List, Optional
+from fpl_gaffer.settings import settings
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
+from fpl_gaffer.modules.fpl.league_crawler import FPLLeagueCrawler
+from fpl_gaffer.utils.ownership import LeagueOwnership
+
+logger = logging.getLogger(__name__)
+
+# Members per standings page; each page's picks are requested as soon as it arrives
+STANDINGS_PAGE_SIZE = 50
+
+
+class FPLLeagueOwnership:
+    """
+    Effective ownership of a classic league and how each member's squad
+    differs from a user's.
+
+    Standings pages are crawled with a look-ahead window and every page's
+    members' picks are requested as the page arrives, so picks download
+    while later pages are still coming in. The resulting LeagueOwnership is
+    cached per league and gameweek: until the gameweek is finished for
+    LEAGUE_OWNERSHIP_TTL seconds, afterwards for good.
+    """
+
+    def __init__(self, api: FPLOfficialAPIClient, max_pages: Optional[int] = None):
+        self.api = api
+        self.max_pages = max_pages or settings.LEAGUE_OWNERSHIP_MAX_PAGES
+
+    async def load(self, league_id: int, gw: int) -> Dict:
+        """
+        Get a league's ownership in a gameweek.
+
+        Returns {"ownership": LeagueOwnership, "members": {manager_id: standings row},
+        "errors": {manager_id: message}}; members whose picks failed are left out.
+        """
+        ttl = None if await self.api.is_finished_gameweek(gw) else settings.LEAGUE_OWNERSHIP_TTL
+        return await self.api.cache.remember(
+            f"league_ownership:{league_id}:{gw}", ttl, lambda: self._build(league_id, gw)
+        )
+
+    async def _build(self, league_id: int, gw: int) -> Dict:
+        started = time.perf_counter()
+        members: Dict[int, Dict] = {}
+        pending: List[asyncio.Future] = []
+        page: List[int] = []
+
+        def fetch_page():
+            pending.append(asyncio.ensure_future(self.api.get_managers_gameweek_picks(page.copy(), gw)))
+            page.clear()
+
+        try:
+            async for row in FPLLeagueCrawler(self.api).stream_standings(league_id, self.max_pages):
+                members[row["entry"]] = row
+                page.append(row["entry"])
+                if len(page) == STANDINGS_PAGE_SIZE:
+                    fetch_page()
+            if page:
+                fetch_page()
+
+            table = await self.api.get_player_table()
+            batches = await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        picks: Dict[int, Dict] = {}
+        errors: Dict[int, str] = {}
+        for batch in batches:
+            picks.update(batch["picks"])
+            errors.update(batch["errors"])
+
+        if errors:
+            logger.warning(f"Missing picks for {len(errors)} of {len(members)} members of league {league_id}")
+
+        ownership = LeagueOwnership(table, list(picks), list(picks.values()))
+        logger.info(
+            f"League {league_id} ownership for gameweek {gw}: {len(ownership)} members in "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+        return {"ownership": ownership, "members": members, "errors": errors}
+
+    async def rival_report(self, league_id: int, manager_id: int, gw: int, limit: int = 10) -> Dict:
+        """
+        Compare a manager's squad with their league: the most effectively owned
+        players, the manager's differentials and threats weighted by next
+        gameweek's projected points, unowned targets few rivals have, and
+        overlap and projected swing against the rivals nearest in rank.
+        """
+        league, table, projections = await asyncio.gather(
+            self.load(league_id, gw),
+            self.api.get_player_table(),
+            self.api.get_projection_matrix(),
+        )
+        ownership: LeagueOwnership = league["ownership"]
+        if not len(ownership):
+            return {}
+
+        # The manager's own squad, from the league or fetched when not a member
+        row = ownership.member(manager_id)
+        if row >= 0:
+            weights, owned = ownership.weights[row], ownership.owned[row]
+        else:
+            squad = ownership.squad(table, await self.api.get_gameweek_picks(manager_id, gw))
+            weights, owned = squad["weights"], squad["owned"]
+
+        values = projections.points[:, projections.next_gameweek]
+        exposure = ownership.exposure(weights)
+        starting = weights > 0
+        in_squad = np.unpackbits(owned, count=ownership.n_players).astype(bool)
+        available = table.status == "a"
+
+        def players(rows: List[int]) -> List[Dict]:
+            return [
+                {
+                    **record,
+                    "ownership": round(float(ownership.ownership[r]) * 100, 1),
+                    "captaincy": round(float(ownership.captaincy[r]) * 100, 1),
+                    "effective_ownership": round(float(ownership.effective_ownership[r]) * 100, 1),
+                    "your_multiplier": int(weights[r]),
+                    "projected_points": round(float(values[r]), 2),
+                }
+                for record, r in zip(table.records(table.id[rows].tolist()), rows)
+            ]
+
+        # Rivals nearest the manager in the standings (the top of the league for non-members)
+        rivals = ownership.rivals(weights, owned, values)
+        ranks = np.array([league["members"][m].get("rank", 0) for m in ownership.manager_ids.tolist()])
+        own_rank = ranks[row] if row >= 0 else 0
+        nearest = [r for r in np.argsort(np.abs(ranks - own_rank), kind="stable").tolist() if r != row][:limit]
+
+        return {
+            "league_id": league_id,
+            "gameweek": gw,
+            "members": len(ownership),
+            "missing_members": len(league["errors"]),
+            "rank": int(own_rank) if row >= 0 else None,
+            "projected_gameweek": projections.next_gameweek,
+            "most_owned": players(np.argsort(-ownership.effective_ownership, kind="stable")[:limit].tolist()),
+            # Owned above the league's effective ownership: points here gain on the league
+            "differentials": players(ownership.top_rows(exposure * values, starting, limit)),
+            # Owned below it: points here lose ground
+            "threats": players(ownership.top_rows(-exposure * values, ownership.effective_ownership > 0, limit)),
+            # Not owned, available and rarely owned by rivals: the best league-relative buys
+            "targets": players(
+                ownership.top_rows((1 - ownership.effective_ownership) * values, ~in_squad & available, limit)
+            ),
+            "rivals": [
+                {
+                    "manager_id": int(ownership.manager_ids[r]),
+                    "entry_name": league["members"][int(ownership.manager_ids[r])].get("entry_name"),
+                    "player_name": league["members"][int(ownership.manager_ids[r])].get("player_name"),
+                    "rank": int(ranks[r]),
+                    "overlap": int(rivals["overlap"][r]),
+                    "shared_starters": int(rivals["shared_starters"][r]),
+                    "same_captain": bool(rivals["same_captain"][r]),
+                    "projected_swing": round(float(rivals["swing"][r]), 2),
+                }
+                for r in sorted(nearest, key=lambda r: ranks[r])
+            ],
+        }
@@ -0,0 +1,167 @@
+import time
+import asyncio
+import logging
+import numpy as np
+from typing import Dict, List, Optional, Set
+from fpl_gaffer.settings import settings
+from fpl_gaffer.core.exceptions import FPLAPIError
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
+
+logger = logging.getLogger(__name__)
+
+
+class LiveSnapshot:
+    """Live points and minutes of every player in a gameweek, indexed by player id."""
+
+    def __init__(self, gameweek: int, points: np.ndarray, minutes: np.ndarray):
+        self.gameweek = gameweek
+        self.points = points
+        self.minutes = minutes
+        self.created_at = time.monotonic()
+
+    @classmethod
+    def from_payload(cls, gameweek: int, live_data: Dict) -> "LiveSnapshot":
+        """Build a snapshot from an /event/{gw}/live/ payload."""
+        elements = live_data.get("elements", [])
+        ids = np.fromiter((e["id"] for e in elements), dtype=np.int32, count=len(elements))
+        size = int(ids.max()) + 1 if len(ids) else 0
+
+        points = np.zeros(size, dtype=np.int16)
+        minutes = np.zeros(size, dtype=np.int16)
+        points[ids] = [e.get("stats", {}).get("total_points", 0) for e in elements]
+        minutes[ids] = [e.get("stats", {}).get("minutes", 0) for e in elements]
+
+        return cls(gameweek, points, minutes)
+
+    def player_points(self, player_id: int) -> int:
+        return int(self.points[player_id]) if player_id < len(self.points) else 0
+
+    def player_minutes(self, player_id: int) -> int:
+        return int(self.minutes[player_id]) if player_id < len(self.minutes) else 0
+
+    def squad_points(self, picks: List[Dict]) -> int:
+        """Live points of a squad's picks with their multipliers (bench picks have 0)."""
+        elements = np.array([pick["element"] for pick in picks], dtype=np.int32)
+        multipliers = np.array([pick["multiplier"] for pick in picks], dtype=np.int32)
+
+        known = elements < len(self.points)
+        return int(np.dot(self.points[elements[known]], multipliers[known]))
+
+    def changed_since(self, previous: Optional["LiveSnapshot"]) -> np.ndarray:
+        """Ids of players whose points or minutes differ from a previous snapshot."""
+        if previous is None or previous.gameweek != self.gameweek:
+            return np.flatnonzero(self.points | self.minutes)
+
+        # Pad the previous arrays in case new players were added mid-gameweek
+        size = len(self.points)
+        prev_points = np.zeros(size, dtype=np.int16)
+        prev_minutes = np.zeros(size, dtype=np.int16)
+        prev_points[:len(previous.points)] = previous.points[:size]
+        prev_minutes[:len(previous.minutes)] = previous.minutes[:size]
+
+        return np.flatnonzero((self.points != prev_points) | (self.minutes != prev_minutes))
+
+
+class LiveGameweekPoller:
+    """
+    Poll /event/{gw}/live/ in the background and keep the latest LiveSnapshot.
+
+    Each poll is diffed against the previous snapshot and only the players whose
+    points or minutes changed are published to subscribers, as
+    {"gameweek": gw, "players": {player_id: {"points": ..., "minutes": ...}}}.
+    """
+
+    def __init__(self, api: FPLOfficialAPIClient, interval: Optional[float] = None):
+        self.api = api
+        self.interval = interval or settings.FPL_LIVE_POLL_INTERVAL
+        self.snapshot: Optional[LiveSnapshot] = None
+
+        # (gameweek, payload version) of the current snapshot, to skip unchanged polls
+        self._source: Optional[tuple] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_client(cls, api: FPLOfficialAPIClient) -> "LiveGameweekPoller":
+        """Get the poller kept alongside a client's cache."""
+        return api.cache.derive("live_gameweek_poller", None, lambda: cls(api))
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Get a queue receiving every published update."""
+        queue = asyncio.Queue(maxsize=settings.FPL_LIVE_SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    async def poll_once(self) -> Dict[int, Dict]:
+        """Fetch the current gameweek's live data, update the snapshot and publish the changes."""
+        gameweek = await self._current_gameweek()
+        if gameweek is None:
+            return {}
+
+        live_data = await self.api.get_live_gameweek(gameweek)
+
+        # A revalidated (304) or stored payload keeps its version, so nothing changed
+        source = (gameweek, self.api.cache.version(f"/event/{gameweek}/live/"))
+        if source == self._source:
+            return {}
+
+        snapshot = LiveSnapshot.from_payload(gameweek, live_data)
+        changed = snapshot.changed_since(self.snapshot)
+        self.snapshot, self._source = snapshot, source
+
+        players = {
+            int(pid): {"points": int(snapshot.points[pid]), "minutes": int(snapshot.minutes[pid])}
+            for pid in changed
+        }
+        if players:
+            self._publish({"gameweek": gameweek, "players": players})
+
+        return players
+
+    def start(self):
+        """Start polling in the background."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop background polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except FPLAPIError as e:
+                logger.warning(f"Live gameweek poll failed: {e}")
+            except Exception:
+                # Anything else (e.g. an unexpected payload) must not end polling and leave subscribers
+                # waiting; cancellation is not an Exception and still stops the task
+                logger.exception("Live gameweek poll raised an unexpected error")
+            await asyncio.sleep(self.interval)
+
+    def _publish(self, update: Dict):
+        for queue in self._subscribers:
+            # Drop the oldest update rather than block on a slow subscriber
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(update)
+
+    async def _current_gameweek(self) -> Optional[int]:
+        bootstrap_data = await self.api.get_bootstrap_data()
+        current_gw = next((
+            gw for gw in bootstrap_data.get("events", []) if gw.get("is_current")
+        ), None)
+        return current_gw.get("id") if current_gw else None
@@ -0,0 +1,191 @@
+import time
+import logging
+import numpy as np
+from typing import Dict, List, Optional, Iterable, Tuple
+from fpl_gaffer.settings import settings
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Per-fixture stats kept from element-summary history
+HISTORY_STATS = (
+    "total_points", "minutes", "goals_scored", "assists", "clean_sheets", "goals_conceded",
+    "saves", "bonus", "bps", "expected_goals", "expected_assists", "expected_goal_involvements",
+    "expected_goals_conceded",
+)
+
+# Columns of the upcoming fixtures array
+UPCOMING_FIELDS = ("event", "opponent", "is_home", "difficulty")
+
+
+class PlayerHistory:
+    """
+    Per-player, per-gameweek match history in compact arrays.
+
+    `stats[name]` is a float32 array of shape (players, gameweeks + 1) indexed by
+    [row, gameweek], column 0 unused. Gameweeks without a fixture are NaN and
+    double gameweeks hold the sum of both fixtures (see `fixtures`).
+    """
+
+    def __init__(
+        self,
+        player_ids: np.ndarray,
+        values: np.ndarray,
+        fixtures: np.ndarray,
+        upcoming: Dict[int, np.ndarray]
+    ):
+        self.player_ids = player_ids
+        self.rows = {player_id: row for row, player_id in enumerate(player_ids.tolist())}
+        self.stats = {name: values[i] for i, name in enumerate(HISTORY_STATS)}
+        self.fixtures = fixtures
+        self.upcoming = upcoming
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self.rows
+
+    @property
+    def last_gameweek(self) -> int:
+        """Latest gameweek any loaded player has history for."""
+        played = np.flatnonzero(self.fixtures.any(axis=0))
+        return int(played[-1]) if len(played) else 0
+
+    def form(self, stat: str = "total_points", last: int = 5) -> np.ndarray:
+        """Average of a stat per fixture over the last gameweeks, for every loaded player."""
+        end = self.last_gameweek + 1
+        window = self.stats[stat][:, max(1, end - last):end]
+        fixtures = self.fixtures[:, max(1, end - last):end].sum(axis=1)
+
+        totals = np.nansum(window, axis=1)
+        return np.divide(totals, fixtures, out=np.zeros_like(totals), where=fixtures > 0)
+
+    def recent(self, player_id: int, last: int = 5) -> List[Dict]:
+        """A player's last gameweeks with a fixture, oldest first."""
+        row = self.rows.get(player_id)
+        if row is None:
+            return []
+
+        gameweeks = np.flatnonzero(self.fixtures[row])[-last:]
+        return [
+            {
+                "gameweek": int(gw),
+                "fixtures": int(self.fixtures[row, gw]),
+                **{name: round(float(values[row, gw]), 2) for name, values in self.stats.items()},
+            }
+            for gw in gameweeks
+        ]
+
+    def next_fixtures(self, player_id: int, count: int = 5) -> List[Dict]:
+        """A player's next fixtures as (event, opponent team id, is_home, difficulty)."""
+        upcoming = self.upcoming.get(player_id)
+        if upcoming is None:
+            return []
+        return [dict(zip(UPCOMING_FIELDS, map(int, fixture))) for fixture in upcoming[:count]]
+
+
+def compact_summary(summary: Dict, n_gameweeks: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert one element-summary payload to (values, fixtures, upcoming) arrays."""
+    values = np.full((len(HISTORY_STATS), n_gameweeks + 1), np.nan, dtype=np.float32)
+    fixtures = np.zeros(n_gameweeks + 1, dtype=np.int8)
+
+    for match in summary.get("history", []):
+        gw = match.get("round")
+        if not gw or gw > n_gameweeks:
+            continue
+
+        # Expected stats come as strings, e.g. "0.34"
+        row = [float(match.get(stat) or 0) for stat in HISTORY_STATS]
+        values[:, gw] = np.add(values[:, gw], row) if fixtures[gw] else row
+        fixtures[gw] += 1
+
+    upcoming = np.array(
+        [
+            (
+                fixture.get("event") or 0,
+                fixture.get("team_a") if fixture.get("is_home") else fixture.get("team_h"),
+                bool(fixture.get("is_home")),
+                fixture.get("difficulty") or 0,
+            )
+            for fixture in summary.get("fixtures", [])
+        ],
+        dtype=np.int16,
+    ).reshape(-1, len(UPCOMING_FIELDS))
+
+    return values, fixtures, upcoming
+
+
+class FPLPlayerHistoryLoader:
+    """Bulk loader of /element-summary/ payloads into PlayerHistory arrays."""
+
+    def __init__(self, api: FPLOfficialAPIClient, ttl: Optional[float] = None):
+        self.api = api
+        self.ttl = settings.FPL_ELEMENT_SUMMARY_TTL if ttl is None else ttl
+        self.n_gameweeks = 0
+
+        # Compacted summaries by player id, kept in memory between loads
+        self._rows: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._loaded_at: Dict[int, float] = {}
+
+    @classmethod
+    def for_client(cls, api: FPLOfficialAPIClient) -> "FPLPlayerHistoryLoader":
+        """Get the loader kept alongside a client's cache, so loaded history is shared."""
+        return api.cache.derive("player_history_loader", None, lambda: cls(api))
+
+    async def load(self, player_ids: Optional[Iterable[int]] = None) -> PlayerHistory:
+        """
+        Load history for a set of players, or for every player when None.
+
+        Only players missing from memory or older than the TTL are fetched; players
+        whose summary fails to load are left out of the result.
+        """
+        bootstrap_data = await self.api.get_bootstrap_data()
+        n_gameweeks = len(bootstrap_data.get("events", [])) or 38
+
+        # A new season changes the array width, so start over
+        if n_gameweeks != self.n_gameweeks:
+            self._rows.clear()
+            self._loaded_at.clear()
+            self.n_gameweeks = n_gameweeks
+
+        if player_ids is None:
+            player_ids = [player["id"] for player in bootstrap_data.get("elements", [])]
+        player_ids = list(dict.fromkeys(player_ids))
+
+        now = time.monotonic()
+        stale = [pid for pid in player_ids if now - self._loaded_at.get(pid, -np.inf) >= self.ttl]
+
+        if stale:
+            result = await self.api.get_many_element_summaries(stale)
+            for player_id, summary in result["summaries"].items():
+                self._rows[player_id] = compact_summary(summary, n_gameweeks)
+                self._loaded_at[player_id] = now
+
+            if result["errors"]:
+                logger.warning(
+                    "Failed to load element summaries for %d players: %s",
+                    len(result["errors"]), result["errors"]
+                )
+
+        return self._build([pid for pid in player_ids if pid in self._rows])
+
+    def _build(self, player_ids: List[int]) -> PlayerHistory:
+        """Stack compacted rows into PlayerHistory arrays."""
+        width = self.n_gameweeks + 1
+        rows = [self._rows[pid] for pid in player_ids]
+
+        if rows:
+            # (stats, players, gameweeks) so each stat is one contiguous matrix
+            values = np.stack([row[0] for row in rows], axis=1)
+            fixtures = np.stack([row[1] for row in rows])
+        else:
+            values = np.empty((len(HISTORY_STATS), 0, width), dtype=np.float32)
+            fixtures = np.empty((0, width), dtype=np.int8)
+
+        return PlayerHistory(
+            player_ids=np.array(player_ids, dtype=np.int32),
+            values=values,
+            fixtures=fixtures,
+            upcoming={pid: row[2] for pid, row in zip(player_ids, rows)},
+        )
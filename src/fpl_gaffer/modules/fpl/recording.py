@@ -0,0 +1,35 @@
+import asyncio
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def fixture_path(root: str | Path, endpoint: str, params: Optional[Dict] = None) -> Path:
+    """
+    Map an endpoint (and query params) to its fixture file.
+
+    '/entry/1/event/3/picks/' -> '<root>/entry/1/event/3/picks.json'
+    '/fixtures/' with {"event": 3} -> '<root>/fixtures__event=3.json'
+    """
+    name = endpoint.strip("/") or "index"
+    if params:
+        name += "__" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return Path(root) / f"{name}.json"
+
+
+class ResponseRecorder:
+    """Capture raw FPL API responses to a fixture directory for offline replay."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.recorded = 0
+
+    async def record(self, endpoint: str, params: Optional[Dict], content: bytes):
+        """Write a response body to its fixture file, replacing any older recording."""
+        path = fixture_path(self.root, endpoint, params)
+        await asyncio.to_thread(self._write, path, content)
+        self.recorded += 1
+
+    @staticmethod
+    def _write(path: Path, content: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
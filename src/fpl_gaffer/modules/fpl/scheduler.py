@@ -0,0 +1,183 @@
+import re
+import time
+import random
+import asyncio
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional, Any, Callable, Awaitable
+from httpx import Response, TransportError
+from fpl_gaffer.settings import settings
+
+# Upstream statuses worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Collapse ids in an endpoint path, e.g. '/entry/1/event/3/picks/' -> '/entry/{id}/event/{id}/picks/'."""
+    return re.sub(r"/\d+(?=/|$)", "/{id}", endpoint)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Cap on in-flight requests that adapts to upstream latency (AIMD).
+
+    The limit grows by roughly one slot per window of fast responses and is
+    cut multiplicatively when latency exceeds the target or upstream throttles.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, latency_target: float):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, latency: Optional[float] = None, throttled: bool = False):
+        async with self._condition:
+            self.in_flight -= 1
+
+            if throttled or (latency is not None and latency > self.latency_target):
+                self.limit = max(self.minimum, self.limit * 0.7)
+            elif latency is not None:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+            self._condition.notify_all()
+
+
+class RequestScheduler:
+    """
+    Rate limiting, concurrency control and retries for FPL API requests.
+
+    Every request takes a token from the global bucket and, for endpoints in
+    FPL_API_ENDPOINT_RATE_LIMITS, from its endpoint's bucket as well, so an
+    endpoint's rate only narrows the global one.
+    """
+
+    def __init__(self):
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=settings.FPL_API_MAX_IN_FLIGHT,
+            minimum=settings.FPL_API_MIN_IN_FLIGHT,
+            maximum=settings.FPL_API_MAX_IN_FLIGHT,
+            latency_target=settings.FPL_API_LATENCY_TARGET,
+        )
+        self.bucket = TokenBucket(settings.FPL_API_RATE_LIMIT, settings.FPL_API_RATE_BURST)
+        self.endpoint_buckets: Dict[str, TokenBucket] = {
+            group: TokenBucket(rate, max(1.0, rate))
+            for group, rate in settings.FPL_API_ENDPOINT_RATE_LIMITS.items()
+        }
+
+        # Counters
+        self.retries = 0
+        self.throttled = 0
+        self._latency_total = 0.0
+        self._latency_count = 0
+
+    async def run(self, endpoint: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        """Send a request under the rate limits, retrying 429/5xx and transport errors."""
+        endpoint_bucket = self.endpoint_buckets.get(endpoint_group(endpoint))
+        attempt = 0
+
+        while True:
+            await self.bucket.acquire()
+            if endpoint_bucket is not None:
+                await endpoint_bucket.acquire()
+
+            await self.limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = await send()
+            except TransportError:
+                await self.limiter.release(throttled=True)
+                if attempt >= settings.FPL_API_MAX_RETRIES:
+                    raise
+                delay = self._backoff(attempt)
+            except BaseException:
+                await self.limiter.release()
+                raise
+            else:
+                latency = time.monotonic() - started
+                self._latency_total += latency
+                self._latency_count += 1
+
+                throttled = response.status_code == 429
+                if throttled:
+                    self.throttled += 1
+                await self.limiter.release(latency=latency, throttled=throttled)
+
+                if response.status_code not in RETRY_STATUSES or attempt >= settings.FPL_API_MAX_RETRIES:
+                    return response
+
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > settings.FPL_API_BACKOFF_MAX:
+                    # Too long to wait inside a request, surface the error instead
+                    return response
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(settings.FPL_API_BACKOFF_MAX, settings.FPL_API_BACKOFF_BASE * 2 ** attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency_limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "avg_latency_ms": (
+                round(self._latency_total / self._latency_count * 1000, 1) if self._latency_count else None
+            ),
+        }
@@ -0,0 +1,115 @@
+import time
+import sqlite3
+import asyncio
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+
+class ResponseStore:
+    """
+    SQLite-backed store of raw FPL API response bodies.
+
+    Entries written without a TTL never expire (finished gameweeks, past fixtures);
+    entries with a TTL are ignored and dropped once expired.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        self._conn.commit()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Build a store key from an endpoint and its query params."""
+        if not params:
+            return endpoint
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{endpoint}?{query}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a stored body, or None if missing or expired."""
+        body = await asyncio.to_thread(self._get, key)
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    async def put(self, key: str, body: bytes, ttl: Optional[float] = None):
+        """Store a body, permanently when ttl is None."""
+        await asyncio.to_thread(self._put, key, body, ttl)
+        self.writes += 1
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            body, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            return body
+
+    def _put(self, key: str, body: bytes, ttl: Optional[float]):
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, body, now, expires_at),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, permanent, size = self._conn.execute(
+                "SELECT COUNT(*), COUNT(*) - COUNT(expires_at), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+            ).fetchone()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "entries": entries,
+            "permanent_entries": permanent,
+            "bytes_stored": size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
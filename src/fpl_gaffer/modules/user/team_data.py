@@ -1,17 +1,32 @@
-from typing import Dict, Optional, List, Any
+import os
+import time
+import asyncio
+import logging
+import numpy as np
+from typing import Dict, Optional, List, Any, Awaitable, Collection, Iterable, Literal, Sequence, TypeVar
 from fpl_gaffer.settings import settings
+from fpl_gaffer.core.exceptions import FPLAPIError
 from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
-from httpx import AsyncClient
-from fpl_gaffer.utils import build_mappings, map_player
+from fpl_gaffer.modules.fpl.live import LiveGameweekPoller, LiveSnapshot
+from fpl_gaffer.modules.fpl.effective_points import FPLEffectivePoints
+from fpl_gaffer.utils import PlayerTable, Pick, Squad, map_players, map_squad
+from fpl_gaffer.utils.transfer_planner import free_transfers_after, plan_transfers
+from fpl_gaffer.utils.simulation import GameweekSimulator, compare, rank_probabilities, simulate_squads, summarize
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SnapshotSection = Literal["history", "transfers"]
+SNAPSHOT_SECTIONS = ("history", "transfers")
 
 
 class FPLTeamDataManger:
     def __init__(self, api: FPLOfficialAPIClient, manager_id: int, gameweek: Optional[int] = None):
-        self.base_url = settings.FPL_API_BASE_URL
-        self.session = AsyncClient()
         self.api = api
         self.manager_id = manager_id
         self.current_gw = gameweek
+        self.timings: Dict[str, float] = {}
 
     async def _get_bootstrap_data(self):
         """Get bootstrap data from FPL API."""
@@ -24,87 +39,162 @@ class FPLTeamDataManger:
 
     async def get_latest_team_data(self) -> Optional[Dict]:
         """Get the most recent team data."""
-        # Fetch bootstrap data
-        bootstrap_data = await self.api.get_bootstrap_data()
-
-        if bootstrap_data is None:
+        squad = await self.get_team_snapshot(sections=("history",))
+        if squad is None:
             return {}
 
-        # Build mappings from bootstrap data
-        players, teams, positions = build_mappings(bootstrap_data)
-
-        if self.current_gw is None:
-            # Get current gameweek from bootstrap data
-            current_gw = next((
-                gw for gw in bootstrap_data.get("events", []) if gw.get("is_current")
-            ), None)
-            self.current_gw = current_gw.get("id")
+        return squad.to_dict()
+
+    async def get_team_snapshot(self, sections: Collection[SnapshotSection] = SNAPSHOT_SECTIONS) -> Optional[Squad]:
+        """
+        Get the gameweek squad with the selected optional sections, fetched concurrently.
+
+        Bootstrap, picks and the requested sections ("history", "transfers") are
+        fetched with one gather; the picks wait on bootstrap only when the
+        gameweek is not known yet. Stage timings in ms are kept in `self.timings`
+        and logged.
+        """
+        self.timings = {}
+        started = time.perf_counter()
+
+        async def timed(stage: str, awaitable: Awaitable[T]) -> T:
+            stage_started = time.perf_counter()
+            try:
+                return await awaitable
+            finally:
+                self.timings[stage] = (time.perf_counter() - stage_started) * 1000
+
+        async def load_picks() -> Dict:
+            if self.current_gw is None:
+                bootstrap_data = await self.api.get_bootstrap_data()
+                current_gw = next((
+                    gw for gw in bootstrap_data.get("events", []) if gw.get("is_current")
+                ), None)
+                self.current_gw = current_gw.get("id")
+            return await self.api.get_gameweek_picks(self.manager_id, self.current_gw)
+
+        async def skipped() -> None:
+            return None
 
-        # Get the team data for the current gameweek
-        team_data = await self.api.get_gameweek_picks(
-            self.manager_id,
-            self.current_gw
+        table, team_data, history_data, transfer_history = await asyncio.gather(
+            timed("player_table", self.api.get_player_table()),
+            timed("picks", load_picks()),
+            timed("history", self.get_user_history()) if "history" in sections else skipped(),
+            timed("transfers", self.get_transfer_history()) if "transfers" in sections else skipped(),
         )
+        self.timings["fetch"] = (time.perf_counter() - started) * 1000
 
-        # Create structured squad data
-        squad_data = await self.extract_squad_info(team_data, players, teams, positions)
-        if squad_data is None:
+        if not team_data:
             return None
 
-        return squad_data
+        assemble_started = time.perf_counter()
+        squad = self.build_squad(team_data, table, history_data, transfer_history)
+        self.timings["assemble"] = (time.perf_counter() - assemble_started) * 1000
+        self.timings["total"] = (time.perf_counter() - started) * 1000
+
+        logger.info(
+            f"Team snapshot for manager {self.manager_id}, gameweek {self.current_gw}: "
+            + ", ".join(f"{stage} {ms:.1f} ms" for stage, ms in self.timings.items())
+        )
+        return squad
+
+    async def extract_squad_info(self, team_data: Dict, table: PlayerTable) -> Dict:
+        """Extract detailed squad information."""
+        history_data = await self.get_user_history()
+        return self.build_squad(team_data, table, history_data).to_dict()
 
-    async def extract_squad_info(
+    def build_squad(
         self,
         team_data: Dict,
-        players: Dict,
-        teams: Dict,
-        positions: Dict
-    ) -> Dict:
-        """Extract detailed squad information."""
+        table: PlayerTable,
+        history_data: Optional[Dict] = None,
+        transfer_history: Optional[List[Dict[str, Any]]] = None
+    ) -> Squad:
+        """
+        Build a squad record from gameweek picks data and the fetched optional sections.
+
+        Raises FPLAPIError when a pick's player is not in the player table
+        (e.g. bootstrap data older than the picks): a short squad would
+        silently skew transfer plans, simulations and auto-subs.
+        """
         gw_history = team_data.get("entry_history", {})
 
-        # Squad information
-        squad_info = {
-            "starting_xi": [],
-            "bench": [],
-            "captain": None,
-            "vice_captain": None,
-            "active_chip": team_data.get("active_chip", None),
-            "points": gw_history.get("points", 0),
-            "total_points": gw_history.get("total_points", 0),
-            "rank": gw_history.get("overall_rank", 0),
-            "squad_value": gw_history.get("value", 0) / 10,
-            "transfers": gw_history.get("event_transfers", 0),
-            "transfers_cost": gw_history.get("event_transfers_cost", 0),
-            "money_itb": gw_history.get("bank", 0) / 10,
-            "history": history_data if (history_data := await self.get_user_history()) else {}
-        }
-
-        # Get manager picks from team data
+        # Get manager picks from team data, mapped to shared player records
         picks = team_data.get("picks", [])
+        players = table.players(pick["element"] for pick in picks)
+
+        missing = [pick["element"] for pick, player in zip(picks, players) if player is None]
+        if missing:
+            logger.warning(
+                f"Picks of manager {self.manager_id} in gameweek {self.current_gw} reference players "
+                f"missing from the player table: {missing}"
+            )
+            raise FPLAPIError(f"Unknown players {missing} in the squad of manager {self.manager_id}")
+
+        return Squad(
+            picks=tuple(
+                Pick(
+                    player=player,
+                    position_in_team=pick["position"],
+                    multiplier=pick["multiplier"],
+                    is_captain=pick["is_captain"],
+                    is_vice_captain=pick["is_vice_captain"],
+                )
+                for pick, player in zip(picks, players)
+            ),
+            active_chip=team_data.get("active_chip", None),
+            points=gw_history.get("points", 0),
+            total_points=gw_history.get("total_points", 0),
+            rank=gw_history.get("overall_rank", 0),
+            squad_value=gw_history.get("value", 0) / 10,
+            transfers=gw_history.get("event_transfers", 0),
+            transfers_cost=gw_history.get("event_transfers_cost", 0),
+            money_itb=gw_history.get("bank", 0) / 10,
+            history=history_data or {},
+            transfer_history=transfer_history,
+        )
 
-        # Extract player data from picks
-        for pick in picks:
-            player_info = map_player(pick["element"], players, teams, positions)
-            player_info.update({
-                "position_in_team": pick["position"],
-                "multiplier": pick["multiplier"]
-            })
+    async def get_live_points(self) -> Dict:
+        """Get the squad's live points for the gameweek."""
+        bootstrap_data = await self.api.get_bootstrap_data()
 
-            # Get captain and vice captain
-            if pick["is_captain"]:
-                squad_info["captain"] = player_info
+        if bootstrap_data is None:
+            return {}
 
-            if pick['is_vice_captain']:
-                squad_info['vice_captain'] = player_info
+        table = await self.api.get_player_table()
 
-            # Sort out starting 11
-            if pick["position"] <= 11:
-                squad_info["starting_xi"].append(player_info)
-            else:
-                squad_info["bench"].append(player_info)
+        if self.current_gw is None:
+            # Get current gameweek from bootstrap data
+            current_gw = next((
+                gw for gw in bootstrap_data.get("events", []) if gw.get("is_current")
+            ), None)
+            self.current_gw = current_gw.get("id")
+
+        team_data = await self.api.get_gameweek_picks(self.manager_id, self.current_gw)
+        picks = team_data.get("picks", [])
 
-        return squad_info
+        # Reuse the background poller's snapshot when it is on this gameweek
+        snapshot = LiveGameweekPoller.for_client(self.api).snapshot
+        if snapshot is None or snapshot.gameweek != self.current_gw:
+            live_data = await self.api.get_live_gameweek(self.current_gw, ttl=settings.FPL_LIVE_POLL_INTERVAL)
+            snapshot = LiveSnapshot.from_payload(self.current_gw, live_data)
+
+        return {
+            "gameweek": self.current_gw,
+            "live_points": snapshot.squad_points(picks),
+            "transfers_cost": team_data.get("entry_history", {}).get("event_transfers_cost", 0),
+            "players": [
+                {
+                    "id": pick["element"],
+                    "name": player_info.get("name"),
+                    "position_in_team": pick["position"],
+                    "multiplier": pick["multiplier"],
+                    "points": snapshot.player_points(pick["element"]),
+                    "minutes": snapshot.player_minutes(pick["element"]),
+                }
+                for pick, player_info in zip(picks, map_squad(picks, table))
+            ]
+        }
 
     async def get_user_history(self) -> Dict:
         """Get user history data."""
@@ -117,7 +207,207 @@ class FPLTeamDataManger:
 
         return history_data
 
-    # TODO: Handle auto subs data for team...
+    async def get_effective_points(
+        self,
+        gameweeks: Optional[Iterable[int]] = None,
+        rival_ids: Sequence[int] = ()
+    ) -> Dict[str, Any]:
+        """
+        Get the manager's points per gameweek after auto-subs and the captaincy
+        fallback, with the same for any rivals, loaded in one batch.
+
+        Defaults to every gameweek up to the current one. Auto-subs are named
+        by player; managers whose picks failed to load are listed in `errors`.
+        """
+        if gameweeks is None:
+            if self.current_gw is None:
+                bootstrap_data = await self.api.get_bootstrap_data()
+                current_gw = next((
+                    gw for gw in bootstrap_data.get("events", []) if gw.get("is_current")
+                ), None)
+                self.current_gw = current_gw.get("id")
+            gameweeks = range(1, self.current_gw + 1)
+
+        rival_ids = [rival_id for rival_id in dict.fromkeys(rival_ids) if rival_id != self.manager_id]
+        effective_points, table = await asyncio.gather(
+            FPLEffectivePoints(self.api).load([self.manager_id, *rival_ids], gameweeks),
+            self.api.get_player_table(),
+        )
+        # Full names: web names repeat across players (e.g. several "Silva")
+        names = dict(zip(table.id.tolist(), table.name.tolist()))
+
+        def manager_points(manager_id: int) -> Dict[str, Any]:
+            results = list(effective_points["points"][manager_id].values())
+            return {
+                "manager_id": manager_id,
+                "net_points": sum(result["net_points"] for result in results),
+                "gameweeks": [
+                    {
+                        **result,
+                        "auto_subs": [
+                            {"out": names.get(sub["element_out"]), "in": names.get(sub["element_in"])}
+                            for sub in result["auto_subs"]
+                        ],
+                    }
+                    for result in results
+                ],
+            }
+
+        return {
+            **manager_points(self.manager_id),
+            "rivals": [
+                manager_points(rival_id) for rival_id in rival_ids if effective_points["points"][rival_id]
+            ],
+            "errors": effective_points["errors"],
+        }
+
+    async def plan_transfers(self, num_gameweeks: int = 3, max_transfers: int = 2, n_plans: int = 3) -> Dict:
+        """
+        Plan transfers for the next x gameweeks from the latest squad, ranked by
+        projected points after hits, with the free transfers banked along the way.
+        """
+        team_data, table, projections, bootstrap_data = await asyncio.gather(
+            self.get_latest_team_data(),
+            self.api.get_player_table(),
+            self.api.get_projection_matrix(),
+            self.api.get_bootstrap_data(),
+        )
+        next_gw = next((gw for gw in bootstrap_data.get("events", []) if gw.get("is_next")), None)
+
+        if not team_data or next_gw is None:
+            return {}
+
+        start_gw = next_gw.get("id")
+        gameweeks = list(range(start_gw, min(projections.n_gameweeks, start_gw + num_gameweeks - 1) + 1))
+
+        # (gameweeks, players) expected points; only available players are bought
+        eligible = table.status == "a"
+        values = projections.horizon(start_gw, num_gameweeks).T
+
+        squad = table.rows(player["id"] for player in team_data["starting_xi"] + team_data["bench"]).tolist()
+        bank = int(round(team_data["money_itb"] * 10))
+        free_transfers = free_transfers_after(team_data["history"])
+        prices = np.rint(table.price * 10).astype(np.int64)
+
+        def plan(**kwargs):
+            return plan_transfers(
+                squad, bank, free_transfers, values, table.position, table.team, prices, eligible=eligible, **kwargs
+            )
+
+        # CPU-bound, so kept off the event loop
+        started = time.perf_counter()
+        plans, (hold,) = await asyncio.to_thread(
+            lambda: (
+                plan(
+                    max_transfers=max_transfers, beam_width=settings.TRANSFER_PLANNER_BEAM_WIDTH,
+                    n_plans=n_plans, workers=settings.TRANSFER_PLANNER_WORKERS
+                ),
+                plan(max_transfers=0, n_plans=1),
+            )
+        )
+        plan_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        def players(rows: List[int]) -> List[Dict]:
+            return table.records(table.id[rows].tolist()) if rows else []
+
+        return {
+            "from_gameweek": gameweeks[0],
+            "to_gameweek": gameweeks[-1],
+            "free_transfers": free_transfers,
+            "money_itb": team_data["money_itb"],
+            "no_transfers_points": hold.total,
+            "plans": [
+                {
+                    "rank": rank,
+                    "projected_points": transfer_plan.total,
+                    "gain": round(transfer_plan.total - hold.total, 2),
+                    "gameweeks": [
+                        {
+                            "gameweek": gw,
+                            "free_transfers": transfer_plan.free_transfers[t],
+                            "transfers_out": players([out for out, _ in transfer_plan.transfers[t]]),
+                            "transfers_in": players([player_in for _, player_in in transfer_plan.transfers[t]]),
+                            "hit": transfer_plan.hits[t],
+                            "money_itb": transfer_plan.bank[t] / 10,
+                            "projected_points": transfer_plan.points[t],
+                        }
+                        for t, gw in enumerate(gameweeks)
+                    ],
+                }
+                for rank, transfer_plan in enumerate(plans, start=1)
+            ],
+            "plan_ms": plan_ms,
+        }
+
+    async def simulate_gameweek(
+        self,
+        rival_ids: Sequence[int] = (),
+        draws: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Simulate the next gameweek for the latest squad: points percentiles,
+        captain choices ranked by expected points and spread, and the chance
+        of beating each rival squad. Chips played this gameweek are not
+        carried over.
+        """
+        rival_ids = [rival_id for rival_id in dict.fromkeys(rival_ids) if rival_id != self.manager_id]
+        team_data, table, projections, rival_squads = await asyncio.gather(
+            self.get_latest_team_data(),
+            self.api.get_player_table(),
+            self.api.get_projection_matrix(),
+            # A rival that fails to load is left out rather than failing the simulation
+            asyncio.gather(
+                *(FPLTeamDataManger(self.api, rival_id, self.current_gw).get_team_snapshot(sections=())
+                  for rival_id in rival_ids),
+                return_exceptions=True
+            ),
+        )
+        if not team_data:
+            return {}
+
+        rivals = {}
+        for rival_id, squad in zip(rival_ids, rival_squads):
+            if isinstance(squad, Exception):
+                logger.warning(f"Skipping rival {rival_id} in the gameweek simulation: {squad}")
+            elif squad is not None:
+                rivals[rival_id] = squad.to_dict()
+        simulator = GameweekSimulator(
+            table, projections, projections.next_gameweek, draws=draws or settings.SIMULATION_DRAWS, seed=seed
+        )
+        workers = settings.SIMULATION_WORKERS or min(4, os.cpu_count() or 1)
+
+        # CPU-bound, so kept off the event loop
+        started = time.perf_counter()
+        points, captains = await asyncio.to_thread(
+            lambda: (
+                simulate_squads(simulator, [team_data, *rivals.values()], chips=False, workers=workers),
+                simulator.captain_options(team_data, chips=False),
+            )
+        )
+        simulate_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        names = dict(zip(table.id.tolist(), table.web_name.tolist()))
+        result = {
+            "gameweek": simulator.gameweek,
+            "draws": simulator.draws,
+            "seed": simulator.seed,
+            "projected_points": summarize(points[0]),
+            "captain_options": [{"name": names.get(option["id"]), **option} for option in captains],
+            "rivals": [
+                {"manager_id": rival_id, "projected_points": summarize(rival_points), **compare(points[0], rival_points)}
+                for rival_id, rival_points in zip(rivals, points[1:])
+            ],
+            "missing_rivals": [rival_id for rival_id in rival_ids if rival_id not in rivals],
+            "simulate_ms": simulate_ms,
+        }
+
+        if rivals:
+            ranks = rank_probabilities(points)
+            result["expected_rank"] = round(float(ranks["expected_rank"][0]), 2)
+            result["top_probability"] = round(float(ranks["top_probability"][0]), 4)
+
+        return result
 
     async def get_transfer_history(self) -> List[Dict[str, Any]]:
         """Get user transfer history."""
@@ -127,38 +417,42 @@ class FPLTeamDataManger:
         if bootstrap_data is None:
             return []
 
-        # Build mappings from bootstrap data
-        players, teams, positions = build_mappings(bootstrap_data)
+        # Player lookups, built once per bootstrap version
+        table = await self.api.get_player_table()
 
         transfers = await self.api.get_transfer_data(self.manager_id)
 
         if transfers is None:
             return []
 
-        # transfer_history = []
-        # Map player ids to names and teams using mapper
-        for t in transfers:
-            player_in_id = t.get("element_in")
-            player_out_id = t.get("element_out")
-
-            player_in_mapped = map_player(player_in_id, players, teams, positions)
-            player_out_mapped = map_player(player_out_id, players, teams, positions)
+        # Map player ids to names for the whole transfer list in one lookup each way
+        players_in = map_players((t.get("element_in", -1) for t in transfers), table)
+        players_out = map_players((t.get("element_out", -1) for t in transfers), table)
 
-            t["element_in_name"] = player_in_mapped["name"]
-            t["element_out_name"] = player_out_mapped["name"]
+        for t, player_in_mapped, player_out_mapped in zip(transfers, players_in, players_out):
+            t["element_in_name"] = player_in_mapped.get("name")
+            t["element_out_name"] = player_out_mapped.get("name")
 
         return transfers
 
-    async def get_captain_picks(self) -> List[Dict[str, Any]]:
-        """Get user captain picks history"""
+    async def get_captain_picks(
+        self, start_gameweek: int = 1, skip_gameweeks: Collection[int] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Get user captain picks history.
+
+        Only gameweeks from `start_gameweek` to the current one that are not in
+        `skip_gameweeks` are fetched, so a sync can pass the gameweeks it already
+        stored and request just the new ones.
+        """
         # Get bootstrap data
         bootstrap_data = await self.api.get_bootstrap_data()
 
         if bootstrap_data is None:
             return []
 
-        # Build mappings from bootstrap data
-        players, teams, positions = build_mappings(bootstrap_data)
+        # Player lookups, built once per bootstrap version
+        table = await self.api.get_player_table()
 
         if self.current_gw is None:
             # Get current gameweek from bootstrap data
@@ -168,35 +462,48 @@ class FPLTeamDataManger:
             self.current_gw = current_gw.get("id")
         # print(current_gw)
 
-        captain_picks = []
+        gameweeks = [
+            gw for gw in range(max(start_gameweek, 1), self.current_gw + 1) if gw not in skip_gameweeks
+        ]
+        if not gameweeks:
+            return []
+
         # Get the team data for the gameweeks till present
-        for gw in range(1, self.current_gw + 1):
-            team_data = await self.api.get_gameweek_picks(self.manager_id, gw)
-            # Get picks from team data
-            picks = team_data.get("picks", [])
-
-            # Extract player data from picks
-            for pick in picks:
-                player_info = map_player(pick["element"], players, teams, positions)
-
-                # Get captain and vice captain
-                if pick["is_captain"]:
-                    player_data = {
-                        "gameweek": gw,
-                        "player_id": player_info.get("id"),
-                        "player_name": player_info.get("name"),
-                        "is_vice_captain": False
-                    }
-                    captain_picks.append(player_data)
-
-                if pick['is_vice_captain']:
-                    player_data = {
-                        "gameweek": gw,
-                        "player_id": player_info.get("id"),
-                        "player_name": player_info.get("name"),
-                        "is_vice_captain": True
-                    }
-                    captain_picks.append(player_data)
+        gameweek_picks = await self.api.get_many_gameweek_picks(self.manager_id, gameweeks)
+
+        if gameweek_picks["errors"]:
+            logger.warning(
+                f"Missing picks for manager {self.manager_id} in gameweeks {list(gameweek_picks['errors'])}"
+            )
+
+        # Get captain and vice captain picks for every gameweek
+        armband_picks = [
+            (gw, pick)
+            for gw, team_data in gameweek_picks["picks"].items()
+            for pick in team_data.get("picks", [])
+            if pick["is_captain"] or pick["is_vice_captain"]
+        ]
+
+        # Map all of them in one lookup
+        players_info = map_players((pick["element"] for _, pick in armband_picks), table)
+
+        captain_picks = []
+        for (gw, pick), player_info in zip(armband_picks, players_info):
+            if pick["is_captain"]:
+                captain_picks.append({
+                    "gameweek": gw,
+                    "player_id": player_info.get("id"),
+                    "player_name": player_info.get("name"),
+                    "is_vice_captain": False
+                })
+
+            if pick["is_vice_captain"]:
+                captain_picks.append({
+                    "gameweek": gw,
+                    "player_id": player_info.get("id"),
+                    "player_name": player_info.get("name"),
+                    "is_vice_captain": True
+                })
 
         return captain_picks
 
@@ -1,14 +1,10 @@
 from typing import Literal
 from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
-from fpl_gaffer.settings import settings
-from httpx import AsyncClient
 from typing import Dict
 
 
 class FPLUserProfileManager:
     def __init__(self, api: FPLOfficialAPIClient, manager_id: int):
-        self.base_url = settings.FPL_API_BASE_URL
-        self.session = AsyncClient()
         self.api = api
         self.manager_id = manager_id
 
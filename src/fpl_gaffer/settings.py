@@ -1,3 +1,4 @@
+from typing import Dict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -18,6 +19,64 @@ class Settings(BaseSettings):
 
     # FPL Official API settings
     FPL_API_BASE_URL: str = "https://fantasy.premierleague.com/api"
+    FPL_API_TIMEOUT: float = 10.0
+    FPL_API_HTTP2: bool = True
+    FPL_API_MAX_CONNECTIONS: int = 20
+    FPL_API_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    FPL_API_KEEPALIVE_EXPIRY: float = 30.0
+    # Directory to record raw responses into for offline replay (disabled when unset)
+    FPL_API_RECORD_DIR: str | None = None
+
+    # FPL API request scheduling (rates in requests/second)
+    FPL_API_RATE_LIMIT: float = 10.0
+    FPL_API_RATE_BURST: int = 20
+    FPL_API_MAX_IN_FLIGHT: int = 10
+    FPL_API_MIN_IN_FLIGHT: int = 2
+    FPL_API_LATENCY_TARGET: float = 1.5
+    FPL_API_MAX_RETRIES: int = 3
+    FPL_API_BACKOFF_BASE: float = 0.5
+    FPL_API_BACKOFF_MAX: float = 10.0
+    # Concurrent requests per bulk call (e.g. all gameweeks' picks for a manager)
+    FPL_API_BULK_CONCURRENCY: int = 8
+    # Per-endpoint rates keyed by path with ids collapsed, e.g. "/entry/{id}/event/{id}/picks/". Requests
+    # take a token from the global bucket too, so these only narrow FPL_API_RATE_LIMIT and must be below it;
+    # picks are capped at half so bulk league fetches leave room for other calls
+    FPL_API_ENDPOINT_RATE_LIMITS: Dict[str, float] = {
+        "/entry/{id}/event/{id}/picks/": 5.0,
+    }
+
+    # FPL response cache settings (seconds)
+    FPL_BOOTSTRAP_CACHE_TTL: float = 300.0
+    FPL_FIXTURES_CACHE_TTL: float = 300.0
+    # Objects built from many requests (e.g. league ownership) kept in memory, least recently used evicted
+    FPL_REMEMBERED_CACHE_SIZE: int = 16
+    # Decode only the bootstrap fields the app reads; needs msgspec, otherwise the full payload is decoded
+    FPL_API_FAST_DECODE: bool = True
+
+    # FPL on-disk response store (finished gameweeks are kept forever, the rest for the TTL)
+    FPL_RESPONSE_STORE_ENABLED: bool = True
+    FPL_RESPONSE_STORE_PATH: str = "./src/fpl_gaffer/data/fpl_responses.db"
+    FPL_RESPONSE_STORE_TTL: float = 600.0
+    # Player match history (/element-summary/) only changes once per gameweek
+    FPL_ELEMENT_SUMMARY_TTL: float = 3600.0
+
+    # Live gameweek points poller (seconds between polls of /event/{gw}/live/)
+    FPL_LIVE_POLL_ENABLED: bool = True
+    FPL_LIVE_POLL_INTERVAL: float = 60.0
+    # Pending updates kept per subscriber; the oldest are dropped for slow consumers
+    FPL_LIVE_SUBSCRIBER_QUEUE_SIZE: int = 100
+
+    # Transfer planner (beam width per gameweek; process pool workers sharing that beam, 1 plans in-process)
+    TRANSFER_PLANNER_BEAM_WIDTH: int = 64
+    TRANSFER_PLANNER_WORKERS: int = 1
+
+    # Gameweek simulator (Monte Carlo draws; process pool workers for many squads, None for up to 4 CPUs)
+    SIMULATION_DRAWS: int = 100_000
+    SIMULATION_WORKERS: int | None = None
+
+    # League ownership (members' picks are re-fetched after the TTL until the gameweek is finished)
+    LEAGUE_OWNERSHIP_TTL: float = 600.0
+    LEAGUE_OWNERSHIP_MAX_PAGES: int = 20
 
     # FPL News Search Client settings
     TAVILY_API_KEY: str
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, List, Optional
 from fpl_gaffer.tools.loader import TOOLS, AsyncFPLTool
 from fpl_gaffer.core.exceptions import ToolExecutionError
@@ -30,11 +31,14 @@ class AsyncToolExecutor:
                 task = self.execute_tool(tool_name, **tool_args)
                 tasks.append((tool_name, task))
 
-        # Execute all tasks concurrently
+        # Execute all tasks concurrently, so identical API calls can share one request
+        outcomes = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+
         i = 0
-        for tool_name, task in tasks:
+        for (tool_name, _), result in zip(tasks, outcomes):
             try:
-                result = await task
+                if isinstance(result, Exception):
+                    raise result
 
                 # TODO: handle overwriting same tool names in results dict
                 if tool_name in result:
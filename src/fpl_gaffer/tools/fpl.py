@@ -1,12 +1,19 @@
 from typing import Literal, List, Dict
 from pydantic import BaseModel, Field
-from fpl_gaffer.modules import FPLDataManager, FPLOfficialAPIClient
+from fpl_gaffer.modules import FPLDataManager, get_fpl_api_client
 from fpl_gaffer.core.exceptions import ToolError
+from fpl_gaffer.utils.screener import ScreenMetric
 
 class PlayerByPositionInput(BaseModel):
     """Input schema for the player by position tool."""
     position: Literal["GKP", "DEF", "MID", "FWD"] = Field(..., description="Position to search for. One of: GK, DEF, MID, FWD.")
     max_price: float = Field(15.0, description="Maximum player price to search for in millions.")
+    sort_by: ScreenMetric = Field(
+        "blend",
+        description="Metric to rank players by: blend (form, value, xGI and ICT combined), projected_points "
+                    "(expected points next gameweek), points_per_million, form, ict_index, xgi or total_points."
+    )
+    limit: int = Field(6, ge=1, le=20, description="Number of players to return.")
 
 
 class PlayerDataInput(BaseModel):
@@ -14,6 +21,20 @@ class PlayerDataInput(BaseModel):
     player_names: List[str] = Field(..., description="List of player(s) names to fetch data for.")
 
 
+class FixtureDifficultyInput(BaseModel):
+    """Input schema for the fixture difficulty tool."""
+    num_gameweeks: int = Field(5, ge=1, le=38, description="Number of upcoming gameweeks to rank fixtures over.")
+    decay: float = Field(
+        1.0, gt=0.0, le=1.0, description="Weight multiplier per later gameweek (below 1 favours near fixtures)."
+    )
+
+
+class PlayerHistoryInput(BaseModel):
+    """Input schema for the player history tool."""
+    player_names: List[str] = Field(..., description="List of player(s) names to fetch match history for.")
+    last_n_gameweeks: int = Field(5, description="Number of recent gameweeks to return.")
+
+
 class FixturesForRangeInput(BaseModel):
     """Input schema for the fixtures for range tool."""
     num_gameweeks: int = Field(..., description="Number of upcoming gameweeks to fetch fixtures for.")
@@ -21,21 +42,23 @@ class FixturesForRangeInput(BaseModel):
 
 async def get_players_by_position_tool(
     position: Literal["GKP", "DEF", "MID", "FWD"],
-    max_price: float
+    max_price: float,
+    sort_by: ScreenMetric = "blend",
+    limit: int = 6
 ) -> List[Dict]:
-    """Get players by position and max price."""
-    api = FPLOfficialAPIClient()
+    """Get the best players by position and max price."""
+    api = get_fpl_api_client()
     data_manager = FPLDataManager(api)
 
     try:
-        players = await data_manager.get_players_by_position(position, max_price)
+        players = await data_manager.get_players_by_position(position, max_price, sort_by, limit)
         return players
     except Exception as e:
         raise ToolError(f"Error while using player by position tool: {e}") from e
 
 async def get_player_data_tool(player_names: List[str]) -> List[Dict]:
     """Get detailed player data including stats, form, and injuries."""
-    api = FPLOfficialAPIClient()
+    api = get_fpl_api_client()
     data_manager = FPLDataManager(api)
 
     try:
@@ -44,9 +67,20 @@ async def get_player_data_tool(player_names: List[str]) -> List[Dict]:
     except Exception as e:
         raise ToolError(f"Error while using player data tool: {e}") from e
 
+async def get_player_history_tool(player_names: List[str], last_n_gameweeks: int = 5) -> List[Dict]:
+    """Get recent gameweek-by-gameweek history and next fixtures for specific player(s)."""
+    api = get_fpl_api_client()
+    data_manager = FPLDataManager(api)
+
+    try:
+        player_history = await data_manager.get_player_history(player_names, last_n_gameweeks)
+        return player_history
+    except Exception as e:
+        raise ToolError(f"Error while using player history tool: {e}") from e
+
 async def get_fixtures_for_range_tool(num_gameweeks: int) -> Dict:
     """Get fixtures from the current gameweek to the next x gameweeks."""
-    api = FPLOfficialAPIClient()
+    api = get_fpl_api_client()
     data_manager = FPLDataManager(api)
 
     try:
@@ -54,3 +88,14 @@ async def get_fixtures_for_range_tool(num_gameweeks: int) -> Dict:
         return fixtures
     except Exception as e:
         raise ToolError(f"Error while using fixtures for range tool: {e}") from e
+
+async def get_fixture_difficulty_tool(num_gameweeks: int = 5, decay: float = 1.0) -> Dict:
+    """Rank every team by fixture difficulty over the next x gameweeks."""
+    api = get_fpl_api_client()
+    data_manager = FPLDataManager(api)
+
+    try:
+        difficulty = await data_manager.get_fixture_difficulty(num_gameweeks, decay)
+        return difficulty
+    except Exception as e:
+        raise ToolError(f"Error while using fixture difficulty tool: {e}") from e
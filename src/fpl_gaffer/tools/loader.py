@@ -5,10 +5,15 @@ from pydantic import BaseModel, ConfigDict
 from langchain.tools import Tool, BaseTool
 from fpl_gaffer.core.exceptions import ToolExecutionError
 from fpl_gaffer.tools.news import news_search_tool, NewsSearchInput
-from fpl_gaffer.tools.user import get_user_team_info_tool, UserTeamInfoInput
+from fpl_gaffer.tools.user import (
+    get_user_team_info_tool, UserTeamInfoInput, get_optimal_squad_tool, OptimalSquadInput,
+    get_transfer_plan_tool, TransferPlanInput, simulate_gameweek_tool, SimulationInput,
+    get_league_rivals_tool, LeagueRivalsInput, get_effective_points_tool, EffectivePointsInput
+)
 from fpl_gaffer.tools.fpl import (
     PlayerDataInput, PlayerByPositionInput, get_players_by_position_tool, get_player_data_tool,
-    FixturesForRangeInput, get_fixtures_for_range_tool
+    FixturesForRangeInput, get_fixtures_for_range_tool, PlayerHistoryInput, get_player_history_tool,
+    FixtureDifficultyInput, get_fixture_difficulty_tool
 )
 
 
@@ -95,9 +100,10 @@ def create_tools() -> List[AsyncFPLTool]:
         ),
         AsyncFPLTool(
             name="get_players_by_position_tool",
-            description="Get players by position and max price. Use this when you need information for player "
+            description="Get the best available players by position and max price, ranked by a metric "
+                        "(sort_by) and capped at limit. Use this when you need information for player "
                         "replacements or transfer suggestions based on position and budget. Use position short forms "
-                        "like GKP, DEF, MID, FWD.000",
+                        "like GKP, DEF, MID, FWD.",
             func=get_players_by_position_tool,
             args_schema=PlayerByPositionInput
         ),
@@ -108,12 +114,72 @@ def create_tools() -> List[AsyncFPLTool]:
             func=get_player_data_tool,
             args_schema=PlayerDataInput
         ),
+        AsyncFPLTool(
+            name="get_player_history_tool",
+            description="Get gameweek-by-gameweek match history (points, minutes, goals, assists, bonus, xG...) "
+                        "and next fixtures for specific players. Use this when you need a player's recent form "
+                        "rather than season totals.",
+            func=get_player_history_tool,
+            args_schema=PlayerHistoryInput
+        ),
         AsyncFPLTool(
             name="get_fixtures_for_range_tool",
             description="Get fixtures from the current gameweek to the next x gameweeks. Use this when you need "
                         "information about upcoming fixtures or planning for future gameweeks.",
             func=get_fixtures_for_range_tool,
             args_schema=FixturesForRangeInput
+        ),
+        AsyncFPLTool(
+            name="get_fixture_difficulty_tool",
+            description="Get every team ranked by how easy its fixtures are over the next x gameweeks, with "
+                        "blanks and doubles counted. Use this when planning transfers, wildcards or chips around "
+                        "fixture runs instead of reading full fixture lists.",
+            func=get_fixture_difficulty_tool,
+            args_schema=FixtureDifficultyInput
+        ),
+        AsyncFPLTool(
+            name="get_optimal_squad_tool",
+            description="Build the best 15-man squad (2 GKP, 5 DEF, 5 MID, 3 FWD, max 3 per club) for the user's "
+                        "budget by projected points, with starting XI, bench and captain. Use this when the user "
+                        "plays or plans a wildcard or free hit, or asks for the best possible squad.",
+            func=get_optimal_squad_tool,
+            args_schema=OptimalSquadInput
+        ),
+        AsyncFPLTool(
+            name="get_transfer_plan_tool",
+            description="Plan the user's transfers over the next x gameweeks, weighing rolled free transfers "
+                        "against -4 hits, with ranked plans of who to sell and buy each gameweek and their projected "
+                        "points gain. Use this when the user asks who to transfer in or out, or whether to roll a "
+                        "transfer or take a hit.",
+            func=get_transfer_plan_tool,
+            args_schema=TransferPlanInput
+        ),
+        AsyncFPLTool(
+            name="simulate_gameweek_tool",
+            description="Simulate the user's points next gameweek, with percentile outcomes, captain choices ranked "
+                        "by expected points and risk, and the chance of beating each rival. Use this when the user "
+                        "asks about captaincy, their range of outcomes, or their chances in a head-to-head or "
+                        "mini-league battle.",
+            func=simulate_gameweek_tool,
+            args_schema=SimulationInput
+        ),
+        AsyncFPLTool(
+            name="get_league_rivals_tool",
+            description="Compare the user's squad with every member of a mini-league: effective ownership "
+                        "(captaincy included), the user's differentials and threats, low-owned transfer targets, "
+                        "and overlap and projected points swing against the rivals nearest in rank. Use this when "
+                        "the user asks who to differential against their league or how their squad compares.",
+            func=get_league_rivals_tool,
+            args_schema=LeagueRivalsInput
+        ),
+        AsyncFPLTool(
+            name="get_effective_points_tool",
+            description="Get the user's points in each of the last x gameweeks as actually scored: after "
+                        "auto-subs, the vice-captain stepping in and transfer hits, with the subs made. Pass "
+                        "rival_ids to compare the same for rivals. Use this when the user asks why they scored what "
+                        "they did, which subs came on, or how they and their rivals have done recently.",
+            func=get_effective_points_tool,
+            args_schema=EffectivePointsInput
         )
     ]
 
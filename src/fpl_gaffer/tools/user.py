@@ -1,6 +1,7 @@
-from typing import Dict, Optional
+from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
-from fpl_gaffer.modules import FPLTeamDataManger, FPLOfficialAPIClient
+from fpl_gaffer.modules import FPLDataManager, FPLTeamDataManger, get_fpl_api_client
+from fpl_gaffer.modules.fpl import FPLLeagueOwnership
 from fpl_gaffer.core.exceptions import ToolError
 
 
@@ -10,9 +11,55 @@ class UserTeamInfoInput(BaseModel):
     gameweek: int = Field(..., description="The current gameweek number to fetch data for.")
 
 
+class OptimalSquadInput(BaseModel):
+    """Input schema for the optimal squad tool."""
+    manager_id: int = Field(..., description="The user's FPL manager ID.")
+    gameweek: int = Field(..., description="The current gameweek number.")
+    chip: Literal["wildcard", "free_hit"] = Field(
+        "wildcard", description="Chip to build the squad for: wildcard (several gameweeks) or free_hit (one gameweek)."
+    )
+    num_gameweeks: Optional[int] = Field(
+        None, ge=1, le=10, description="Gameweeks to plan over. Defaults to 5 for wildcard and 1 for free_hit."
+    )
+    budget: Optional[float] = Field(
+        None, description="Budget in millions. Defaults to the user's money in the bank plus squad value."
+    )
+
+
+class TransferPlanInput(BaseModel):
+    """Input schema for the transfer plan tool."""
+    manager_id: int = Field(..., description="The user's FPL manager ID.")
+    gameweek: int = Field(..., description="The current gameweek number.")
+    num_gameweeks: int = Field(3, ge=1, le=8, description="Number of upcoming gameweeks to plan transfers over.")
+    max_transfers: int = Field(2, ge=1, le=3, description="Most transfers to make in any one gameweek.")
+
+
+class SimulationInput(BaseModel):
+    """Input schema for the gameweek simulation tool."""
+    manager_id: int = Field(..., description="The user's FPL manager ID.")
+    gameweek: int = Field(..., description="The current gameweek number.")
+    rival_ids: List[int] = Field(default_factory=list, description="FPL manager IDs of rivals to compare against.")
+    seed: Optional[int] = Field(None, description="Random seed, to repeat a simulation exactly.")
+
+
+class EffectivePointsInput(BaseModel):
+    """Input schema for the effective points tool."""
+    manager_id: int = Field(..., description="The user's FPL manager ID.")
+    gameweek: int = Field(..., description="The current gameweek number.")
+    last_n_gameweeks: int = Field(5, ge=1, le=38, description="Number of most recent gameweeks to score.")
+    rival_ids: List[int] = Field(default_factory=list, description="FPL manager IDs of rivals to compare against.")
+
+
+class LeagueRivalsInput(BaseModel):
+    """Input schema for the league rivals tool."""
+    manager_id: int = Field(..., description="The user's FPL manager ID.")
+    league_id: int = Field(..., description="The classic mini-league ID.")
+    gameweek: int = Field(..., description="The current gameweek number.")
+
+
 async def get_user_team_info_tool(manager_id: int, gameweek: int) -> Dict:
     """Get user team information like budget, squad, transfers, etc."""
-    api = FPLOfficialAPIClient()
+    api = get_fpl_api_client()
     team_manager = FPLTeamDataManger(api, manager_id, (gameweek - 1))
 
     try:
@@ -20,3 +67,95 @@ async def get_user_team_info_tool(manager_id: int, gameweek: int) -> Dict:
         return team_data
     except Exception as e:
         raise ToolError(f"Error while using user team info tool: {e}") from e
+
+
+async def get_optimal_squad_tool(
+    manager_id: int,
+    gameweek: int,
+    chip: Literal["wildcard", "free_hit"] = "wildcard",
+    num_gameweeks: Optional[int] = None,
+    budget: Optional[float] = None
+) -> Dict:
+    """Build the best wildcard/free hit squad for the user's budget."""
+    api = get_fpl_api_client()
+
+    try:
+        if budget is None:
+            # Picks of the previous gameweek carry the latest bank and squad value
+            squad = await FPLTeamDataManger(api, manager_id, (gameweek - 1)).get_team_snapshot(sections=())
+            if squad is None:
+                raise ToolError(f"No squad found for manager {manager_id}")
+            budget = round(squad.money_itb + squad.squad_value, 1)
+
+        if num_gameweeks is None:
+            num_gameweeks = 1 if chip == "free_hit" else 5
+
+        return await FPLDataManager(api).optimize_squad(budget, num_gameweeks)
+    except ToolError:
+        raise
+    except Exception as e:
+        raise ToolError(f"Error while using optimal squad tool: {e}") from e
+
+
+async def get_transfer_plan_tool(
+    manager_id: int,
+    gameweek: int,
+    num_gameweeks: int = 3,
+    max_transfers: int = 2
+) -> Dict:
+    """Plan the user's transfers over the next few gameweeks."""
+    api = get_fpl_api_client()
+    team_manager = FPLTeamDataManger(api, manager_id, (gameweek - 1))
+
+    try:
+        return await team_manager.plan_transfers(num_gameweeks, max_transfers)
+    except Exception as e:
+        raise ToolError(f"Error while using transfer plan tool: {e}") from e
+
+
+async def simulate_gameweek_tool(
+    manager_id: int,
+    gameweek: int,
+    rival_ids: Optional[List[int]] = None,
+    seed: Optional[int] = None
+) -> Dict:
+    """Simulate the user's points next gameweek, their captain choices and their chances against rivals."""
+    api = get_fpl_api_client()
+    team_manager = FPLTeamDataManger(api, manager_id, (gameweek - 1))
+
+    try:
+        return await team_manager.simulate_gameweek(rival_ids or (), seed=seed)
+    except Exception as e:
+        raise ToolError(f"Error while using gameweek simulation tool: {e}") from e
+
+
+async def get_effective_points_tool(
+    manager_id: int,
+    gameweek: int,
+    last_n_gameweeks: int = 5,
+    rival_ids: Optional[List[int]] = None
+) -> Dict:
+    """Get the user's (and rivals') points per gameweek after auto-subs, captaincy fallback and hits."""
+    api = get_fpl_api_client()
+    last_gw = gameweek - 1
+    team_manager = FPLTeamDataManger(api, manager_id, last_gw)
+
+    try:
+        if last_gw < 1:
+            raise ToolError("No gameweeks have been played yet")
+        gameweeks = range(max(1, last_gw - last_n_gameweeks + 1), last_gw + 1)
+        return await team_manager.get_effective_points(gameweeks, rival_ids or ())
+    except ToolError:
+        raise
+    except Exception as e:
+        raise ToolError(f"Error while using effective points tool: {e}") from e
+
+
+async def get_league_rivals_tool(manager_id: int, league_id: int, gameweek: int) -> Dict:
+    """Compare the user's squad with their mini-league: effective ownership, differentials and rival overlap."""
+    api = get_fpl_api_client()
+
+    try:
+        return await FPLLeagueOwnership(api).rival_report(league_id, manager_id, (gameweek - 1))
+    except Exception as e:
+        raise ToolError(f"Error while using league rivals tool: {e}") from e
@@ -1,7 +1,22 @@
 from .fpl_mapper import *
+from .player_table import PlayerTable
+from .name_index import PlayerNameIndex
+from .fixture_index import FixtureIndex
+from .difficulty import DifficultyMatrix
+from .projections import ProjectionMatrix
+from .records import Player, Pick, Squad
 
 __all__ = [
     "build_mappings",
     "map_squad",
-    "map_player"
+    "map_player",
+    "map_players",
+    "PlayerTable",
+    "PlayerNameIndex",
+    "FixtureIndex",
+    "DifficultyMatrix",
+    "ProjectionMatrix",
+    "Player",
+    "Pick",
+    "Squad"
 ]
\ No newline at end of file
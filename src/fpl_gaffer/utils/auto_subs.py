@@ -0,0 +1,152 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+SQUAD_SIZE = 15
+STARTERS = 11
+
+# Fewest players of each position (indexed by element_type) a starting XI may have: 1 GKP, 3 DEF, 2 MID, 1 FWD
+FORMATION_MINIMUMS = np.array([0, 1, 3, 2, 1], dtype=np.int8)
+
+
+@dataclass(frozen=True)
+class AutoSubResult:
+    """
+    Outcome of auto-substitutions for a batch of squads.
+
+    All (n, 15) arrays are in squad position order. `multipliers` are the
+    effective ones after subs and the captaincy fallback, `replaced_by[i, s]`
+    is the bench slot that came on for starter slot `s` (-1 if none) and
+    `points` is each squad's effective points.
+    """
+    multipliers: np.ndarray
+    replaced_by: np.ndarray
+    points: np.ndarray
+
+    def subs(self, row: int) -> List[Dict[str, int]]:
+        """Substitutions of one squad as (slot_out, slot_in) pairs, 0-based, in the order they were made."""
+        slots = np.flatnonzero(self.replaced_by[row] >= 0)
+        return [{"slot_out": int(slot), "slot_in": int(self.replaced_by[row, slot])} for slot in slots]
+
+
+def stack_picks(picks_payloads: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Stack gameweek picks payloads into (n, 15) arrays in squad position order.
+
+    Returns "element", "multiplier", "is_captain" and "is_vice_captain"
+    arrays plus a (n,) "bench_boost" flag. Short squads are padded with
+    element 0, which matches no player.
+    """
+    n = len(picks_payloads)
+    element = np.zeros((n, SQUAD_SIZE), dtype=np.int32)
+    multiplier = np.zeros((n, SQUAD_SIZE), dtype=np.int8)
+    is_captain = np.zeros((n, SQUAD_SIZE), dtype=bool)
+    is_vice_captain = np.zeros((n, SQUAD_SIZE), dtype=bool)
+    bench_boost = np.zeros(n, dtype=bool)
+
+    for i, payload in enumerate(picks_payloads):
+        bench_boost[i] = payload.get("active_chip") == "bboost"
+        for pick in payload.get("picks", []):
+            slot = pick["position"] - 1
+            if 0 <= slot < SQUAD_SIZE:
+                element[i, slot] = pick["element"]
+                multiplier[i, slot] = pick["multiplier"]
+                is_captain[i, slot] = pick["is_captain"]
+                is_vice_captain[i, slot] = pick["is_vice_captain"]
+
+    return {
+        "element": element,
+        "multiplier": multiplier,
+        "is_captain": is_captain,
+        "is_vice_captain": is_vice_captain,
+        "bench_boost": bench_boost,
+    }
+
+
+def apply_auto_subs(
+    element_type: np.ndarray,
+    points: np.ndarray,
+    minutes: np.ndarray,
+    multiplier: np.ndarray,
+    is_captain: np.ndarray,
+    is_vice_captain: np.ndarray,
+    done: Optional[np.ndarray] = None,
+    bench_boost: Optional[np.ndarray] = None
+) -> AutoSubResult:
+    """
+    Apply the official auto-substitution rules to a batch of squads.
+
+    Inputs are (n, 15) arrays in squad position order (bench_boost is (n,)).
+    A starter is absent when they got no minutes and `done` (all their team's
+    fixtures finished, True by default) is set. Absent starters are handled in
+    squad order: the goalkeeper can only be replaced by the bench goalkeeper,
+    outfield players by the first outfield bench player, in bench order, who
+    played and keeps the XI at least 3 DEF, 2 MID and 1 FWD. If the captain is
+    absent the vice captain takes the captain's multiplier. Bench Boost squads
+    score all 15 players and make no subs.
+
+    Each rule step is one array operation over all squads, so the cost is a
+    fixed ~35 vectorized steps however many squads (managers x gameweeks) are
+    stacked.
+    """
+    n = len(points)
+    rows = np.arange(n)
+    element_type = element_type.astype(np.int8)
+    played = minutes > 0
+    absent = ~played if done is None else ~played & done
+    bench_boost = np.zeros(n, dtype=bool) if bench_boost is None else bench_boost
+    subbing = ~bench_boost
+
+    in_xi = np.zeros((n, SQUAD_SIZE), dtype=bool)
+    in_xi[:, :STARTERS] = True
+    in_xi[bench_boost] = True
+    replaced_by = np.full((n, SQUAD_SIZE), -1, dtype=np.int8)
+
+    # Players of each position in the XI
+    counts = np.stack(
+        [((element_type == position) & in_xi).sum(axis=1) for position in range(len(FORMATION_MINIMUMS))], axis=1
+    )
+
+    def swap(mask: np.ndarray, slot_out: int, slot_in: int):
+        in_xi[mask, slot_out] = False
+        in_xi[mask, slot_in] = True
+        replaced_by[mask, slot_out] = slot_in
+        counts[rows[mask], element_type[mask, slot_out]] -= 1
+        counts[rows[mask], element_type[mask, slot_in]] += 1
+
+    # Goalkeeper for goalkeeper, using the first bench slot
+    gk_bench = STARTERS
+    swap(
+        subbing & absent[:, 0] & (element_type[:, 0] == 1) & played[:, gk_bench] & (element_type[:, gk_bench] == 1),
+        0, gk_bench
+    )
+
+    # Outfield starters in squad order, each taking the first valid outfield bench player
+    for slot_out in range(1, STARTERS):
+        position_out = element_type[:, slot_out]
+        needed = subbing & absent[:, slot_out] & (position_out != 1)
+        keeps_formation = counts[rows, position_out] > FORMATION_MINIMUMS[position_out]
+
+        for slot_in in range(STARTERS + 1, SQUAD_SIZE):
+            position_in = element_type[:, slot_in]
+            swaps = (
+                needed & played[:, slot_in] & ~in_xi[:, slot_in] & (position_in > 1)
+                & ((position_in == position_out) | keeps_formation)
+            )
+            swap(swaps, slot_out, slot_in)
+            needed &= ~swaps
+
+    # Captaincy passes to the vice captain when the captain is absent. The multiplier is 2, or 3 with
+    # Triple Captain, read from either armband since finished gameweeks may already show it on the vice
+    captain_multiplier = np.maximum(np.where(is_captain | is_vice_captain, multiplier, 0).max(axis=1), 2)
+    captain_absent = (is_captain & absent).any(axis=1)
+    armband = np.where(captain_absent[:, None], is_vice_captain, is_captain) & in_xi
+
+    multipliers = in_xi.astype(np.int8)
+    multipliers[armband] = np.broadcast_to(captain_multiplier[:, None], armband.shape)[armband]
+
+    return AutoSubResult(
+        multipliers=multipliers,
+        replaced_by=replaced_by,
+        points=(points.astype(np.int32) * multipliers).sum(axis=1),
+    )
@@ -0,0 +1,126 @@
+import numpy as np
+from typing import Dict, List, Optional
+from fpl_gaffer.utils.fixture_index import FixtureIndex
+
+# Share of the team-strength rating in a fixture's difficulty (the rest is the official FDR)
+STRENGTH_WEIGHT = 0.5
+
+
+class DifficultyMatrix:
+    """
+    Team-by-gameweek fixture difficulty.
+
+    `difficulty[team_id, gameweek]` is the mean difficulty (1 easy - 5 hard) of
+    a team's fixtures that gameweek, NaN for a blank. `ease[team_id, gameweek]`
+    sums (6 - difficulty) over the fixtures, so a double counts twice and a
+    blank counts nothing; horizon scores are sums of `ease`, higher is better.
+    Each fixture's difficulty blends the official FDR with a rating from the
+    opponent's bootstrap strength at that venue. Build once per bootstrap and
+    fixtures payload.
+    """
+
+    def __init__(self, fixture_index: FixtureIndex, bootstrap_data: Dict):
+        teams = bootstrap_data.get("teams", [])
+        n_teams = max([t["id"] for t in teams] + list(fixture_index.by_team), default=0)
+        shape = (n_teams + 1, fixture_index.n_gameweeks + 1)
+
+        self.team_ids = sorted(t["id"] for t in teams) or fixture_index.team_ids
+        self.short_names = {t["id"]: t.get("short_name", str(t["id"])) for t in teams}
+        self.n_gameweeks = fixture_index.n_gameweeks
+        self.fixture_index = fixture_index
+
+        strength_rating = self._strength_ratings(teams, n_teams)
+        ease = np.zeros(shape, dtype=np.float32)
+        total = np.zeros(shape, dtype=np.float32)
+
+        for fixture in fixture_index.fixtures:
+            gw = fixture.get("event")
+            if gw is None:
+                continue
+
+            home, away = fixture["team_h"], fixture["team_a"]
+            # The home team faces the away side's away strength and vice versa
+            home_difficulty = self._blend(fixture.get("team_h_difficulty"), strength_rating["away"][away])
+            away_difficulty = self._blend(fixture.get("team_a_difficulty"), strength_rating["home"][home])
+
+            total[home, gw] += home_difficulty
+            total[away, gw] += away_difficulty
+            ease[home, gw] += 6 - home_difficulty
+            ease[away, gw] += 6 - away_difficulty
+
+        counts = fixture_index.counts[:, :shape[1]]
+        if counts.shape[0] < shape[0]:
+            counts = np.vstack([counts, np.zeros((shape[0] - counts.shape[0], shape[1]), dtype=counts.dtype)])
+
+        self.counts = counts
+        self.ease = ease
+        self.difficulty = np.divide(
+            total, counts, out=np.full(shape, np.nan, dtype=np.float32), where=counts > 0
+        )
+
+    def horizon_scores(self, start: int, num_gameweeks: int, decay: float = 1.0) -> np.ndarray:
+        """
+        Ease of every team's fixtures over `num_gameweeks` from `start`, indexed by team id.
+
+        With decay < 1 each later gameweek is weighted by decay ** offset, so near
+        fixtures count more.
+        """
+        start = max(1, start)
+        end = min(self.n_gameweeks, start + num_gameweeks - 1)
+        if end < start:
+            return np.zeros(self.ease.shape[0], dtype=np.float32)
+
+        weights = decay ** np.arange(end - start + 1, dtype=np.float32)
+        return self.ease[:, start:end + 1] @ weights
+
+    def ranked_table(self, start: int, num_gameweeks: int, decay: float = 1.0) -> List[Dict]:
+        """Teams ranked by horizon score (easiest first) with a compact fixture summary."""
+        scores = self.horizon_scores(start, num_gameweeks, decay)
+        end = min(self.n_gameweeks, start + num_gameweeks - 1)
+        gameweeks = range(max(1, start), end + 1)
+
+        team_ids = sorted(self.team_ids, key=lambda t: (-scores[t], t))
+        return [
+            {
+                "rank": rank,
+                "team": self.short_names.get(team_id, str(team_id)),
+                "score": round(float(scores[team_id]), 1),
+                "fixtures": " ".join(self._gameweek_summary(team_id, gw) for gw in gameweeks),
+                "blanks": int(np.sum(self.counts[team_id, gameweeks.start:gameweeks.stop] == 0)),
+                "doubles": int(np.sum(self.counts[team_id, gameweeks.start:gameweeks.stop] >= 2)),
+            }
+            for rank, team_id in enumerate(team_ids, 1)
+        ]
+
+    def _gameweek_summary(self, team_id: int, gw: int) -> str:
+        """E.g. "CHE(H)" for a single fixture, "MCI(A)+LIV(H)" for a double, "-" for a blank."""
+        opponents = []
+        for fixture in self.fixture_index.gameweek(gw):
+            if fixture["team_h"] == team_id:
+                opponents.append(f"{self.short_names.get(fixture['team_a'], '?')}(H)")
+            elif fixture["team_a"] == team_id:
+                opponents.append(f"{self.short_names.get(fixture['team_h'], '?')}(A)")
+        return "+".join(opponents) or "-"
+
+    @staticmethod
+    def _blend(fdr: Optional[int], strength_rating: float) -> float:
+        if not fdr:
+            return strength_rating
+        return (1 - STRENGTH_WEIGHT) * fdr + STRENGTH_WEIGHT * strength_rating
+
+    @staticmethod
+    def _strength_ratings(teams: List[Dict], n_teams: int) -> Dict[str, np.ndarray]:
+        """Overall home/away strength rescaled to the 1-5 difficulty range, indexed by team id."""
+        ratings = {}
+        for venue in ("home", "away"):
+            rating = np.full(n_teams + 1, 3.0, dtype=np.float32)
+            strengths = {t["id"]: t.get(f"strength_overall_{venue}") for t in teams}
+            values = np.array([v for v in strengths.values() if v], dtype=np.float32)
+
+            if len(values) and values.max() > values.min():
+                low, high = values.min(), values.max()
+                for team_id, value in strengths.items():
+                    if value:
+                        rating[team_id] = 1 + 4 * (value - low) / (high - low)
+            ratings[venue] = rating
+        return ratings
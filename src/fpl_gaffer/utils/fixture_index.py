@@ -0,0 +1,80 @@
+import bisect
+import numpy as np
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+class FixtureIndex:
+    """
+    Fixtures grouped by gameweek and by team.
+
+    `counts[team_id, gameweek]` is the number of fixtures a team has in a
+    gameweek, so 0 marks a blank and 2+ a double. Unscheduled fixtures
+    (event None) are kept under gameweek None and left out of `counts`.
+    Build once per fixtures payload and treat as read-only.
+    """
+
+    def __init__(self, fixtures: List[Dict]):
+        self.fixtures = fixtures
+        self.by_gameweek: Dict[Optional[int], List[Dict]] = defaultdict(list)
+        self.by_team: Dict[int, List[Dict]] = defaultdict(list)
+
+        for fixture in fixtures:
+            self.by_gameweek[fixture.get("event")].append(fixture)
+            self.by_team[fixture["team_h"]].append(fixture)
+            self.by_team[fixture["team_a"]].append(fixture)
+
+        # Team fixtures in gameweek order, unscheduled ones last
+        for team_fixtures in self.by_team.values():
+            team_fixtures.sort(key=lambda f: (f.get("event") is None, f.get("event") or 0, f.get("kickoff_time") or ""))
+        self._team_events = {
+            team: [f.get("event") or np.iinfo(np.int32).max for f in team_fixtures]
+            for team, team_fixtures in self.by_team.items()
+        }
+
+        self.n_gameweeks = max((gw for gw in self.by_gameweek if gw is not None), default=0)
+        self.counts = np.zeros((max(self.by_team, default=0) + 1, self.n_gameweeks + 1), dtype=np.int8)
+        for gw, gw_fixtures in self.by_gameweek.items():
+            if gw is None:
+                continue
+            for fixture in gw_fixtures:
+                self.counts[fixture["team_h"], gw] += 1
+                self.counts[fixture["team_a"], gw] += 1
+
+    @property
+    def team_ids(self) -> List[int]:
+        return sorted(self.by_team)
+
+    def gameweek(self, gameweek: int) -> List[Dict]:
+        """Fixtures of one gameweek."""
+        return self.by_gameweek.get(gameweek, [])
+
+    def gameweek_range(self, start: int, end: int) -> List[Dict]:
+        """Fixtures from gameweek `start` to `end` inclusive, in gameweek order."""
+        return [fixture for gw in range(start, end + 1) for fixture in self.by_gameweek.get(gw, [])]
+
+    def team_fixtures(self, team_id: int, from_gameweek: int = 1, count: Optional[int] = None) -> List[Dict]:
+        """A team's fixtures from a gameweek on, optionally only the next `count`."""
+        start = bisect.bisect_left(self._team_events.get(team_id, []), from_gameweek)
+        team_fixtures = self.by_team.get(team_id, [])[start:]
+        return team_fixtures if count is None else team_fixtures[:count]
+
+    def blank_teams(self, gameweek: int) -> List[int]:
+        """Teams without a fixture in a gameweek."""
+        if not 1 <= gameweek <= self.n_gameweeks:
+            return []
+        return [team for team in self.team_ids if self.counts[team, gameweek] == 0]
+
+    def double_teams(self, gameweek: int) -> List[int]:
+        """Teams with two or more fixtures in a gameweek."""
+        if not 1 <= gameweek <= self.n_gameweeks:
+            return []
+        return np.flatnonzero(self.counts[:, gameweek] >= 2).tolist()
+
+    def finished_teams(self, gameweek: int) -> np.ndarray:
+        """Whether each team (by id) has finished all its fixtures in a gameweek; blanking teams count as finished."""
+        finished = np.ones(self.counts.shape[0], dtype=bool)
+        for fixture in self.gameweek(gameweek):
+            if not (fixture.get("finished") or fixture.get("finished_provisional")):
+                finished[[fixture["team_h"], fixture["team_a"]]] = False
+        return finished
@@ -1,4 +1,5 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Iterable
+from fpl_gaffer.utils.player_table import PlayerTable
 
 def build_mappings(boostrap_data: Dict) -> Tuple[Dict, Dict, Dict]:
     """Build mappings for players, teams, and positions from bootstrap data."""
@@ -25,45 +26,27 @@ def build_mappings(boostrap_data: Dict) -> Tuple[Dict, Dict, Dict]:
 
     return players_mapping, teams_mapping, positions_mapping
 
-def map_player(
-    player_id: int,
-    players: Dict,
-    teams: Dict,
-    positions: Dict
-) -> Dict:
+def map_player(player_id: int, table: PlayerTable) -> Dict:
     """Map a player ID to detailed player information."""
-    player_info = players.get(player_id, {})
+    return table.records([player_id])[0]
 
-    if not player_info:
-        return {}
+def map_players(player_ids: Iterable[int], table: PlayerTable) -> List[Dict]:
+    """Map a list of player IDs to detailed player information in one lookup."""
+    return table.records(player_ids)
 
-    return {
-        "id": player_id,
-        "name": player_info["name"],
-        "team": teams.get(player_info["team_id"], "Unknown Team"),
-        "position": positions.get(player_info["position_id"], "Unknown Position"),
-        "current_price": player_info["current_price"],
-        "status": player_info["status"]
-    }
-
-def map_squad(
-    picks: Dict,
-    players: Dict,
-    teams: Dict,
-    positions: Dict
-) -> List[Dict]:
+def map_squad(picks: List[Dict], table: PlayerTable) -> List[Dict]:
     """
     Map a list of player IDs to detailed player information.
     Expects 'picks' data from FPLOfficialAPI.get_gameweek_picks()
     """
-    mapped_team = []
+    players = table.records(pick["element"] for pick in picks)
 
-    for pick in picks:
-        mapped_team.append({
-            **map_player(pick["element"], players, teams, positions),
+    return [
+        {
+            **player_info,
             "multiplier": pick["multiplier"],
             "is_captain": pick.get("is_captain", False),
             "is_vice_captain": pick.get("is_vice_captain", False),
-        })
-
-    return mapped_team
\ No newline at end of file
+        }
+        for pick, player_info in zip(picks, players)
+    ]
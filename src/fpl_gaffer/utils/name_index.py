@@ -0,0 +1,136 @@
+import re
+import bisect
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Tuple, Set
+
+# Letters NFKD does not decompose into a base letter + accent
+_FOLD_EXTRA = str.maketrans({
+    "ø": "o", "đ": "d", "ł": "l", "ı": "i", "ß": "ss", "æ": "ae", "œ": "oe", "þ": "th", "ð": "d",
+})
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Match scores per query token
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.8
+FUZZY_WEIGHT = 0.7
+# Minimum trigram similarity (Dice coefficient) for a fuzzy match
+FUZZY_THRESHOLD = 0.45
+
+
+def fold_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation: "Martin Ødegaard" -> "martin odegaard"."""
+    decomposed = unicodedata.normalize("NFKD", name.lower().translate(_FOLD_EXTRA))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped).strip()
+
+
+def trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerNameIndex:
+    """
+    Search index over first, second and web names of the bootstrap players.
+
+    Names are accent-folded and tokenized; each query token is matched exactly,
+    then as a prefix, then by trigram similarity, and players are ranked by the
+    summed scores of the query tokens. Rows follow the bootstrap elements order.
+    Build once per bootstrap payload.
+    """
+
+    def __init__(self, bootstrap_data: Dict):
+        elements = bootstrap_data.get("elements", [])
+
+        # Folded full names, for a bonus when a query names the player exactly
+        self.full_names: List[Set[str]] = []
+        postings: Dict[str, Set[int]] = defaultdict(set)
+
+        for row, player in enumerate(elements):
+            first = fold_name(player.get("first_name", ""))
+            second = fold_name(player.get("second_name", ""))
+            web = fold_name(player.get("web_name", ""))
+
+            self.full_names.append({f"{first} {second}", second, web})
+            for token in f"{first} {second} {web}".split():
+                postings[token].add(row)
+
+        self.tokens: List[str] = sorted(postings)
+        self.postings: List[Tuple[int, ...]] = [tuple(sorted(postings[t])) for t in self.tokens]
+
+        self.token_trigrams: List[int] = []
+        self.trigram_tokens: Dict[str, List[int]] = defaultdict(list)
+        for token_id, token in enumerate(self.tokens):
+            grams = trigrams(token)
+            self.token_trigrams.append(len(grams))
+            for gram in grams:
+                self.trigram_tokens[gram].append(token_id)
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[int, float]]:
+        """Rank players for a name query, as (row, score) best first."""
+        folded = fold_name(query)
+        query_tokens = folded.split()
+        if not query_tokens:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, int] = defaultdict(int)
+        for token in query_tokens:
+            # Best score per row for this query token
+            token_scores: Dict[int, float] = {}
+            for token_id, score in self._match_token(token):
+                for row in self.postings[token_id]:
+                    if score > token_scores.get(row, 0.0):
+                        token_scores[row] = score
+
+            for row, score in token_scores.items():
+                scores[row] += score
+                matched[row] += 1
+
+        # Prefer rows matching every query token, e.g. both "mohamed" and "salah"
+        most_matched = max(matched.values(), default=0)
+        ranked = [
+            (row, score + (EXACT_SCORE if folded in self.full_names[row] else 0.0))
+            for row, score in scores.items() if matched[row] == most_matched
+        ]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def search_many(self, queries: List[str], limit: int = 5) -> List[int]:
+        """Best matching rows for each query (ties included), deduplicated in query order."""
+        rows: Dict[int, None] = {}
+        for query in queries:
+            ranked = self.search(query, limit)
+            if ranked:
+                best = ranked[0][1]
+                rows.update((row, None) for row, score in ranked if score == best)
+        return list(rows)
+
+    def _match_token(self, token: str) -> List[Tuple[int, float]]:
+        """Index tokens matching a query token, as (token_id, score)."""
+        start = bisect.bisect_left(self.tokens, token)
+
+        # Exact match and prefix matches are adjacent in the sorted token list
+        matches = []
+        for token_id in range(start, len(self.tokens)):
+            if not self.tokens[token_id].startswith(token):
+                break
+            matches.append((token_id, EXACT_SCORE if self.tokens[token_id] == token else PREFIX_SCORE))
+
+        if matches:
+            return matches
+
+        # Fall back to trigram similarity for misspellings and partial names
+        grams = trigrams(token)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for token_id in self.trigram_tokens.get(gram, ()):
+                shared[token_id] += 1
+
+        fuzzy = []
+        for token_id, count in shared.items():
+            similarity = 2 * count / (len(grams) + self.token_trigrams[token_id])
+            if similarity >= FUZZY_THRESHOLD:
+                fuzzy.append((token_id, FUZZY_WEIGHT * similarity))
+        return fuzzy
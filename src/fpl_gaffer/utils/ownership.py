@@ -0,0 +1,85 @@
+import numpy as np
+from typing import Dict, List, Sequence
+from fpl_gaffer.utils.player_table import PlayerTable
+
+_PICK = np.dtype([("member", np.int32), ("element", np.int32), ("multiplier", np.int8), ("captain", bool)])
+
+
+class LeagueOwnership:
+    """
+    Ownership of a league's members in one gameweek, over player table rows.
+
+    `owned` is a members x players bitset packed 8 players a byte, for squad
+    overlaps by popcount; `weights` holds each member's pick multipliers (0
+    benched, 1, 2 captain, 3 Triple Captain, bench players count under Bench
+    Boost). Ownership, captaincy and effective ownership are column means of
+    these, so the league's picks reduce to a handful of array operations.
+    """
+
+    def __init__(self, table: PlayerTable, manager_ids: Sequence[int], picks_payloads: Sequence[Dict]):
+        self.manager_ids = np.array(manager_ids, dtype=np.int64)
+        self.n_players = len(table)
+        n_members = len(self.manager_ids)
+
+        # Every pick flattened into (member, element, multiplier, captain) records in one pass
+        picks = np.fromiter(
+            (
+                (member, pick["element"], pick["multiplier"], pick["is_captain"])
+                for member, payload in enumerate(picks_payloads) for pick in payload.get("picks", [])
+            ),
+            dtype=_PICK,
+        )
+        rows = table.rows(picks["element"])
+        known = rows >= 0
+        member, rows = picks["member"][known], rows[known]
+        multiplier, captain = picks["multiplier"][known], picks["captain"][known]
+
+        self.weights = np.zeros((n_members, self.n_players), dtype=np.int8)
+        self.weights[member, rows] = multiplier
+        owned = np.zeros((n_members, self.n_players), dtype=bool)
+        owned[member, rows] = True
+        self.owned = np.packbits(owned, axis=1)
+
+        # Shares of members, 1.0 = every member (effective ownership can exceed it)
+        size = max(n_members, 1)
+        self.ownership = np.bincount(rows, minlength=self.n_players) / size
+        self.captaincy = np.bincount(rows[captain], minlength=self.n_players) / size
+        self.effective_ownership = self.weights.sum(axis=0, dtype=np.int32) / size
+
+    def __len__(self) -> int:
+        return len(self.manager_ids)
+
+    def member(self, manager_id: int) -> int:
+        """Row of a member, -1 if not in the league."""
+        found = np.flatnonzero(self.manager_ids == manager_id)
+        return int(found[0]) if len(found) else -1
+
+    def squad(self, table: PlayerTable, picks_payload: Dict) -> Dict[str, np.ndarray]:
+        """A squad outside the league (or any picks payload) as a weights row and packed bitset."""
+        other = LeagueOwnership(table, [0], [picks_payload])
+        return {"weights": other.weights[0], "owned": other.owned[0]}
+
+    def rivals(self, weights: np.ndarray, owned: np.ndarray, values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Each member against one squad (a weights row and packed bitset): players
+        in both squads, starters in both XIs, whether they share the captain
+        and the projected points swing in the squad's favour, (squad - member
+        multipliers) . values.
+        """
+        starting = weights > 0
+        return {
+            "overlap": np.bitwise_count(self.owned & owned).sum(axis=1, dtype=np.int32),
+            "shared_starters": ((self.weights > 0) & starting).sum(axis=1, dtype=np.int32),
+            "same_captain": ((self.weights >= 2) & (weights >= 2)).any(axis=1),
+            "swing": (weights[None, :] - self.weights).astype(np.float32) @ values,
+        }
+
+    def exposure(self, weights: np.ndarray) -> np.ndarray:
+        """A squad's multiplier less the league's effective ownership: what it gains per point a player scores."""
+        return weights - self.effective_ownership
+
+    def top_rows(self, scores: np.ndarray, mask: np.ndarray, limit: int) -> List[int]:
+        """Rows of the `limit` highest positive scores within `mask`."""
+        candidates = np.flatnonzero(mask & (scores > 0))
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return order[:limit].tolist()
@@ -0,0 +1,151 @@
+import numpy as np
+from typing import Dict, List, Iterable, Optional
+from fpl_gaffer.utils.records import Player
+
+
+def _to_float(value) -> float:
+    """Bootstrap stats like form and ownership come as strings, e.g. "5.2"."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class PlayerTable:
+    """
+    Columnar view of the bootstrap players.
+
+    Each column is a NumPy array with one row per element, in bootstrap order,
+    so `row` also indexes `bootstrap_data["elements"]`. `row_of[player_id]`
+    gives a player's row (-1 if unknown), so mapping any list of ids is a
+    single fancy-index operation. Build once per bootstrap payload and treat
+    as read-only.
+    """
+
+    def __init__(self, bootstrap_data: Dict):
+        elements = bootstrap_data.get("elements", [])
+        n = len(elements)
+
+        self.id = np.fromiter((p["id"] for p in elements), dtype=np.int32, count=n)
+        self.team = np.fromiter((p["team"] for p in elements), dtype=np.int16, count=n)
+        self.position = np.fromiter((p["element_type"] for p in elements), dtype=np.int8, count=n)
+        self.price = np.fromiter((p["now_cost"] / 10 for p in elements), dtype=np.float64, count=n)
+        self.status = np.array([p.get("status", "a") for p in elements], dtype="<U1")
+        self.form = np.fromiter((_to_float(p.get("form")) for p in elements), dtype=np.float32, count=n)
+        self.points = np.fromiter((p.get("total_points") or 0 for p in elements), dtype=np.int32, count=n)
+        self.points_per_game = np.fromiter(
+            (_to_float(p.get("points_per_game")) for p in elements), dtype=np.float32, count=n
+        )
+        self.ownership = np.fromiter(
+            (_to_float(p.get("selected_by_percent")) for p in elements), dtype=np.float32, count=n
+        )
+        self.minutes = np.fromiter((p.get("minutes") or 0 for p in elements), dtype=np.int32, count=n)
+        self.ict_index = np.fromiter((_to_float(p.get("ict_index")) for p in elements), dtype=np.float32, count=n)
+        self.xgi = np.fromiter(
+            (_to_float(p.get("expected_goal_involvements")) for p in elements), dtype=np.float32, count=n
+        )
+        self.expected_goals = np.fromiter(
+            (_to_float(p.get("expected_goals")) for p in elements), dtype=np.float32, count=n
+        )
+        self.expected_assists = np.fromiter(
+            (_to_float(p.get("expected_assists")) for p in elements), dtype=np.float32, count=n
+        )
+        # Percent chance of playing next round; no flag (None) means fully available
+        self.chance_of_playing = np.fromiter(
+            (100.0 if p.get("chance_of_playing_next_round") is None else _to_float(p["chance_of_playing_next_round"])
+             for p in elements),
+            dtype=np.float32, count=n
+        )
+        self.name = np.array([f"{p['first_name']} {p['second_name']}" for p in elements], dtype=object)
+        self.web_name = np.array([p.get("web_name", p["second_name"]) for p in elements], dtype=object)
+
+        # Player id -> row
+        self.row_of = np.full(int(self.id.max()) + 1 if n else 0, -1, dtype=np.int32)
+        self.row_of[self.id] = np.arange(n, dtype=np.int32)
+
+        # Team and position names indexed by id
+        self.teams = {team["id"]: team["name"] for team in bootstrap_data.get("teams", [])}
+        self.positions = {
+            position["id"]: position["singular_name_short"] for position in bootstrap_data.get("element_types", [])
+        }
+        self.team_names = self._lookup_array(self.teams, "Unknown Team")
+        self.position_names = self._lookup_array(self.positions, "Unknown Position")
+
+        # Player records by row, created on first use and shared by every squad
+        self._players: List[Optional[Player]] = [None] * n
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def rows(self, player_ids: Iterable[int]) -> np.ndarray:
+        """Rows of the given player ids, -1 for unknown ids."""
+        if isinstance(player_ids, np.ndarray):
+            ids = player_ids.astype(np.int64, copy=False)
+        else:
+            ids = np.fromiter(player_ids, dtype=np.int64)
+        known = (ids >= 0) & (ids < len(self.row_of))
+
+        rows = np.full(len(ids), -1, dtype=np.int32)
+        rows[known] = self.row_of[ids[known]]
+        return rows
+
+    def position_id(self, short_name: str) -> Optional[int]:
+        """Position id from its short name, e.g. "MID" -> 3."""
+        return next((pid for pid, name in self.positions.items() if name.lower() == short_name.lower()), None)
+
+    def records(self, player_ids: Iterable[int]) -> List[Dict]:
+        """Player info dicts for the given ids, {} for unknown ids."""
+        rows = self.rows(player_ids)
+        known = rows >= 0
+        picked = rows[known]
+
+        columns = zip(
+            self.id[picked].tolist(),
+            self.name[picked].tolist(),
+            self.team_names[self.team[picked]].tolist(),
+            self.position_names[self.position[picked]].tolist(),
+            self.price[picked].tolist(),
+            self.status[picked].tolist(),
+        )
+        found = iter([
+            {
+                "id": player_id,
+                "name": name,
+                "team": team,
+                "position": position,
+                "current_price": price,
+                "status": status,
+            }
+            for player_id, name, team, position, price, status in columns
+        ])
+
+        return [next(found) if is_known else {} for is_known in known.tolist()]
+
+    def players(self, player_ids: Iterable[int]) -> List[Optional[Player]]:
+        """Player records for the given ids, None for unknown ids."""
+        players = []
+        for row in self.rows(player_ids).tolist():
+            if row < 0:
+                players.append(None)
+                continue
+
+            player = self._players[row]
+            if player is None:
+                player = self._players[row] = Player(
+                    id=int(self.id[row]),
+                    name=self.name[row],
+                    team=self.team_names[self.team[row]],
+                    position=self.position_names[self.position[row]],
+                    current_price=float(self.price[row]),
+                    status=str(self.status[row]),
+                )
+            players.append(player)
+        return players
+
+    @staticmethod
+    def _lookup_array(names: Dict[int, str], default: str) -> np.ndarray:
+        """Object array mapping ids to names, with `default` for gaps."""
+        lookup = np.full(max(names, default=0) + 1, default, dtype=object)
+        for key, name in names.items():
+            lookup[key] = name
+        return lookup
@@ -0,0 +1,12 @@
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+
+@lru_cache(maxsize=None)
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool shared by CPU-bound planners and simulations, so workers stay
+    warm between requests. Spawned rather than forked, as callers run threads.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
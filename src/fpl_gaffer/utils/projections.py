@@ -0,0 +1,99 @@
+import numpy as np
+from typing import Dict
+from fpl_gaffer.utils.player_table import PlayerTable
+from fpl_gaffer.utils.difficulty import DifficultyMatrix
+
+# Points per goal and per clean sheet, indexed by element_type (GKP, DEF, MID, FWD)
+GOAL_POINTS = np.array([0, 6, 6, 5, 4], dtype=np.float32)
+CLEAN_SHEET_POINTS = np.array([0, 4, 4, 1, 0], dtype=np.float32)
+ASSIST_POINTS = 3.0
+# Points for playing 60+ minutes
+APPEARANCE_POINTS = 2.0
+# Chance of a clean sheet in an average (difficulty 3) fixture
+CLEAN_SHEET_RATE = 0.3
+# Bonus points per ICT index point per 90 minutes
+BONUS_PER_ICT = 0.1
+# Share of the underlying model (xG, xA, ICT, clean sheets) against recent form in a fixture's points
+MODEL_WEIGHT = 0.5
+# Availability regained per gameweek by injured, doubtful and suspended players
+RECOVERY_PER_GAMEWEEK = 0.25
+
+
+class ProjectionMatrix:
+    """
+    Expected points of every player in every gameweek.
+
+    `points[row, gameweek]` follows the player table rows and the gameweek
+    numbers (column 0 and finished gameweeks are 0). A player's points in a
+    gameweek are their availability times their share of minutes so far
+    times, per fixture, appearance points plus a fixture-scaled part: the
+    underlying model (xG and xA per 90, clean sheets, ICT-based bonus)
+    blended with recent form, scaled by the fixture's ease (1 for
+    difficulty 3). Doubles count both fixtures and blanks score nothing.
+
+    Availability is the chance of playing next round, then recovers by a
+    quarter each gameweek for injured, doubtful and suspended players, and
+    stays 0 for unavailable ones. The whole matrix is one vectorized pass
+    over the table and difficulty columns; build once per bootstrap and
+    fixtures payload and treat as read-only.
+
+    The model's inputs are kept per player (per-90 rates, minutes share,
+    the model and blended fixture-scaled points) and per player and
+    gameweek (availability, fixture counts, ease), so simulations can
+    sample around the same means.
+    """
+
+    def __init__(self, table: PlayerTable, difficulty: DifficultyMatrix, bootstrap_data: Dict):
+        events = bootstrap_data.get("events", [])
+        played = max(1, sum(1 for event in events if event.get("finished")))
+        self.next_gameweek = next((event["id"] for event in events if event.get("is_next")), played + 1)
+        self.n_gameweeks = difficulty.n_gameweeks
+
+        position = table.position.astype(np.int64)
+        team = np.minimum(table.team.astype(np.int64), difficulty.ease.shape[0] - 1)
+        per_90 = 90 / np.maximum(table.minutes, 90).astype(np.float32)
+        self.position = position
+        self.goals_per_90 = table.expected_goals * per_90
+        self.assists_per_90 = table.expected_assists * per_90
+        self.bonus_per_90 = BONUS_PER_ICT * table.ict_index * per_90
+
+        # Points per full fixture of average difficulty beyond appearance points
+        self.model = (
+            GOAL_POINTS[position] * self.goals_per_90 + ASSIST_POINTS * self.assists_per_90
+            + CLEAN_SHEET_POINTS[position] * CLEAN_SHEET_RATE + self.bonus_per_90
+        )
+        form = np.maximum((table.form + table.points_per_game) / 2 - APPEARANCE_POINTS, 0)
+        self.scaled = MODEL_WEIGHT * self.model + (1 - MODEL_WEIGHT) * form
+
+        self.minutes_share = np.minimum(table.minutes / (90 * played), 1).astype(np.float32)
+
+        # (players, gameweeks) fixture counts and ease / 3 (an average fixture counts once)
+        gameweeks = np.arange(self.n_gameweeks + 1)
+        upcoming = gameweeks >= self.next_gameweek
+        self.fixtures = difficulty.counts[team][:, :self.n_gameweeks + 1] * upcoming
+        self.ease = (difficulty.ease[team][:, :self.n_gameweeks + 1] / 3 * upcoming).astype(np.float32)
+
+        self.availability = self._availability(table, np.maximum(gameweeks - self.next_gameweek, 0))
+        self.points = (
+            (self.availability * self.minutes_share[:, None])
+            * (APPEARANCE_POINTS * self.fixtures + self.scaled[:, None] * self.ease)
+        ).astype(np.float32)
+
+    def _availability(self, table: PlayerTable, offsets: np.ndarray) -> np.ndarray:
+        """Chance of playing in each gameweek, from next round's chance and status."""
+        chance = table.chance_of_playing / 100
+        chance = np.where(np.isin(table.status, ["u", "n", "s"]), 0.0, chance).astype(np.float32)
+        recovering = np.isin(table.status, ["i", "d", "s"])
+
+        availability = np.minimum(chance[:, None] + RECOVERY_PER_GAMEWEEK * offsets[None, :], 1.0)
+        return np.where(recovering[:, None], availability, chance[:, None]).astype(np.float32)
+
+    def horizon(self, start: int, num_gameweeks: int) -> np.ndarray:
+        """(players, gameweeks) expected points over `num_gameweeks` from `start`."""
+        start = max(1, start)
+        end = min(self.n_gameweeks, start + num_gameweeks - 1)
+        return self.points[:, start:end + 1]
+
+    def totals(self, start: int, num_gameweeks: int) -> np.ndarray:
+        """Expected points of every player summed over `num_gameweeks` from `start`."""
+        return self.horizon(start, num_gameweeks).sum(axis=1)
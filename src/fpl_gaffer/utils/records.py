@@ -0,0 +1,150 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True, slots=True)
+class Player:
+    """
+    A player as shown to users; one instance per player is shared by every
+    squad, so its info dicts are built once here and reused by every squad.
+    """
+    id: int
+    name: str
+    team: str
+    position: str
+    current_price: float
+    status: str
+    _info: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _pick_infos: Dict[Tuple[int, int], Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def info(self) -> Dict[str, Any]:
+        """The shared info dict; read-only, to_dict() returns a copy."""
+        if self._info is None:
+            object.__setattr__(self, "_info", {
+                "id": self.id,
+                "name": self.name,
+                "team": self.team,
+                "position": self.position,
+                "current_price": self.current_price,
+                "status": self.status,
+            })
+        return self._info
+
+    def pick_info(self, position_in_team: int, multiplier: int) -> Dict[str, Any]:
+        """The shared info dict of a pick of this player; read-only."""
+        key = (position_in_team, multiplier)
+        pick_info = self._pick_infos.get(key)
+        if pick_info is None:
+            pick_info = self._pick_infos[key] = {
+                **self.info(), "position_in_team": position_in_team, "multiplier": multiplier
+            }
+        return pick_info
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.info())
+
+
+@dataclass(frozen=True, slots=True)
+class Pick:
+    """A player's place in a gameweek squad."""
+    player: Player
+    position_in_team: int
+    multiplier: int
+    is_captain: bool = False
+    is_vice_captain: bool = False
+
+    @property
+    def is_starter(self) -> bool:
+        return self.position_in_team <= 11
+
+    def info(self) -> Dict[str, Any]:
+        """The pick's info dict, shared with every squad picking the player in the same slot; read-only."""
+        return self.player.pick_info(self.position_in_team, self.multiplier)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.info())
+
+
+@dataclass(frozen=True, slots=True)
+class Squad:
+    """A manager's gameweek squad with its gameweek summary."""
+    picks: Tuple[Pick, ...]
+    active_chip: Optional[str] = None
+    points: int = 0
+    total_points: int = 0
+    rank: int = 0
+    squad_value: float = 0.0
+    transfers: int = 0
+    transfers_cost: int = 0
+    money_itb: float = 0.0
+    history: Dict[str, Any] = field(default_factory=dict)
+    transfer_history: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def starting_xi(self) -> List[Pick]:
+        return [pick for pick in self.picks if pick.is_starter]
+
+    @property
+    def bench(self) -> List[Pick]:
+        return [pick for pick in self.picks if not pick.is_starter]
+
+    @property
+    def captain(self) -> Optional[Pick]:
+        return next((pick for pick in self.picks if pick.is_captain), None)
+
+    @property
+    def vice_captain(self) -> Optional[Pick]:
+        return next((pick for pick in self.picks if pick.is_vice_captain), None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The squad info dict used in prompts and API responses."""
+        return self._squad_info(Pick.to_dict)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the squad info dict, with orjson when installed. Nothing is
+        mutated while encoding, so picks use the dicts shared by their players.
+        """
+        squad_info = self._squad_info(Pick.info)
+        if orjson is not None:
+            return orjson.dumps(squad_info)
+        return json.dumps(squad_info).encode()
+
+    def _squad_info(self, pick_info: Callable[[Pick], Dict[str, Any]]) -> Dict[str, Any]:
+        starting_xi, bench, captain, vice_captain = [], [], None, None
+
+        # One pass; the captain entries are the same dicts as in the XI/bench lists
+        for pick in self.picks:
+            info = pick_info(pick)
+            (starting_xi if pick.is_starter else bench).append(info)
+            if pick.is_captain:
+                captain = info
+            if pick.is_vice_captain:
+                vice_captain = info
+
+        squad_info = {
+            "starting_xi": starting_xi,
+            "bench": bench,
+            "captain": captain,
+            "vice_captain": vice_captain,
+            "active_chip": self.active_chip,
+            "points": self.points,
+            "total_points": self.total_points,
+            "rank": self.rank,
+            "squad_value": self.squad_value,
+            "transfers": self.transfers,
+            "transfers_cost": self.transfers_cost,
+            "money_itb": self.money_itb,
+            "history": self.history,
+        }
+        if self.transfer_history is not None:
+            squad_info["transfer_history"] = self.transfer_history
+        return squad_info
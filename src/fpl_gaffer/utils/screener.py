@@ -0,0 +1,87 @@
+import numpy as np
+from typing import Dict, Iterable, Literal, Optional
+from fpl_gaffer.utils.player_table import PlayerTable
+
+ScreenMetric = Literal["blend", "projected_points", "points_per_million", "form", "ict_index", "xgi", "total_points"]
+
+# Weights of the z-scored metrics in the "blend" ranking
+BLEND_WEIGHTS: Dict[str, float] = {
+    "form": 0.4,
+    "points_per_million": 0.3,
+    "xgi": 0.2,
+    "ict_index": 0.1,
+}
+
+
+def metric_values(table: PlayerTable, metric: str, projections: Optional[np.ndarray] = None) -> np.ndarray:
+    """A ranking metric for every row of the table."""
+    if metric == "projected_points":
+        if projections is None:
+            raise ValueError("projected_points needs projections")
+        return projections
+    if metric == "points_per_million":
+        return table.points / np.maximum(table.price, 0.1)
+    if metric == "form":
+        return table.form
+    if metric == "ict_index":
+        return table.ict_index
+    if metric == "xgi":
+        return table.xgi
+    if metric == "total_points":
+        return table.points.astype(np.float32)
+    raise ValueError(f"Unknown metric: {metric}")
+
+
+def screen_players(
+    table: PlayerTable,
+    position_id: Optional[int] = None,
+    max_price: Optional[float] = None,
+    min_price: Optional[float] = None,
+    statuses: Optional[Iterable[str]] = ("a",),
+    min_minutes: int = 0,
+    sort_by: ScreenMetric = "blend",
+    limit: int = 6,
+    weights: Optional[Dict[str, float]] = None,
+    projections: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Rows of the top `limit` players passing the filters, best first.
+
+    Filters are boolean masks over the table columns and only the top rows are
+    fully sorted (argpartition), so a screen costs a few array passes. "blend"
+    ranks by the weighted sum of z-scores (within the filtered players) of
+    `weights`, BLEND_WEIGHTS by default. `projections` holds each row's
+    expected points for "projected_points" (e.g. ProjectionMatrix.totals).
+    """
+    mask = table.minutes >= min_minutes
+    if position_id is not None:
+        mask &= table.position == position_id
+    if max_price is not None:
+        mask &= table.price <= max_price
+    if min_price is not None:
+        mask &= table.price >= min_price
+    if statuses is not None:
+        mask &= np.isin(table.status, list(statuses))
+
+    rows = np.flatnonzero(mask)
+    if len(rows) == 0 or limit <= 0:
+        return rows[:0]
+
+    if sort_by == "blend":
+        scores = np.zeros(len(rows), dtype=np.float32)
+        for metric, weight in (weights or BLEND_WEIGHTS).items():
+            values = metric_values(table, metric, projections)[rows]
+            std = values.std()
+            if std > 0:
+                scores += weight * (values - values.mean()) / std
+    else:
+        scores = metric_values(table, sort_by, projections)[rows]
+
+    if len(rows) > limit:
+        top = np.argpartition(-scores, limit - 1)[:limit]
+    else:
+        top = np.arange(len(rows))
+
+    # Sort the top rows by score, then id for a stable order
+    order = np.lexsort((table.id[rows[top]], -scores[top]))
+    return rows[top[order]]
@@ -0,0 +1,255 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from fpl_gaffer.utils.pool import process_pool
+from fpl_gaffer.utils.player_table import PlayerTable
+from fpl_gaffer.utils.projections import (
+    ProjectionMatrix, GOAL_POINTS, CLEAN_SHEET_POINTS, ASSIST_POINTS, APPEARANCE_POINTS, CLEAN_SHEET_RATE
+)
+from fpl_gaffer.utils.auto_subs import SQUAD_SIZE, STARTERS, apply_auto_subs
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class GameweekSimulator:
+    """
+    Monte Carlo points of players and squads in one gameweek.
+
+    Each fixture a player plays (60+ minutes) with their availability times
+    minutes share and then scores appearance points plus Poisson goals,
+    assists and bonus and a Bernoulli clean sheet. Rates are the projection
+    model's per-90 inputs scaled by the fixture's ease and the blend with
+    form, so a player's mean matches their `ProjectionMatrix` points.
+
+    Draws are vectorized per player and seeded by (seed, gameweek, player
+    id): every squad, captain choice and worker process sees the same
+    outcomes for a player, so differences between squads carry no extra
+    noise. Sampled players are cached; the simulator pickles without them.
+    """
+
+    def __init__(
+        self,
+        table: PlayerTable,
+        projections: ProjectionMatrix,
+        gameweek: int,
+        draws: int = 100_000,
+        seed: Optional[int] = None
+    ):
+        self.gameweek = gameweek
+        self.draws = draws
+        self.seed = int(np.random.SeedSequence().generate_state(1)[0]) if seed is None else seed
+        self.ids = table.id.astype(np.int64)
+        self.position = projections.position
+        self._rows = {int(player_id): row for row, player_id in enumerate(self.ids)}
+
+        g = gameweek if 0 < gameweek <= projections.n_gameweeks else 0
+        self.fixtures = projections.fixtures[:, g].astype(np.int64)
+        self.plays = projections.availability[:, g] * projections.minutes_share
+
+        # Rate multiplier per fixture: the average fixture's ease times the form blend over the model
+        per_fixture = projections.ease[:, g] / np.maximum(self.fixtures, 1)
+        modelled = projections.model > 0
+        blend = np.where(modelled, projections.scaled / np.where(modelled, projections.model, 1), 0)
+        factor = per_fixture * blend
+        self.goals = projections.goals_per_90 * factor
+        self.assists = projections.assists_per_90 * factor
+        self.clean_sheets = np.minimum(CLEAN_SHEET_RATE * factor, 1.0)
+        # Players with nothing modelled score their form part as bonus
+        self.bonus = np.where(modelled, projections.bonus_per_90 * factor, projections.scaled * per_fixture)
+
+        self._cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    def player(self, player_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(draws,) points and played flags of one player; unknown players never play."""
+        cached = self._cache.get(player_id)
+        if cached is not None:
+            return cached
+
+        points = np.zeros(self.draws, dtype=np.int16)
+        played = np.zeros(self.draws, dtype=bool)
+        row = self._rows.get(player_id)
+
+        if row is not None and self.plays[row] > 0:
+            rng = np.random.default_rng([self.seed, self.gameweek, player_id])
+            position = self.position[row]
+            goal, clean_sheet = int(GOAL_POINTS[position]), int(CLEAN_SHEET_POINTS[position])
+            for _ in range(self.fixtures[row]):
+                # Returns are only drawn for the draws where the player plays
+                plays = np.flatnonzero(rng.random(self.draws) < self.plays[row])
+                n = len(plays)
+                returns = int(APPEARANCE_POINTS) + rng.poisson(self.bonus[row], n)
+                if goal:
+                    returns += goal * rng.poisson(self.goals[row], n)
+                returns += int(ASSIST_POINTS) * rng.poisson(self.assists[row], n)
+                if clean_sheet:
+                    returns += clean_sheet * (rng.random(n) < self.clean_sheets[row])
+                points[plays] += returns.astype(np.int16)
+                played[plays] = True
+
+        self._cache[player_id] = (points, played)
+        return points, played
+
+    def squad_arrays(self, squad_info: Dict, chips: bool = True) -> Dict[str, np.ndarray]:
+        """
+        (15,) squad arrays from an `extract_squad_info` dict, in squad position
+        order. Without `chips` the squad plays without Bench Boost and with a
+        plain captain, as when projecting a later gameweek.
+        """
+        element = np.zeros(SQUAD_SIZE, dtype=np.int64)
+        multiplier = np.zeros(SQUAD_SIZE, dtype=np.int8)
+        for pick in squad_info["starting_xi"] + squad_info["bench"]:
+            slot = pick["position_in_team"] - 1
+            element[slot] = pick["id"]
+            multiplier[slot] = pick["multiplier"]
+
+        captain, vice_captain = squad_info.get("captain") or {}, squad_info.get("vice_captain") or {}
+        if not chips:
+            multiplier = np.minimum(multiplier, 2)
+
+        rows = [self._rows.get(int(player_id)) for player_id in element]
+        return {
+            "element": element,
+            "element_type": np.array([0 if row is None else self.position[row] for row in rows], dtype=np.int8),
+            "multiplier": multiplier,
+            "is_captain": element == captain.get("id", -1),
+            "is_vice_captain": element == vice_captain.get("id", -1),
+            "bench_boost": chips and squad_info.get("active_chip") == "bboost",
+        }
+
+    def _draws(self, squad: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """(draws, 15) points and minutes of a squad's players."""
+        sampled = [self.player(int(player_id)) for player_id in squad["element"]]
+        return np.stack([p for p, _ in sampled], axis=1), np.stack([m for _, m in sampled], axis=1)
+
+    @staticmethod
+    def _multipliers(squad: Dict[str, np.ndarray], played: np.ndarray, armbands: bool = True) -> np.ndarray:
+        """
+        (draws, 15) effective multipliers. Subs and captaincy only depend on
+        who played, so the rules run once per distinct played pattern (a
+        few hundred among 100k draws) and are gathered back to the draws.
+        """
+        keys = played.astype(np.int32) @ (1 << np.arange(SQUAD_SIZE, dtype=np.int32))
+        seen = np.zeros(1 << SQUAD_SIZE, dtype=bool)
+        seen[keys] = True
+        patterns = np.flatnonzero(seen)
+        inverse = np.cumsum(seen) - 1
+        shape = (len(patterns), SQUAD_SIZE)
+        armband = np.broadcast_to(squad["is_captain"], shape) if armbands else np.zeros(shape, dtype=bool)
+        vice_armband = np.broadcast_to(squad["is_vice_captain"], shape) if armbands else np.zeros(shape, dtype=bool)
+
+        result = apply_auto_subs(
+            np.broadcast_to(squad["element_type"], shape),
+            np.zeros(shape, dtype=np.int16),
+            (patterns[:, None] >> np.arange(SQUAD_SIZE)) & 1,
+            np.broadcast_to(squad["multiplier"], shape),
+            armband,
+            vice_armband,
+            bench_boost=np.full(len(patterns), squad["bench_boost"]),
+        )
+        return result.multipliers[inverse[keys]]
+
+    def squad_points(self, squad_info: Dict, chips: bool = True) -> np.ndarray:
+        """(draws,) effective points of a squad after auto-subs and captaincy."""
+        squad = self.squad_arrays(squad_info, chips)
+        points, played = self._draws(squad)
+        return (points.astype(np.int32) * self._multipliers(squad, played)).sum(axis=1)
+
+    def captain_options(self, squad_info: Dict, chips: bool = True) -> List[Dict]:
+        """
+        Squad points with each starter as captain (vice captain unchanged, or
+        the current captain when the vice is the one armed), ranked by mean
+        and then by lower spread. One auto-sub pass serves every choice:
+        the armband only adds the captain's, or the vice's, points again.
+        """
+        squad = self.squad_arrays(squad_info, chips)
+        points, played = self._draws(squad)
+        multipliers = self._multipliers(squad, played, armbands=False)
+        base = (points.astype(np.int32) * multipliers).sum(axis=1)
+        in_xi = multipliers > 0
+        extra = max(int(squad["multiplier"][squad["is_captain"]].max(initial=2)), 2) - 1
+        vice = np.flatnonzero(squad["is_vice_captain"])
+        captain = np.flatnonzero(squad["is_captain"])
+
+        options = []
+        for slot in range(STARTERS):
+            fallback = captain if vice.size and vice[0] == slot else vice
+            backup = (
+                np.where(in_xi[:, fallback[0]], points[:, fallback[0]], 0) if fallback.size
+                else np.zeros(self.draws, dtype=points.dtype)
+            )
+            armband = np.where(played[:, slot], points[:, slot], backup)
+            totals = base + extra * armband.astype(np.int32)
+            options.append({
+                "id": int(squad["element"][slot]),
+                "captain_points": round(float(points[:, slot].mean()), 2),
+                **summarize(totals),
+            })
+
+        return sorted(options, key=lambda option: (-option["mean"], option["std"]))
+
+
+def summarize(points: np.ndarray) -> Dict:
+    """
+    Mean, spread and percentiles of simulated points. Points are integers, so
+    percentiles (inverted CDF) are read off their counts instead of a sort.
+    """
+    lowest = int(points.min())
+    cumulative = np.cumsum(np.bincount(points - lowest))
+    percentiles = lowest + np.searchsorted(cumulative, np.array(PERCENTILES) / 100 * len(points))
+    return {
+        "mean": round(float(points.mean()), 2),
+        "std": round(float(points.std()), 2),
+        "percentiles": {f"p{p}": round(float(value), 1) for p, value in zip(PERCENTILES, percentiles)},
+    }
+
+
+def compare(points: np.ndarray, rival_points: np.ndarray) -> Dict:
+    """Chances of beating, tying and losing to a rival, with the points difference."""
+    difference = points.astype(np.int32) - rival_points
+    return {
+        "win_probability": round(float((difference > 0).mean()), 4),
+        "tie_probability": round(float((difference == 0).mean()), 4),
+        "lose_probability": round(float((difference < 0).mean()), 4),
+        "difference": summarize(difference),
+    }
+
+
+def _squads_points(simulator: GameweekSimulator, squad_infos: Sequence[Dict], chips: bool) -> np.ndarray:
+    return np.stack([simulator.squad_points(squad_info, chips) for squad_info in squad_infos])
+
+
+def simulate_squads(
+    simulator: GameweekSimulator,
+    squad_infos: Sequence[Dict],
+    chips: bool = True,
+    workers: int = 1
+) -> np.ndarray:
+    """
+    (squads, draws) points of many squads, e.g. a whole league. With
+    `workers` > 1 the squads are split across the shared process pool;
+    seeding by player keeps the result identical to a serial run.
+    """
+    if workers <= 1 or len(squad_infos) < 2 * workers:
+        return _squads_points(simulator, squad_infos, chips)
+
+    chunks = [list(chunk) for chunk in np.array_split(np.arange(len(squad_infos)), workers) if len(chunk)]
+    parts = process_pool(workers).map(
+        _squads_points,
+        [simulator] * len(chunks),
+        [[squad_infos[i] for i in chunk] for chunk in chunks],
+        [chips] * len(chunks),
+    )
+    return np.concatenate(list(parts))
+
+
+def rank_probabilities(points: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per squad, the expected rank (ties share the best) and chance of the top score among (squads, draws) points."""
+    ranks = np.stack([(points > squad_points).sum(axis=0) + 1 for squad_points in points])
+    return {
+        "expected_rank": ranks.mean(axis=1),
+        "top_probability": (ranks == 1).mean(axis=1),
+    }
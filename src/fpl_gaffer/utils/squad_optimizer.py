@@ -0,0 +1,470 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from fpl_gaffer.utils.player_table import PlayerTable
+
+# Squad places per position (element_type): 2 GKP, 5 DEF, 5 MID, 3 FWD
+SQUAD_QUOTAS: Dict[int, int] = {1: 2, 2: 5, 3: 5, 4: 3}
+MAX_PER_CLUB = 3
+
+# Legal starting XI formations as (DEF, MID, FWD), behind one goalkeeper
+FORMATIONS: List[Tuple[int, int, int]] = [
+    (d, m, f) for d in range(3, 6) for m in range(2, 6) for f in range(1, 4) if d + m + f == 10
+]
+
+# Clubs that can be full (3 players) in a squad besides a given player's club: 14 // 3
+_MAX_FULL_CLUBS = 4
+_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class SquadSolution:
+    """
+    An optimized 15-man squad as table rows.
+
+    `starters` are in GKP, DEF, MID, FWD order and `bench` in bench order (the
+    reserve goalkeeper first). `objective` is the XI's value with the captain
+    counted twice plus `bench_weight` times the bench's value. `optimal` is
+    False only when the search hit its node limit.
+    """
+    starters: List[int]
+    bench: List[int]
+    captain: int
+    vice_captain: int
+    formation: str
+    cost: float
+    objective: float
+    optimal: bool
+    nodes: int
+
+    @property
+    def rows(self) -> List[int]:
+        return self.starters + self.bench
+
+
+def optimize_squad(
+    table: PlayerTable,
+    values: np.ndarray,
+    budget: float,
+    bench_weight: float = 0.1,
+    eligible: Optional[np.ndarray] = None,
+    include: Iterable[int] = (),
+    max_nodes: int = 500_000
+) -> Optional[SquadSolution]:
+    """
+    The squad maximizing XI value + captain value + bench_weight * bench value.
+
+    `values` holds each table row's projected points and `eligible` masks the
+    rows that may be picked; rows in `include` are always picked. The squad
+    fills the 2/5/5/3 quotas with at most 3 players per club and costs at
+    most `budget` (in millions). Returns None when no squad fits.
+
+    The solve is exact: dominated players are dropped first (a player with
+    enough cheaper, better same-position alternatives outside any full club
+    can always be swapped out). Then, for each formation, a knapsack DP over
+    the remaining players gives the best completion with the club limit
+    relaxed into per-club penalties (Lagrangian multipliers tuned by a few
+    subgradient steps). That bounds a depth-first branch-and-bound which
+    enforces the limit, starting from relaxed squads repaired into legal ones.
+    Formations are tried best bound first and skipped once they cannot win.
+    """
+    costs = np.rint(table.price * 10).astype(np.int64)
+    budget_units = int(round(budget * 10))
+    values = np.asarray(values, dtype=np.float64)
+
+    forced = np.zeros(len(table), dtype=bool)
+    forced[list(include)] = True
+    eligible = (np.ones(len(table), dtype=bool) if eligible is None else eligible.copy()) | forced
+
+    blocks = []
+    for position, quota in SQUAD_QUOTAS.items():
+        rows = np.flatnonzero(eligible & (table.position == position))
+        if len(rows) < quota or forced[rows].sum() > quota:
+            return None
+        rows = _undominated(rows, costs, values, table.team, quota, forced)
+        blocks.append(rows[np.lexsort((rows, -values[rows]))])
+
+    if costs[forced].sum() > budget_units:
+        return None
+
+    search = _SquadSearch(blocks, costs, values, table.team, forced, budget_units, bench_weight, max_nodes)
+
+    # Bound every formation without club penalties, then search the most promising ones
+    no_penalty = np.zeros(search.n_clubs)
+    bounds = sorted(
+        ((search.bound(formation, no_penalty), formation) for formation in FORMATIONS),
+        reverse=True
+    )
+    for bound, formation in bounds:
+        if bound == -np.inf or bound <= search.best_value + _EPS:
+            break
+        search.run(formation)
+        if search.hit_node_limit:
+            break
+
+    if search.best is None:
+        return None
+    return search.solution(table)
+
+
+def _undominated(
+    rows: np.ndarray,
+    costs: np.ndarray,
+    values: np.ndarray,
+    teams: np.ndarray,
+    quota: int,
+    forced: np.ndarray
+) -> np.ndarray:
+    """
+    Drop same-position players that an optimal squad never needs.
+
+    Player j is dominated when at least `quota` others cost no more and are
+    worth at least as much (ties broken by order), after discounting those in
+    the `_MAX_FULL_CLUBS` clubs with most of them: whichever squad holds j, one
+    of them is then outside it and can replace j without breaking the budget,
+    the club limit or the objective.
+    """
+    c, v = costs[rows], values[rows]
+    order = np.arange(len(rows))
+
+    # better[j, d]: d dominates j
+    better = (
+        (c[None, :] <= c[:, None]) & (v[None, :] >= v[:, None])
+        & ((c[None, :] < c[:, None]) | (v[None, :] > v[:, None]) | (order[None, :] < order[:, None]))
+    )
+
+    clubs, club_index = np.unique(teams[rows], return_inverse=True)
+    per_club = better.astype(np.int32) @ np.eye(len(clubs), dtype=np.int32)[club_index]
+    # Dominators from j's own club can always replace j
+    per_club[order, club_index] = 0
+    blocked = np.sort(per_club, axis=1)[:, ::-1][:, :_MAX_FULL_CLUBS].sum(axis=1)
+
+    dominated = better.sum(axis=1) - blocked >= quota
+    return rows[~dominated | forced[rows]]
+
+
+class _SquadSearch:
+    """Branch-and-bound over position blocks of candidate rows, each sorted by value (best first)."""
+
+    def __init__(
+        self,
+        blocks: List[np.ndarray],
+        costs: np.ndarray,
+        values: np.ndarray,
+        teams: np.ndarray,
+        forced: np.ndarray,
+        budget: int,
+        bench_weight: float,
+        max_nodes: int
+    ):
+        self.blocks = blocks
+        self.quotas = list(SQUAD_QUOTAS.values())
+        self.costs = costs
+        self.values = values
+        self.teams = teams
+        self.forced = forced
+        self.budget = budget
+        self.bench_weight = bench_weight
+        self.max_nodes = max_nodes
+
+        self.best_value = -np.inf
+        self.best: Optional[Tuple[Tuple[int, int, bool], ...]] = None
+        self.best_formation: Optional[Tuple[int, int, int]] = None
+        self.nodes = 0
+        self.hit_node_limit = False
+
+        clubs, self.club_of = np.unique(teams, return_inverse=True)
+        self.n_clubs = len(clubs)
+        self._penalties = np.zeros(self.n_clubs)
+
+        # Whether a block still has forced rows from each index on
+        self._forced_after = [np.cumsum(forced[rows][::-1])[::-1].tolist() + [0] for rows in blocks]
+
+    def bound(self, formation: Tuple[int, int, int], penalties: np.ndarray) -> float:
+        """
+        Upper bound on a formation's objective: the penalized optimum plus the
+        penalized club capacity. The relaxed squad is repaired into a first
+        legal squad on the way.
+        """
+        tables = self.completion_tables(formation, penalties)
+        bound = tables[0][0][0, 0, self.budget] + MAX_PER_CLUB * penalties.sum()
+        if bound > -np.inf:
+            self._repair(self._relaxed_rows(formation, tables, penalties))
+        return bound
+
+    def completion_tables(self, formation: Tuple[int, int, int], penalties: np.ndarray) -> List[List[np.ndarray]]:
+        """
+        tables[p][j][k, cap, b]: best value of the rest of the squad from row j of
+        block p on, with k of the block's players picked, cap 1 once the captain
+        is picked and b budget units left (-inf if infeasible). The club limit is
+        relaxed: each pick instead costs its club's penalty. Within a block the
+        first `starters` picks start.
+        """
+        starters = (1,) + formation
+        width = self.budget + 1
+        after = np.full((2, width), -np.inf)
+        after[1] = 0.0
+
+        tables: List[List[np.ndarray]] = [[] for _ in self.blocks]
+        for p in reversed(range(len(self.blocks))):
+            rows, quota, n_start = self.blocks[p], self.quotas[p], starters[p]
+            weights = np.where(np.arange(quota) < n_start, 1.0, self.bench_weight)[:, None, None]
+
+            table = np.full((quota + 1, 2, width), -np.inf)
+            table[quota] = after
+            block_tables = [table]
+            for row in reversed(rows.tolist()):
+                cost, value = self.costs[row], self.values[row]
+                penalty = penalties[self.club_of[row]]
+
+                new = np.full_like(table, -np.inf) if self.forced[row] else table.copy()
+                if cost < width:
+                    # Picking this row with b budget left leaves b - cost for the rest
+                    rest = table[1:, :, :width - cost]
+                    np.maximum(new[:quota, :, cost:], rest + (weights * value - penalty), out=new[:quota, :, cost:])
+                    # A starter picked as captain counts twice
+                    np.maximum(
+                        new[:n_start, 0, cost:], rest[:n_start, 1] + (2 * value - penalty), out=new[:n_start, 0, cost:]
+                    )
+
+                table = new
+                block_tables.append(table)
+
+            tables[p] = block_tables[::-1]
+            after = table[0]
+
+        return tables
+
+    def tune_penalties(
+        self, formation: Tuple[int, int, int], iterations: int = 20
+    ) -> Tuple[np.ndarray, List[List[np.ndarray]], float]:
+        """
+        Club penalties giving a tight bound for a formation, by subgradient steps.
+
+        Each step raises the penalty of clubs the relaxed optimum over-fills and
+        lowers it (down to 0) for clubs it leaves room in, by a Polyak step
+        towards the best squad value found so far. Returns the penalties with
+        the lowest bound, their tables and that bound. Starts from the last
+        formation's penalties, since the same clubs tend to be over-filled.
+        """
+        penalties = self._penalties
+        best = (penalties, None, np.inf)
+        scale = 2.0
+
+        for _ in range(iterations):
+            tables = self.completion_tables(formation, penalties)
+            bound = tables[0][0][0, 0, self.budget] + MAX_PER_CLUB * penalties.sum()
+            if bound < best[2]:
+                best = (penalties, tables, bound)
+            else:
+                scale /= 2
+            if bound == -np.inf or bound <= self.best_value + _EPS:
+                break
+
+            rows = self._relaxed_rows(formation, tables, penalties)
+            self._repair(rows)
+            gradient = np.bincount(self.club_of[rows], minlength=self.n_clubs) - MAX_PER_CLUB
+            # Clubs with room and no penalty cannot go lower, so they take no part in the step
+            gradient = np.where((penalties <= 0) & (gradient < 0), 0, gradient)
+            if not gradient.any():
+                break
+
+            # Without a squad yet, aim for a bound 1% lower
+            target = self.best_value if self.best_value > -np.inf else 0.99 * bound
+            step = scale * (bound - target) / (gradient ** 2).sum()
+            penalties = np.maximum(penalties + step * gradient, 0.0)
+
+        self._penalties = best[0]
+        return best
+
+    def _relaxed_rows(
+        self, formation: Tuple[int, int, int], tables: List[List[np.ndarray]], penalties: np.ndarray
+    ) -> List[int]:
+        """Rows of a squad reaching the relaxed (club-penalized) optimum, read back from the tables."""
+        starters = (1,) + formation
+        p, j, k, cap, budget = 0, 0, 0, 0, self.budget
+        rows: List[int] = []
+
+        while p < len(self.blocks):
+            if k == self.quotas[p]:
+                p, j, k = p + 1, 0, 0
+                continue
+
+            row = int(self.blocks[p][j])
+            target = tables[p][j][k, cap, budget]
+            cost, value, penalty = self.costs[row], self.values[row], penalties[self.club_of[row]]
+            if not self.forced[row] and abs(tables[p][j + 1][k, cap, budget] - target) <= _EPS * max(1.0, abs(target)):
+                j += 1
+                continue
+
+            captain_value = 2 * value - penalty + tables[p][j + 1][k + 1, 1, budget - cost]
+            if k < starters[p] and not cap and abs(captain_value - target) <= _EPS * max(1.0, abs(target)):
+                cap = 1
+            rows.append(row)
+            p, j, k, budget = p, j + 1, k + 1, budget - cost
+
+        return rows
+
+    def _repair(self, rows: List[int]):
+        """
+        Turn a relaxed squad into a legal one and keep it if it beats the best.
+
+        The lowest-value players of over-filled clubs are swapped for the best
+        same-position candidates that fit the budget and the club limit, then
+        single swaps for better players are made while any fits. Gives the
+        search a good squad to prune against before it starts.
+        """
+        squad = list(rows)
+        club_counts = np.bincount(self.teams[squad], minlength=int(self.teams.max()) + 1)
+        budget = self.budget - int(self.costs[squad].sum())
+        block_of = {row: p for p, block in enumerate(self.blocks) for row in squad if row in block}
+
+        def swap(index: int, worse_than: Optional[float]) -> bool:
+            """Swap squad[index] for the best candidate that fits (and is worth more, if given)."""
+            nonlocal budget
+            row = squad[index]
+            for other in self.blocks[block_of[row]].tolist():
+                if worse_than is not None and self.values[other] <= worse_than + _EPS:
+                    return False
+                if (
+                    other in block_of or self.costs[other] - self.costs[row] > budget
+                    or club_counts[self.teams[other]] - (self.teams[other] == self.teams[row]) >= MAX_PER_CLUB
+                ):
+                    continue
+                squad[index] = other
+                block_of[other] = block_of.pop(row)
+                budget -= self.costs[other] - self.costs[row]
+                club_counts[self.teams[row]] -= 1
+                club_counts[self.teams[other]] += 1
+                return True
+            return False
+
+        for row in sorted(rows, key=lambda row: self.values[row]):
+            if club_counts[self.teams[row]] > MAX_PER_CLUB:
+                if self.forced[row] or not swap(squad.index(row), None):
+                    return
+
+        improved = True
+        while improved:
+            improved = False
+            for index in range(len(squad)):
+                if not self.forced[squad[index]] and swap(index, self.values[squad[index]]):
+                    improved = True
+
+        # Score the squad in every formation: the best players start and the best starter captains
+        by_block = [sorted((row for row in squad if block_of[row] == p), key=lambda row: -self.values[row])
+                    for p in range(len(self.blocks))]
+        for formation in FORMATIONS:
+            starters = (1,) + formation
+            picks = [(row, k, k < n) for rows, n in zip(by_block, starters) for k, row in enumerate(rows)]
+            captain = max((row for row, _, starting in picks if starting), key=lambda row: self.values[row])
+            value = self.values[captain] + sum(
+                self.values[row] * (1.0 if starting else self.bench_weight) for row, _, starting in picks
+            )
+            if value > self.best_value + _EPS:
+                self.best_value, self.best_formation = value, formation
+                self.best = tuple((row, k, row == captain) for row, k, _ in picks)
+
+    def run(self, formation: Tuple[int, int, int]):
+        """Search one formation, keeping the best squad found over all runs."""
+        penalties, tables, formation_bound = self.tune_penalties(formation)
+        if formation_bound <= self.best_value + _EPS:
+            return
+
+        starters = (1,) + formation
+        club_counts = [0] * (int(self.teams.max()) + 1)
+        picks: List[Tuple[int, int, bool]] = []
+        # Best value reached at each search state; a later visit with no more value cannot do better
+        seen: Dict[tuple, float] = {}
+        # Penalized capacity left in every club, sum of penalty * places left
+        capacity = [MAX_PER_CLUB * penalties.sum()]
+
+        def visit(p: int, j: int, k: int, cap: int, budget: int, value: float):
+            """Try every row of block p from j on as the block's next pick."""
+            if self.hit_node_limit:
+                return
+            self.nodes += 1
+            if self.nodes > self.max_nodes:
+                self.hit_node_limit = True
+                return
+
+            if k == self.quotas[p]:
+                if self._forced_after[p][j]:
+                    return
+                if p + 1 == len(self.blocks):
+                    if cap and value > self.best_value + _EPS:
+                        self.best_value, self.best, self.best_formation = value, tuple(picks), formation
+                    return
+                p, j, k = p + 1, 0, 0
+
+            state = (p, j, k, cap, budget, bytes(club_counts))
+            if seen.get(state, -np.inf) >= value - _EPS:
+                return
+            seen[state] = value
+
+            rows, block_tables = self.blocks[p], tables[p]
+            starter = k < starters[p]
+            weight = 1.0 if starter else self.bench_weight
+
+            for j in range(j, len(rows)):
+                # Tables only shrink as j grows (skipping is always allowed), so stop at the first miss
+                if value + capacity[0] + block_tables[j][k, cap, budget] <= self.best_value + _EPS:
+                    return
+
+                row = int(rows[j])
+                cost, team = self.costs[row], self.teams[row]
+                if cost <= budget and club_counts[team] < MAX_PER_CLUB:
+                    player_value, penalty = self.values[row], penalties[self.club_of[row]]
+                    next_tables = block_tables[j + 1]
+
+                    options = [(weight * player_value, cap, False)]
+                    if starter and not cap:
+                        options.append((2 * player_value, 1, True))
+                    if len(options) == 2 and (
+                        options[1][0] + next_tables[k + 1, 1, budget - cost]
+                        < options[0][0] + next_tables[k + 1, 0, budget - cost]
+                    ):
+                        options.reverse()
+
+                    club_counts[team] += 1
+                    capacity[0] -= penalty
+                    for gain, new_cap, is_captain in options:
+                        picks.append((row, k, is_captain))
+                        visit(p, j + 1, k + 1, new_cap, budget - cost, value + gain)
+                        picks.pop()
+                    capacity[0] += penalty
+                    club_counts[team] -= 1
+
+                # A forced row cannot be skipped
+                if self.forced[row]:
+                    return
+
+        visit(0, 0, 0, 0, self.budget, 0.0)
+
+    def solution(self, table: PlayerTable) -> SquadSolution:
+        """The best squad found, split into XI and bench."""
+        starters_per_block = (1,) + self.best_formation
+        position_index = {position: index for index, position in enumerate(SQUAD_QUOTAS)}
+
+        starters, bench, captain = [], [], None
+        for row, k, is_captain in self.best:
+            block = position_index[int(table.position[row])]
+            (starters if k < starters_per_block[block] else bench).append(row)
+            if is_captain:
+                captain = row
+
+        # Reserve goalkeeper first, then the outfield bench by value
+        bench.sort(key=lambda row: (table.position[row] != 1, -self.values[row]))
+        vice_captain = max((row for row in starters if row != captain), key=lambda row: self.values[row])
+
+        return SquadSolution(
+            starters=starters,
+            bench=bench,
+            captain=captain,
+            vice_captain=vice_captain,
+            formation="-".join(map(str, self.best_formation)),
+            cost=round(float(self.costs[starters + bench].sum()) / 10, 1),
+            objective=round(float(self.best_value), 2),
+            optimal=not self.hit_node_limit,
+            nodes=self.nodes,
+        )
@@ -0,0 +1,336 @@
+import copy
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from fpl_gaffer.utils.pool import process_pool
+from fpl_gaffer.utils.squad_optimizer import SQUAD_QUOTAS, MAX_PER_CLUB
+
+HIT_COST = 4
+MAX_FREE_TRANSFERS = 5
+
+# Squad slots of each position block once a squad is in GKP, DEF, MID, FWD order
+_BLOCKS = np.cumsum([0] + list(SQUAD_QUOTAS.values()))
+SQUAD_SIZE = int(_BLOCKS[-1])
+
+
+@dataclass(frozen=True)
+class TransferPlan:
+    """
+    One transfer plan over the horizon, as table rows.
+
+    `transfers[t]` lists the (out, in) row pairs made before horizon
+    gameweek t, `hits[t]` the points spent on extra transfers then and
+    `points[t]` the squad's projected points that gameweek (best XI, captain
+    and weighted bench). `total` is the points less all hits.
+    """
+    transfers: List[List[Tuple[int, int]]]
+    hits: List[int]
+    points: List[float]
+    free_transfers: List[int]
+    bank: List[int]
+    total: float
+
+
+def free_transfers_after(history_data: Dict) -> int:
+    """
+    Free transfers available for the next gameweek, replayed from a manager's
+    /history/ payload: one more each gameweek after the first, up to 5, less
+    the transfers made. Wildcard and Free Hit gameweeks keep them unspent.
+    """
+    entries = sorted(history_data.get("current", []), key=lambda entry: entry["event"])
+    chip_events = {chip["event"] for chip in history_data.get("chips", []) if chip.get("name") in ("wildcard", "freehit")}
+
+    free_transfers = 1 if entries else 0
+    for entry in entries[1:]:
+        if entry["event"] not in chip_events:
+            free_transfers = max(free_transfers - entry.get("event_transfers", 0), 0)
+        free_transfers = min(free_transfers + 1, MAX_FREE_TRANSFERS)
+
+    return free_transfers
+
+
+def plan_transfers(
+    squad: Sequence[int],
+    bank: int,
+    free_transfers: int,
+    values: np.ndarray,
+    positions: np.ndarray,
+    teams: np.ndarray,
+    prices: np.ndarray,
+    eligible: Optional[np.ndarray] = None,
+    max_transfers: int = 2,
+    beam_width: int = 64,
+    expand_width: int = 256,
+    candidate_depth: int = 3,
+    bench_weight: float = 0.1,
+    n_plans: int = 3,
+    workers: int = 1
+) -> List[TransferPlan]:
+    """
+    The best transfer plans for the next `len(values)` gameweeks, best first.
+
+    `values[t, row]` is a player's projected points in horizon gameweek t,
+    `bank` and `prices` are in tenths of a million and squad players are sold
+    at their current price. Each gameweek up to `max_transfers` transfers are
+    made; one free transfer is gained per gameweek (up to 5) and every
+    transfer beyond the free ones costs a 4-point hit.
+
+    The search is a DP over gameweeks whose states are (squad, bank, free
+    transfers): states with the same squad are pruned when another has at
+    least the points, bank and free transfers, and only the `beam_width` best
+    by points so far plus points from keeping the squad survive a gameweek.
+    Within a gameweek, transfers are added one at a time to the
+    `expand_width` best squads. Replacements come from each position's best
+    players per price (`candidate_depth` deep). With `workers` > 1, the first
+    gameweek's states are split across a process pool and each part is
+    planned on by a `beam_width // workers` beam, so the pool does the
+    serial search's work between its workers rather than once per worker.
+    """
+    planner = _Planner(
+        squad, values, positions, teams, prices, eligible, max_transfers, beam_width, expand_width,
+        candidate_depth, bench_weight
+    )
+    states = planner.start(bank, free_transfers)
+
+    if workers > 1 and len(values) > 1:
+        states = planner.step(states, 0)
+        order = np.argsort(-planner.heuristic(states, 1), kind="stable")
+        parts = [_take(states, order[i::workers]) for i in range(workers)]
+        parts = [part for part in parts if len(part["squad"])]
+        part_planner = copy.copy(planner)
+        part_planner.beam_width = max(beam_width // workers, 1)
+        results = list(process_pool(workers).map(_plan_from, [part_planner] * len(parts), parts))
+        states = _concat(results)
+    else:
+        states = _plan_from(planner, states, 0)
+
+    return planner.plans(states, n_plans)
+
+
+def _plan_from(planner: "_Planner", states: Dict[str, np.ndarray], start: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Run the remaining gameweeks from `start` (after the first when None)."""
+    start = 1 if start is None else start
+    for t in range(start, planner.horizon):
+        states = planner.step(states, t)
+    return states
+
+
+def _take(states: Dict[str, np.ndarray], index: np.ndarray) -> Dict[str, np.ndarray]:
+    return {key: array[index] for key, array in states.items()}
+
+
+def _concat(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+class _Planner:
+    """
+    Beam DP over transfer states. A batch of states is a dict of arrays: the
+    squad rows (n, 15) kept in position-block order, bank, free transfers,
+    points so far and the path taken (transfers, hits and points per gameweek).
+    """
+
+    def __init__(
+        self,
+        squad: Sequence[int],
+        values: np.ndarray,
+        positions: np.ndarray,
+        teams: np.ndarray,
+        prices: np.ndarray,
+        eligible: Optional[np.ndarray],
+        max_transfers: int,
+        beam_width: int,
+        expand_width: int,
+        candidate_depth: int,
+        bench_weight: float
+    ):
+        squad = np.asarray(squad, dtype=np.int32)
+        self.squad = squad[np.argsort(positions[squad], kind="stable")]
+        self.values = np.asarray(values, dtype=np.float64)
+        self.horizon = len(self.values)
+        self.teams = np.asarray(teams, dtype=np.int32)
+        self.prices = np.asarray(prices, dtype=np.int64)
+        self.n_teams = int(self.teams.max()) + 1
+        self.max_transfers = max_transfers
+        self.beam_width = beam_width
+        self.expand_width = expand_width
+        self.bench_weight = bench_weight
+
+        # Points from keeping a squad from each gameweek to the end are summed from this suffix
+        self.suffix = np.cumsum(self.values[::-1], axis=0)[::-1]
+
+        # Random 64-bit key per player; a squad's key is their sum, whatever the order (Zobrist hashing)
+        self.player_keys = np.random.default_rng(0).integers(
+            0, np.iinfo(np.uint64).max, size=len(positions), dtype=np.uint64, endpoint=True
+        )
+
+        eligible = np.ones(len(positions), dtype=bool) if eligible is None else eligible
+        total = self.values.sum(axis=0)
+        self.candidates = [
+            self._candidates(np.flatnonzero(eligible & (positions == position)), total, candidate_depth)
+            for position in SQUAD_QUOTAS
+        ]
+
+    def _candidates(self, rows: np.ndarray, total: np.ndarray, depth: int) -> np.ndarray:
+        """Rows with fewer than `depth` players who are both cheaper (or equal) and worth more over the horizon."""
+        rows = rows[np.lexsort((rows, -total[rows]))]
+        kept: List[int] = []
+        for row in rows.tolist():
+            if sum(self.prices[other] <= self.prices[row] for other in kept) < depth:
+                kept.append(row)
+        return np.array(kept, dtype=np.int32)
+
+    def start(self, bank: int, free_transfers: int) -> Dict[str, np.ndarray]:
+        return {
+            "squad": self.squad[None, :].copy(),
+            "bank": np.array([bank], dtype=np.int64),
+            "free_transfers": np.array([free_transfers], dtype=np.int64),
+            "score": np.zeros(1),
+            "moves": np.full((1, self.horizon, self.max_transfers, 2), -1, dtype=np.int32),
+            "hits": np.zeros((1, self.horizon), dtype=np.int64),
+            "points": np.zeros((1, self.horizon)),
+            "ft_path": np.zeros((1, self.horizon), dtype=np.int64),
+            "bank_path": np.zeros((1, self.horizon), dtype=np.int64),
+        }
+
+    def squad_keys(self, squads: np.ndarray) -> np.ndarray:
+        """Order-free 64-bit key of each squad."""
+        return self.player_keys[squads].sum(axis=1, dtype=np.uint64)
+
+    def squad_points(self, squads: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Projected points of squads in position-block order for each gameweek in
+        `values` (g, players): the best legal XI (1 GKP, at least 3 DEF, 2 MID and
+        1 FWD), the best starter again as captain and the weighted bench.
+        Returns (n, g).
+        """
+        v = np.moveaxis(values[:, squads], 0, 1)
+        blocks = [-np.sort(-v[..., lo:hi], axis=-1) for lo, hi in zip(_BLOCKS[:-1], _BLOCKS[1:])]
+        gk, defs, mids, fwds = blocks
+
+        fixed = gk[..., 0] + defs[..., :3].sum(axis=-1) + mids[..., :2].sum(axis=-1) + fwds[..., 0]
+        flex = -np.sort(-np.concatenate([defs[..., 3:], mids[..., 2:], fwds[..., 1:]], axis=-1), axis=-1)
+        xi = fixed + flex[..., :4].sum(axis=-1)
+        captain = np.maximum.reduce([gk[..., 0], defs[..., 0], mids[..., 0], fwds[..., 0]])
+        bench = v.sum(axis=-1) - xi
+
+        return xi + captain + self.bench_weight * bench
+
+    def heuristic(self, states: Dict[str, np.ndarray], t: int) -> np.ndarray:
+        """Points so far plus points from keeping each squad from gameweek t to the end."""
+        if t >= self.horizon:
+            return states["score"]
+        return states["score"] + self.squad_points(states["squad"], self.suffix[t:t + 1])[:, 0]
+
+    def step(self, states: Dict[str, np.ndarray], t: int) -> Dict[str, np.ndarray]:
+        """Make 0 to max_transfers transfers before gameweek t, score the gameweek and keep the beam."""
+        made = np.zeros(len(states["squad"]), dtype=np.int64)
+        levels = [(states, made)]
+        for level in range(self.max_transfers):
+            parents, parent_made = levels[-1]
+            if level:
+                # Only the most promising squads take another transfer
+                keep = np.argsort(-self.heuristic(parents, t), kind="stable")[:self.expand_width]
+                parents, parent_made = _take(parents, keep), parent_made[keep]
+            children, source = self._transfer(parents, t, level)
+            levels.append((children, parent_made[source] + 1))
+
+        states = _concat([level for level, _ in levels])
+        made = np.concatenate([made for _, made in levels])
+
+        free = states["free_transfers"]
+        hits = HIT_COST * np.maximum(made - free, 0)
+        points = self.squad_points(states["squad"], self.values[t:t + 1])[:, 0]
+
+        states["hits"][:, t] = hits
+        states["points"][:, t] = points
+        states["ft_path"][:, t] = free
+        states["bank_path"][:, t] = states["bank"]
+        states["score"] = states["score"] + points - hits
+        states["free_transfers"] = np.minimum(np.maximum(free - made, 0) + 1, MAX_FREE_TRANSFERS)
+
+        return self._prune(states, t + 1)
+
+    def _transfer(self, states: Dict[str, np.ndarray], t: int, level: int) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Every affordable single transfer within the club limit from each state. Returns children and parent index."""
+        squads, bank = states["squad"], states["bank"]
+        n = len(squads)
+        club_counts = np.zeros((n, self.n_teams), dtype=np.int64)
+        np.add.at(club_counts, (np.repeat(np.arange(n), SQUAD_SIZE), self.teams[squads].ravel()), 1)
+
+        parent_parts, slot_parts, in_parts = [], [], []
+        for block, candidates in enumerate(self.candidates):
+            lo, hi = _BLOCKS[block], _BLOCKS[block + 1]
+            outs = squads[:, lo:hi]
+            owned = (outs[:, :, None] == candidates[None, None, :]).any(axis=1)
+
+            in_team, out_team = self.teams[candidates][None, None, :], self.teams[outs][:, :, None]
+            room = club_counts[np.arange(n)[:, None, None], in_team] - (in_team == out_team) < MAX_PER_CLUB
+            affordable = self.prices[candidates][None, None, :] <= bank[:, None, None] + self.prices[outs][:, :, None]
+            valid = room & affordable & ~owned[:, None, :]
+
+            parent, slot, k = np.nonzero(valid)
+            parent_parts.append(parent)
+            slot_parts.append(slot + lo)
+            in_parts.append(candidates[k])
+
+        parent = np.concatenate(parent_parts)
+        slot = np.concatenate(slot_parts)
+        player_in = np.concatenate(in_parts)
+        player_out = squads[parent, slot]
+
+        children = _take(states, parent)
+        children["squad"] = children["squad"].copy()
+        children["squad"][np.arange(len(parent)), slot] = player_in
+        children["bank"] = children["bank"] + self.prices[player_out] - self.prices[player_in]
+        children["moves"] = children["moves"].copy()
+        children["moves"][:, t, level, 0] = player_out
+        children["moves"][:, t, level, 1] = player_in
+
+        # Children equal in squad, points, bank and free transfers (the same transfers in another order) keep
+        # one copy; other children with the same squad may not be dominated and are left to _prune
+        columns = (children["free_transfers"], children["bank"], children["score"], self.squad_keys(children["squad"]))
+        order = np.lexsort(columns)
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = np.any([column[order[1:]] != column[order[:-1]] for column in columns], axis=0)
+        first = np.sort(order[first])
+        return _take(children, first), parent[first]
+
+    def _prune(self, states: Dict[str, np.ndarray], t: int) -> Dict[str, np.ndarray]:
+        """Drop dominated states with the same squad, then keep the beam by heuristic."""
+        heuristic = self.heuristic(states, t)
+        order = np.argsort(-heuristic, kind="stable")
+        keys = self.squad_keys(states["squad"]).tolist()
+        scores, banks, frees = states["score"].tolist(), states["bank"].tolist(), states["free_transfers"].tolist()
+
+        kept: List[int] = []
+        frontier: Dict[int, List[Tuple[float, int, int]]] = {}
+        for i in order.tolist():
+            score, bank, free = scores[i], banks[i], frees[i]
+            same_squad = frontier.setdefault(keys[i], [])
+            if any(s >= score and b >= bank and f >= free for s, b, f in same_squad):
+                continue
+            same_squad.append((score, bank, free))
+            kept.append(i)
+            if len(kept) == self.beam_width:
+                break
+
+        return _take(states, np.array(kept, dtype=np.int64))
+
+    def plans(self, states: Dict[str, np.ndarray], n_plans: int) -> List[TransferPlan]:
+        """The best final states as plans, best first."""
+        order = np.argsort(-states["score"], kind="stable")[:n_plans]
+        return [
+            TransferPlan(
+                transfers=[
+                    [(int(out), int(player_in)) for out, player_in in states["moves"][i, t] if out >= 0]
+                    for t in range(self.horizon)
+                ],
+                hits=states["hits"][i].tolist(),
+                points=[round(float(p), 2) for p in states["points"][i]],
+                free_transfers=states["ft_path"][i].tolist(),
+                bank=states["bank_path"][i].tolist(),
+                total=round(float(states["score"][i]), 2),
+            )
+            for i in order.tolist()
+        ]
@@ -0,0 +1,289 @@
+import asyncio
+import httpx
+import pytest
+from typing import List, Union
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from fpl_gaffer.settings import settings
+from fpl_gaffer.modules.fpl import scheduler as scheduler_module
+from fpl_gaffer.modules.fpl.scheduler import RequestScheduler, parse_retry_after
+
+BASE_URL = "http://fpl.test/api"
+_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock that only moves when slept on or advanced, recording every sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+        await _sleep(0)
+
+
+class ScriptedUpstream:
+    """Mock upstream answering with scripted statuses or transport errors, the last one repeated."""
+
+    def __init__(self, clock: FakeClock, script: List[Union[int, httpx.Response, Exception]], latency: float = 0.1):
+        self.clock = clock
+        self.script = script
+        self.latency = latency
+        self.calls: List[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.url.path)
+        self.clock.now += self.latency
+        step = self.script[min(len(self.calls), len(self.script)) - 1]
+        if isinstance(step, Exception):
+            raise step
+        return step if isinstance(step, httpx.Response) else httpx.Response(step, json={})
+
+    def sender(self, endpoint: str = "/bootstrap-static/"):
+        session = httpx.AsyncClient(transport=httpx.MockTransport(self))
+        return lambda: session.get(f"{BASE_URL}{endpoint}")
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler_module, "time", clock)
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    # Backoff without jitter: always the full exponential delay
+    monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: high)
+
+    monkeypatch.setattr(settings, "FPL_API_MAX_RETRIES", 3)
+    monkeypatch.setattr(settings, "FPL_API_BACKOFF_BASE", 0.5)
+    monkeypatch.setattr(settings, "FPL_API_BACKOFF_MAX", 10.0)
+    monkeypatch.setattr(settings, "FPL_API_RATE_LIMIT", 100.0)
+    monkeypatch.setattr(settings, "FPL_API_RATE_BURST", 100)
+    monkeypatch.setattr(settings, "FPL_API_MAX_IN_FLIGHT", 10)
+    monkeypatch.setattr(settings, "FPL_API_MIN_IN_FLIGHT", 2)
+    monkeypatch.setattr(settings, "FPL_API_LATENCY_TARGET", 1.5)
+    monkeypatch.setattr(settings, "FPL_API_ENDPOINT_RATE_LIMITS", {})
+    return clock
+
+
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+def test_retries_server_errors_with_exponential_backoff(clock, status):
+    async def run():
+        upstream = ScriptedUpstream(clock, [status, status, 200])
+        scheduler = RequestScheduler()
+
+        response = await scheduler.run("/bootstrap-static/", upstream.sender())
+
+        assert response.status_code == 200
+        assert len(upstream.calls) == 3
+        assert clock.sleeps == [0.5, 1.0]
+        assert scheduler.retries == 2
+
+    asyncio.run(run())
+
+
+def test_returns_last_error_after_max_retries(clock):
+    async def run():
+        upstream = ScriptedUpstream(clock, [503])
+        scheduler = RequestScheduler()
+
+        response = await scheduler.run("/bootstrap-static/", upstream.sender())
+
+        assert response.status_code == 503
+        assert len(upstream.calls) == settings.FPL_API_MAX_RETRIES + 1
+        assert clock.sleeps == [0.5, 1.0, 2.0]
+
+    asyncio.run(run())
+
+
+def test_backoff_is_capped(clock, monkeypatch):
+    monkeypatch.setattr(settings, "FPL_API_MAX_RETRIES", 6)
+
+    async def run():
+        upstream = ScriptedUpstream(clock, [500])
+        await RequestScheduler().run("/bootstrap-static/", upstream.sender())
+
+        assert clock.sleeps == [0.5, 1.0, 2.0, 4.0, 8.0, 10.0]
+
+    asyncio.run(run())
+
+
+def test_client_errors_are_not_retried(clock):
+    async def run():
+        upstream = ScriptedUpstream(clock, [404])
+        response = await RequestScheduler().run("/entry/1/history/", upstream.sender("/entry/1/history/"))
+
+        assert response.status_code == 404
+        assert len(upstream.calls) == 1
+        assert clock.sleeps == []
+
+    asyncio.run(run())
+
+
+def test_transport_errors_are_retried_then_raised(clock):
+    async def run():
+        upstream = ScriptedUpstream(clock, [httpx.ConnectError("connection refused")])
+        scheduler = RequestScheduler()
+
+        with pytest.raises(httpx.ConnectError):
+            await scheduler.run("/bootstrap-static/", upstream.sender())
+
+        assert len(upstream.calls) == settings.FPL_API_MAX_RETRIES + 1
+        assert clock.sleeps == [0.5, 1.0, 2.0]
+        assert scheduler.limiter.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_transport_error_then_success(clock):
+    async def run():
+        upstream = ScriptedUpstream(clock, [httpx.ReadTimeout("timed out"), 200])
+        response = await RequestScheduler().run("/bootstrap-static/", upstream.sender())
+
+        assert response.status_code == 200
+        assert clock.sleeps == [0.5]
+
+    asyncio.run(run())
+
+
+def test_retry_after_is_honoured(clock):
+    async def run():
+        upstream = ScriptedUpstream(clock, [httpx.Response(429, headers={"Retry-After": "3"}), 200])
+        scheduler = RequestScheduler()
+
+        response = await scheduler.run("/bootstrap-static/", upstream.sender())
+
+        assert response.status_code == 200
+        assert clock.sleeps == [3.0]
+        assert scheduler.throttled == 1
+
+    asyncio.run(run())
+
+
+def test_retry_after_beyond_backoff_max_is_surfaced(clock):
+    async def run():
+        upstream = ScriptedUpstream(clock, [httpx.Response(429, headers={"Retry-After": "60"}), 200])
+        response = await RequestScheduler().run("/bootstrap-static/", upstream.sender())
+
+        assert response.status_code == 429
+        assert len(upstream.calls) == 1
+        assert clock.sleeps == []
+
+    asyncio.run(run())
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    assert parse_retry_after(format_datetime(retry_at - timedelta(hours=1), usegmt=True)) == 0.0
+
+
+def test_concurrency_limit_cut_on_throttling_and_slow_responses_then_recovers(clock, monkeypatch):
+    monkeypatch.setattr(settings, "FPL_API_MAX_RETRIES", 0)
+
+    async def run():
+        scheduler = RequestScheduler()
+        limiter = scheduler.limiter
+        assert limiter.limit == 10
+
+        # Multiplicative decrease on a 429...
+        await scheduler.run("/bootstrap-static/", ScriptedUpstream(clock, [429]).sender())
+        assert limiter.limit == pytest.approx(7.0)
+
+        # ...and on a response slower than the latency target, down to the minimum
+        slow = ScriptedUpstream(clock, [200], latency=2.0)
+        await scheduler.run("/bootstrap-static/", slow.sender())
+        assert limiter.limit == pytest.approx(4.9)
+        for _ in range(5):
+            await scheduler.run("/bootstrap-static/", slow.sender())
+        assert limiter.limit == 2
+
+        # Additive increase of about one slot per window of fast responses, up to the maximum
+        fast = ScriptedUpstream(clock, [200], latency=0.1)
+        for _ in range(2):
+            await scheduler.run("/bootstrap-static/", fast.sender())
+        assert limiter.limit == pytest.approx(2 + 1 / 2 + 1 / 2.5)
+
+        for _ in range(100):
+            await scheduler.run("/bootstrap-static/", fast.sender())
+        assert limiter.limit == 10
+        assert limiter.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_limiter_caps_requests_in_flight(clock, monkeypatch):
+    monkeypatch.setattr(settings, "FPL_API_MAX_IN_FLIGHT", 3)
+
+    async def run():
+        release = asyncio.Event()
+        in_flight, peak = 0, 0
+
+        async def send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return httpx.Response(200)
+
+        scheduler = RequestScheduler()
+        tasks = [asyncio.ensure_future(scheduler.run("/bootstrap-static/", send)) for _ in range(8)]
+        for _ in range(5):
+            await _sleep(0)
+        assert scheduler.limiter.in_flight == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == 3
+
+    asyncio.run(run())
+
+
+def test_endpoint_bucket_narrows_its_endpoint_only(clock, monkeypatch):
+    monkeypatch.setattr(settings, "FPL_API_ENDPOINT_RATE_LIMITS", {"/entry/{id}/event/{id}/picks/": 2.0})
+
+    async def run():
+        scheduler = RequestScheduler()
+        upstream = ScriptedUpstream(clock, [200], latency=0.0)
+
+        # A burst of 2 picks requests, then one every 1/rate seconds
+        started = clock.now
+        for manager_id in range(1, 6):
+            endpoint = f"/entry/{manager_id}/event/3/picks/"
+            await scheduler.run(endpoint, upstream.sender(endpoint))
+        assert clock.now - started == pytest.approx(1.5)
+
+        # Other endpoints only take from the global bucket, which has room
+        started = clock.now
+        for _ in range(5):
+            await scheduler.run("/bootstrap-static/", upstream.sender())
+        assert clock.now == started
+
+    asyncio.run(run())
+
+
+def test_global_bucket_limits_every_endpoint(clock, monkeypatch):
+    monkeypatch.setattr(settings, "FPL_API_RATE_LIMIT", 4.0)
+    monkeypatch.setattr(settings, "FPL_API_RATE_BURST", 2)
+
+    async def run():
+        scheduler = RequestScheduler()
+        upstream = ScriptedUpstream(clock, [200], latency=0.0)
+
+        started = clock.now
+        for endpoint in ("/bootstrap-static/", "/fixtures/", "/entry/1/history/", "/event/3/live/"):
+            await scheduler.run(endpoint, upstream.sender(endpoint))
+        assert clock.now - started == pytest.approx(0.5)
+
+    asyncio.run(run())
@@ -0,0 +1,148 @@
+import asyncio
+import httpx
+import pytest
+from typing import Awaitable, Callable, Dict, List
+from fpl_gaffer.settings import settings
+from fpl_gaffer.core.exceptions import FPLAPIError
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient
+
+BASE_URL = "http://fpl.test/api"
+WAITERS = 10
+
+
+class GatedUpstream:
+    """Mock upstream that holds every request until released, counting requests per path and query."""
+
+    def __init__(self, respond: Callable[[httpx.Request], httpx.Response]):
+        self.respond = respond
+        self.calls: Dict[str, int] = {}
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        key = f"{request.url.path}?{request.url.query.decode()}"
+        self.calls[key] = self.calls.get(key, 0) + 1
+        self.started.set()
+        await self.release.wait()
+        return self.respond(request)
+
+    def client(self) -> FPLOfficialAPIClient:
+        session = httpx.AsyncClient(transport=httpx.MockTransport(self))
+        return FPLOfficialAPIClient(session=session, base_url=BASE_URL)
+
+
+def json_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path, "query": request.url.query.decode()})
+
+
+async def settle():
+    """Let every started waiter reach the shared flight."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def fan_in(upstream: GatedUpstream, call: Callable[[], Awaitable], n: int = WAITERS) -> List:
+    """Start n concurrent calls, release the upstream once they are all waiting, and collect the outcomes."""
+    tasks = [asyncio.ensure_future(call()) for _ in range(n)]
+    await upstream.started.wait()
+    await settle()
+    upstream.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.fixture(autouse=True)
+def no_retries(monkeypatch):
+    # Failures surface on the first attempt instead of after backoff
+    monkeypatch.setattr(settings, "FPL_API_MAX_RETRIES", 0)
+
+
+def test_concurrent_get_hits_upstream_once():
+    async def run():
+        upstream = GatedUpstream(json_response)
+        client = upstream.client()
+
+        results = await fan_in(upstream, lambda: client._get("/fixtures/", params={"event": 3}))
+
+        assert upstream.calls == {"/api/fixtures/?event=3": 1}
+        assert all(result is results[0] for result in results)
+        assert results[0] == {"path": "/api/fixtures/", "query": "event=3"}
+        assert client.pool_stats()["coalesced_total"] == WAITERS - 1
+        assert not client._pending
+
+    asyncio.run(run())
+
+
+def test_concurrent_get_fixtures_hits_upstream_once():
+    async def run():
+        upstream = GatedUpstream(json_response)
+        client = upstream.client()
+
+        results = await fan_in(upstream, client.get_fixtures)
+
+        assert upstream.calls == {"/api/fixtures/?": 1}
+        assert all(result is results[0] for result in results)
+
+    asyncio.run(run())
+
+
+def test_different_params_are_separate_flights():
+    async def run():
+        upstream = GatedUpstream(json_response)
+        client = upstream.client()
+
+        tasks = [
+            asyncio.ensure_future(client._get("/fixtures/", params={"event": gw}))
+            for gw in (1, 2, 1, 2)
+        ]
+        await upstream.started.wait()
+        await settle()
+        upstream.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert upstream.calls == {"/api/fixtures/?event=1": 1, "/api/fixtures/?event=2": 1}
+        assert results[0] is results[2] and results[1] is results[3]
+        assert results[0] != results[1]
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("respond", [
+    lambda request: httpx.Response(500, json={"detail": "error"}),
+    lambda request: (_ for _ in ()).throw(httpx.ConnectError("connection refused", request=request)),
+], ids=["status-500", "transport-error"])
+def test_error_reaches_every_waiter(respond):
+    async def run():
+        upstream = GatedUpstream(respond)
+        client = upstream.client()
+
+        results = await fan_in(upstream, lambda: client._get("/fixtures/", params={"event": 3}))
+
+        assert sum(upstream.calls.values()) == 1
+        assert all(isinstance(result, FPLAPIError) for result in results)
+        assert all(result is results[0] for result in results)
+        assert not client._pending
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_flight():
+    async def run():
+        upstream = GatedUpstream(json_response)
+        client = upstream.client()
+
+        tasks = [asyncio.ensure_future(client._get("/fixtures/", params={"event": 3})) for _ in range(3)]
+        await upstream.started.wait()
+        await settle()
+
+        # Cancel the caller that started the flight; the others still get the payload
+        tasks[0].cancel()
+        await settle()
+        upstream.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1] == {"path": "/api/fixtures/", "query": "event=3"}
+        assert results[2] is results[1]
+        assert upstream.calls == {"/api/fixtures/?event=3": 1}
+
+    asyncio.run(run())
@@ -0,0 +1,222 @@
+import asyncio
+import httpx
+import pytest
+from pathlib import Path
+from typing import Dict, Optional
+from fpl_gaffer.settings import Settings, settings
+from fpl_gaffer.modules.fpl import fpl_api, store as store_module
+from fpl_gaffer.modules.fpl.fpl_api import FPLOfficialAPIClient, get_fpl_api_client
+from fpl_gaffer.modules.fpl.store import ResponseStore
+
+BASE_URL = "http://fpl.test/api"
+TTL = 600.0
+
+# Gameweek 1 is finished and checked, gameweek 2 is still being played
+BOOTSTRAP = {
+    "events": [
+        {"id": 1, "finished": True, "data_checked": True},
+        {"id": 2, "finished": False, "data_checked": False},
+    ],
+    "elements": [],
+    "teams": [],
+}
+
+
+class WallClock:
+    """Stand-in for the time module, moved by hand."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+class CountingUpstream:
+    """Mock upstream serving bootstrap-static and per-gameweek fixtures, counting requests per path and query."""
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        key = f"{request.url.path}?{request.url.query.decode()}"
+        self.calls[key] = self.calls.get(key, 0) + 1
+        if request.url.path.endswith("/bootstrap-static/"):
+            return httpx.Response(200, json=BOOTSTRAP)
+        return httpx.Response(200, json=[{"event": int(request.url.params["event"]), "served": self.calls[key]}])
+
+    def client(self, store: Optional[ResponseStore]) -> FPLOfficialAPIClient:
+        session = httpx.AsyncClient(transport=httpx.MockTransport(self))
+        return FPLOfficialAPIClient(session=session, store=store, base_url=BASE_URL)
+
+
+def fixtures_calls(upstream: CountingUpstream, gameweek: int) -> int:
+    return upstream.calls.get(f"/api/fixtures/?event={gameweek}", 0)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> WallClock:
+    clock = WallClock()
+    monkeypatch.setattr(store_module, "time", clock)
+    monkeypatch.setattr(settings, "FPL_RESPONSE_STORE_TTL", TTL)
+    monkeypatch.setattr(settings, "FPL_API_MAX_RETRIES", 0)
+    return clock
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    return str(tmp_path / "store" / "fpl_responses.db")
+
+
+def test_store_round_trip_and_stats(clock, db_path):
+    async def run():
+        store = ResponseStore(db_path)
+        key = ResponseStore.make_key("/fixtures/", {"event": 1})
+        assert key == "/fixtures/?event=1"
+
+        assert await store.get(key) is None
+        await store.put(key, b"[]")
+        await store.put("/entry/1/history/", b"{}", ttl=TTL)
+        assert await store.get(key) == b"[]"
+
+        assert store.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "writes": 2,
+            "entries": 2,
+            "permanent_entries": 1,
+            "bytes_stored": 4,
+        }
+        store.close()
+
+    asyncio.run(run())
+
+
+def test_entries_without_ttl_never_expire(clock, db_path):
+    async def run():
+        store = ResponseStore(db_path)
+        await store.put("/event/1/live/", b"{}")
+
+        clock.now += 365 * 24 * 3600
+        assert await store.get("/event/1/live/") == b"{}"
+        assert store.purge_expired() == 0
+        store.close()
+
+        # Still there after reopening the database
+        reopened = ResponseStore(db_path)
+        assert await reopened.get("/event/1/live/") == b"{}"
+        reopened.close()
+
+    asyncio.run(run())
+
+
+def test_entries_with_ttl_expire(clock, db_path):
+    async def run():
+        store = ResponseStore(db_path)
+        await store.put("/entry/1/history/", b"{}", ttl=TTL)
+        await store.put("/entry/2/history/", b"{}", ttl=TTL)
+
+        clock.now += TTL - 1
+        assert await store.get("/entry/1/history/") == b"{}"
+
+        # Expired entries are dropped when read...
+        clock.now += 1
+        assert await store.get("/entry/1/history/") is None
+        assert store.stats()["entries"] == 1
+
+        # ...or when purged
+        assert store.purge_expired() == 1
+        assert store.stats()["entries"] == 0
+        store.close()
+
+    asyncio.run(run())
+
+
+def test_put_replaces_entry_and_its_expiry(clock, db_path):
+    async def run():
+        store = ResponseStore(db_path)
+        await store.put("/fixtures/?event=1", b"old", ttl=TTL)
+        await store.put("/fixtures/?event=1", b"new")
+
+        clock.now += 2 * TTL
+        assert await store.get("/fixtures/?event=1") == b"new"
+        assert store.stats()["permanent_entries"] == 1
+        store.close()
+
+    asyncio.run(run())
+
+
+def test_client_stores_finished_gameweeks_permanently(clock, db_path):
+    async def run():
+        upstream = CountingUpstream()
+
+        async with upstream.client(ResponseStore(db_path)) as client:
+            first = await client.get_fixtures(1)
+            assert client.store.stats()["permanent_entries"] == 1
+
+        # A restarted client reads the finished gameweek from disk, however old it is
+        clock.now += 30 * 24 * 3600
+        async with upstream.client(ResponseStore(db_path)) as client:
+            assert await client.get_fixtures(1) == first
+            assert client.store.hits == 1
+
+        assert fixtures_calls(upstream, 1) == 1
+
+    asyncio.run(run())
+
+
+def test_client_refetches_unfinished_gameweeks_after_ttl(clock, db_path):
+    async def run():
+        upstream = CountingUpstream()
+
+        async with upstream.client(ResponseStore(db_path)) as client:
+            first = await client.get_fixtures(2)
+            assert client.store.stats()["permanent_entries"] == 0
+
+        clock.now += TTL - 1
+        async with upstream.client(ResponseStore(db_path)) as client:
+            assert await client.get_fixtures(2) == first
+        assert fixtures_calls(upstream, 2) == 1
+
+        clock.now += 1
+        async with upstream.client(ResponseStore(db_path)) as client:
+            refreshed = await client.get_fixtures(2)
+        assert refreshed != first
+        assert fixtures_calls(upstream, 2) == 2
+
+    asyncio.run(run())
+
+
+def test_client_without_store_always_goes_upstream(clock):
+    async def run():
+        upstream = CountingUpstream()
+
+        for _ in range(2):
+            async with upstream.client(None) as client:
+                await client.get_fixtures(1)
+
+        assert fixtures_calls(upstream, 1) == 2
+
+    asyncio.run(run())
+
+
+def test_store_enabled_setting_is_read_from_environment(monkeypatch):
+    monkeypatch.setenv("FPL_RESPONSE_STORE_ENABLED", "false")
+    assert Settings().FPL_RESPONSE_STORE_ENABLED is False
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_shared_client_respects_store_setting(monkeypatch, db_path, enabled):
+    monkeypatch.setattr(settings, "FPL_RESPONSE_STORE_ENABLED", enabled)
+    monkeypatch.setattr(settings, "FPL_RESPONSE_STORE_PATH", db_path)
+    monkeypatch.setattr(fpl_api, "_shared_client", None)
+
+    async def run():
+        client = get_fpl_api_client()
+        try:
+            assert (client.store is not None) is enabled
+            assert Path(db_path).exists() is enabled
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())